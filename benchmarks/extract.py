@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    extract.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+
+Throughput of the MGRS reference extractor in MB/s. Uses given corpus file
+or generates synthetic log lines with MGRS references in several forms.
+The file is scanned both as a stream and as a memory mapped buffer.
+
+    python benchmarks/extract.py --size 1024
+    python benchmarks/extract.py --file reports.log
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import os
+import mmap
+import random
+import argparse
+import tempfile
+import timeit
+
+import numpy as np
+
+from mgrspy import batch
+from mgrspy import extract
+
+
+def corpus(path, size):
+    """ Writes synthetic log of about size megabytes with MGRS references
+    in compact, separated and UPS forms
+    """
+    random.seed(0)
+    count = 10000
+    strings = batch.toMgrsBatch(np.random.uniform(-80, 84, count), np.random.uniform(-180, 180, count),
+                                np.random.randint(0, 6, count))[0]
+    lines = []
+    for s in strings:
+        s = s.strip()
+        if random.random() < 0.3:
+            s = '{} {} {}'.format(s[:3], s[3:5], ' '.join([s[5:5 + (len(s) - 5) // 2], s[5 + (len(s) - 5) // 2:]]))
+        lines.append('2026-10-19T12:00:00Z INFO unit {} reported position {} heading 270 speed 12 kn\n'.format(
+            random.randint(1, 999), s))
+        lines.append('2026-10-19T12:00:01Z DEBUG heartbeat ok, queue depth {} latency {} ms\n'.format(
+            random.randint(0, 100), random.randint(1, 50)))
+
+    block = ''.join(lines).encode('ascii')
+    with open(path, 'wb') as f:
+        for i in range(max(1, size * 1024 * 1024 // len(block))):
+            f.write(block)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MGRS reference extraction throughput')
+    parser.add_argument('--file', help='corpus file, synthetic corpus is generated if not given')
+    parser.add_argument('--size', type=int, default=256, help='size of the synthetic corpus in megabytes')
+    parser.add_argument('--chunk-size', type=int, default=extract.CHUNK_SIZE)
+    args = parser.parse_args()
+
+    path = args.file
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix='.log')
+        os.close(handle)
+        corpus(path, args.size)
+
+    try:
+        megabytes = os.path.getsize(path) / 1024.0 / 1024.0
+
+        start = timeit.default_timer()
+        with open(path, 'rb') as f:
+            count = sum(len(starts) for starts, ends, strings in extract.iterMgrs(f, chunkSize=args.chunk_size))
+        elapsed = timeit.default_timer() - start
+        print('stream  {:10.1f} MB {:10d} references {:8.1f} MB/s'.format(megabytes, count, megabytes / elapsed))
+
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            start = timeit.default_timer()
+            count = len(extract.extractMgrs(buffer)[0])
+            elapsed = timeit.default_timer() - start
+            buffer.close()
+        print('mmap    {:10.1f} MB {:10d} references {:8.1f} MB/s'.format(megabytes, count, megabytes / elapsed))
+    finally:
+        if args.file is None:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
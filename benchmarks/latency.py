@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    latency.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+
+Single point latency microbenchmark. Measures per-call latency of the
+checked and trusted conversions on random points and fails (exit status 1)
+when the median latency of the trusted conversions exceeds the budget.
+
+    python benchmarks/latency.py --calls 100000 --budget 10
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import sys
+import random
+import argparse
+import timeit
+
+from mgrspy import mgrs
+
+
+def measure(func, args, repeat):
+    """ Calls function once per argument tuple, repeat times in a row, and
+    returns sorted per-call latencies in microseconds
+    """
+    timer = timeit.default_timer
+    latencies = []
+    for a in args:
+        start = timer()
+        for i in range(repeat):
+            func(*a)
+        latencies.append((timer() - start) / repeat * 1e6)
+
+    latencies.sort()
+    return latencies
+
+
+def report(name, latencies):
+    print('{:16} p50 {:8.2f} us  p90 {:8.2f} us  p99 {:8.2f} us'.format(
+        name, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.9)],
+        latencies[int(len(latencies) * 0.99)]))
+    return latencies[len(latencies) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Single point MGRS conversion latency')
+    parser.add_argument('--calls', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=10, help='calls per timed sample')
+    parser.add_argument('--budget', type=float, default=10.0, help='median latency budget in microseconds')
+    parser.add_argument('--precision', type=int, default=5)
+    parser.add_argument('--checked', action='store_true', help='also measure toMgrs() and toWgs()')
+    args = parser.parse_args()
+
+    random.seed(0)
+    samples = max(1, args.calls // args.repeat)
+    points = [(random.uniform(-80, 84), random.uniform(-180, 180), args.precision) for i in range(samples)]
+    strings = [(mgrs.toMgrsTrusted(*p),) for p in points]
+
+    # warm up transformation caches
+    for p in points:
+        mgrs.toMgrsTrusted(*p)
+    for s in strings:
+        mgrs.toWgsTrusted(*s)
+
+    if args.checked:
+        report('toMgrs', measure(mgrs.toMgrs, points, args.repeat))
+        report('toWgs', measure(mgrs.toWgs, strings, args.repeat))
+
+    medians = [report('toMgrsTrusted', measure(mgrs.toMgrsTrusted, points, args.repeat)),
+               report('toWgsTrusted', measure(mgrs.toWgsTrusted, strings, args.repeat))]
+
+    if max(medians) > args.budget:
+        print('Median latency exceeds budget of {:.2f} us'.format(args.budget))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
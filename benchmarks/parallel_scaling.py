@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    parallel_scaling.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+Scaling of the process pool batch conversion. Converts the same random
+coordinates with toMgrsBatch() in this process and with BatchPool of
+increasing size, reporting throughput and speedup over a single process.
+
+    python benchmarks/parallel_scaling.py --count 1000000 --processes 1 2 4 8
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import argparse
+import timeit
+
+import numpy as np
+
+from mgrspy import batch
+from mgrspy import parallel
+
+
+def measure(func, repeat):
+    """ Returns best time of several calls
+    """
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Process pool batch conversion scaling')
+    parser.add_argument('--count', type=int, default=1000000, help='number of coordinates per batch')
+    parser.add_argument('--precision', type=int, default=5)
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    np.random.seed(0)
+    latitudes = np.random.uniform(-80, 84, args.count)
+    longitudes = np.random.uniform(-180, 180, args.count)
+    strings = batch.toMgrsBatch(latitudes, longitudes, args.precision)[0]
+
+    single = measure(lambda: batch.toMgrsBatch(latitudes, longitudes, args.precision), args.repeat)
+    print('toMgrs  serial   {:10.0f} points/s'.format(args.count / single))
+    singleWgs = measure(lambda: batch.toWgsBatch(strings), args.repeat)
+    print('toWgs   serial   {:10.0f} points/s'.format(args.count / singleWgs))
+
+    for processes in args.processes:
+        with parallel.BatchPool(processes) as pool:
+            # first call starts workers and allocates the shared memory block
+            pool.toMgrs(latitudes[:processes], longitudes[:processes], args.precision)
+            elapsed = measure(lambda: pool.toMgrs(latitudes, longitudes, args.precision), args.repeat)
+            print('toMgrs  {:2d} procs {:10.0f} points/s {:6.2f}x'.format(
+                processes, args.count / elapsed, single / elapsed))
+            elapsed = measure(lambda: pool.toWgs(strings), args.repeat)
+            print('toWgs   {:2d} procs {:10.0f} points/s {:6.2f}x'.format(
+                processes, args.count / elapsed, singleWgs / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    service_load.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+Load test of the HTTP conversion service on localhost. Starts the service
+on a free port and runs keep-alive clients against single point and batch
+endpoints, reporting throughput and latency percentiles.
+
+    python benchmarks/service_load.py --clients 16 --requests 2000
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import json
+import random
+import argparse
+import threading
+import timeit
+from http.client import HTTPConnection
+
+from mgrspy import service
+
+
+def client(address, path, count, batchSize, latencies):
+    connection = HTTPConnection(*address)
+    for i in range(count):
+        if batchSize:
+            data = {'latitudes': [random.uniform(-80, 84) for j in range(batchSize)],
+                    'longitudes': [random.uniform(-180, 180) for j in range(batchSize)]}
+        else:
+            data = {'latitude': random.uniform(-80, 84), 'longitude': random.uniform(-180, 180)}
+
+        start = timeit.default_timer()
+        connection.request('POST', path, json.dumps(data), {'Content-Type': 'application/json'})
+        connection.getresponse().read()
+        latencies.append(timeit.default_timer() - start)
+    connection.close()
+
+
+def run(address, path, clients, requests, batchSize):
+    latencies = []
+    threads = [threading.Thread(target=client, args=(address, path, requests // clients, batchSize, latencies))
+               for i in range(clients)]
+    start = timeit.default_timer()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = timeit.default_timer() - start
+
+    latencies.sort()
+    rows = len(latencies) * (batchSize or 1)
+    print('{:12} {:8d} requests {:10.0f} req/s {:10.0f} rows/s  p50 {:7.2f} ms  p99 {:7.2f} ms'.format(
+        path, len(latencies), len(latencies) / elapsed, rows / elapsed,
+        latencies[len(latencies) // 2] * 1000, latencies[int(len(latencies) * 0.99)] * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test of the MGRS conversion service')
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    with service.MgrsService(port=0, maxPending=args.clients * 2) as s:
+        run(s.address, '/mgrs', args.clients, args.requests, 0)
+        run(s.address, '/mgrs/batch', args.clients, args.requests // 10, args.batch_size)
+        print(json.dumps(s.metrics(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    archive.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import mmap
+import struct
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import mgrsarray
+from mgrspy.mgrsarray import MgrsArray
+
+
+MAGIC = b'MGRSARC1'
+
+# block index entries: packed key of the 100 km square and precision (key
+# bits above the precision field), block offset, number of records, byte
+# widths of easting and northing deltas, first easting and northing and
+# flag of the stored record ids
+INDEX_DTYPE = np.dtype([('square', '<i8'), ('offset', '<u8'), ('count', '<u4'), ('eastingWidth', 'u1'),
+                        ('northingWidth', 'u1'), ('easting', '<u4'), ('northing', '<u4'), ('ids', 'u1')])
+
+# trailer: index offset and number of index entries followed by MAGIC
+_TRAILER = struct.Struct('<QQ')
+
+_WIDTHS = {1: np.dtype('i1'), 2: np.dtype('<i2'), 4: np.dtype('<i4')}
+_ID_DTYPE = np.dtype('<i8')
+_SQUARE_SHIFT = mgrsarray._PRECISION_SHIFT
+_FIELD_MASK = mgrsarray._NORTHING_MASK
+
+
+class ArchiveWriter(object):
+    """ Writes MGRS cells to a compact binary file. Each written chunk is
+    grouped by 100 km square and precision, sorted and stored as blocks of
+    delta-encoded easting and northing columns (and optional record ids).
+    Index of all blocks is written at the end of the file by close().
+    """
+
+    def __init__(self, path):
+        """ Creates archive file
+
+        @param path - path to the archive file
+        """
+        self.path = path
+        self.count = 0
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC)
+        self._index = []
+        self._ids = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def write(self, cells, ids=None):
+        """ Appends chunk of MGRS cells
+
+        @param cells - MgrsArray or array-like of MGRS coordinate strings
+        @param ids - optional array-like of integer record ids stored with
+        the cells, either always or never passed
+        """
+        if not isinstance(cells, MgrsArray):
+            cells = MgrsArray.fromStrings(np.atleast_1d(np.asarray(cells)).ravel())[0]
+
+        if not cells.valid.all():
+            raise mgrs.MgrsException('An MGRS string error: string too long, too short, or badly formed')
+
+        if ids is not None:
+            ids = np.asarray(ids, dtype=_ID_DTYPE).ravel()
+            if len(ids) != len(cells):
+                raise ValueError('Number of ids must match number of cells')
+
+        if self._ids is None:
+            self._ids = ids is not None
+        elif self._ids != (ids is not None):
+            raise ValueError('Record ids must be passed for all chunks or for none')
+
+        keys = cells.keys()
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        squares = keys >> _SQUARE_SHIFT
+        starts = np.flatnonzero(np.concatenate(([True], squares[1:] != squares[:-1])))
+        ends = np.append(starts[1:], len(keys))
+        for start, end in zip(starts, ends):
+            block = keys[start:end]
+            self._writeBlock(squares[start], (block >> mgrsarray._EASTING_SHIFT) & _FIELD_MASK,
+                             block & _FIELD_MASK, None if ids is None else ids[order[start:end]])
+
+        self.count += len(keys)
+
+    def close(self):
+        """ Writes block index and closes the file
+        """
+        if self._file.closed:
+            return
+
+        index = np.array(self._index, dtype=INDEX_DTYPE)
+        offset = self._file.tell()
+        self._file.write(index.tobytes())
+        self._file.write(_TRAILER.pack(offset, len(index)))
+        self._file.write(MAGIC)
+        self._file.close()
+
+    def _writeBlock(self, square, easting, northing, ids):
+        """ Writes single block of records from the same square
+
+        @param square - packed key of the square and precision
+        @param easting - sorted array of eastings as written in MGRS strings
+        @param northing - array of northings as written in MGRS strings
+        @param ids - array of record ids or None
+        """
+        eastingDeltas = np.diff(easting, prepend=easting[0])
+        northingDeltas = np.diff(northing, prepend=northing[0])
+        eastingWidth = _width(eastingDeltas)
+        northingWidth = _width(northingDeltas)
+
+        self._index.append((square, self._file.tell(), len(easting), eastingWidth, northingWidth,
+                            easting[0], northing[0], ids is not None))
+        self._file.write(eastingDeltas.astype(_WIDTHS[eastingWidth]).tobytes())
+        self._file.write(northingDeltas.astype(_WIDTHS[northingWidth]).tobytes())
+        if ids is not None:
+            self._file.write(ids.tobytes())
+
+
+class ArchiveReader(object):
+    """ Reads MGRS archives created by ArchiveWriter. File is memory mapped
+    and only the index is read on open, blocks are decoded on request, so
+    reading a single zone or square does not touch the rest of the file.
+    """
+
+    def __init__(self, path):
+        """ Opens archive file
+
+        @param path - path to the archive file
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise mgrs.MgrsException('Not an MGRS archive: {}'.format(path))
+
+        size = len(self._map)
+        tail = len(MAGIC) + _TRAILER.size
+        if (size < len(MAGIC) + tail or self._map[:len(MAGIC)] != MAGIC or
+                self._map[size - len(MAGIC):] != MAGIC):
+            self.close()
+            raise mgrs.MgrsException('Not an MGRS archive: {}'.format(path))
+
+        offset, count = _TRAILER.unpack(self._map[size - tail:size - len(MAGIC)])
+        if offset < len(MAGIC) or offset + count * INDEX_DTYPE.itemsize > size - tail:
+            self.close()
+            raise mgrs.MgrsException('Not an MGRS archive: {}'.format(path))
+        self.index = np.frombuffer(self._map, dtype=INDEX_DTYPE, count=count, offset=offset).copy()
+        self._labels = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def __len__(self):
+        return int(self.index['count'].sum())
+
+    def close(self):
+        """ Closes archive file
+        """
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def labels(self):
+        """ Returns labels of the blocks: 100 km square letters preceded by
+        zone number for UTM, e.g. '18SUJ' or 'YYL'
+
+        @returns - array of labels, one for each block in the index
+        """
+        if self._labels is None and len(self.index) == 0:
+            self._labels = np.zeros(0, dtype='U5')
+        elif self._labels is None:
+            cells = MgrsArray.fromKeys(self.index['square'] << _SQUARE_SHIFT)
+            self._labels = np.char.strip(np.char.ljust(cells.toStrings(), 5).astype('U5'))
+        return self._labels
+
+    def squares(self):
+        """ Returns labels of the squares stored in the archive
+
+        @returns - sorted list of unique labels
+        """
+        return sorted(set(self.labels().tolist()))
+
+    def blocks(self, prefix=''):
+        """ Finds blocks with labels starting with the prefix
+
+        @param prefix - label prefix, e.g. '18', '18S', '18SUJ' or 'Y'
+        @returns - array of block numbers
+        """
+        prefix = prefix.strip().upper()
+        return np.flatnonzero(np.char.startswith(self.labels(), prefix))
+
+    def read(self, prefix=''):
+        """ Decodes records of the blocks with labels starting with the
+        prefix, see blocks()
+
+        @param prefix - label prefix, empty string for the whole archive
+        @returns - tuple containing MgrsArray and array of record ids (None
+        if archive has no ids)
+        """
+        decoded = [self.readBlock(block) for block in self.blocks(prefix)]
+        cells = MgrsArray.concatenate([d[0] for d in decoded] + [MgrsArray.fromKeys([])])
+        if not (len(self.index) and self.index['ids'][0]):
+            return cells, None
+        return cells, np.concatenate([d[1] for d in decoded] + [np.zeros(0, dtype=_ID_DTYPE)])
+
+    def iterBlocks(self, prefix=''):
+        """ Iterates over decoded blocks with labels starting with the prefix
+
+        @param prefix - label prefix, empty string for the whole archive
+        @returns - iterator over (label, MgrsArray, ids) tuples
+        """
+        labels = self.labels()
+        for block in self.blocks(prefix):
+            cells, ids = self.readBlock(block)
+            yield str(labels[block]), cells, ids
+
+    def readBlock(self, block):
+        """ Decodes single block
+
+        @param block - block number
+        @returns - tuple containing MgrsArray and array of record ids (None
+        if archive has no ids)
+        """
+        entry = self.index[block]
+        count = int(entry['count'])
+        offset = int(entry['offset'])
+        eastingType = _WIDTHS[int(entry['eastingWidth'])]
+        northingType = _WIDTHS[int(entry['northingWidth'])]
+
+        easting = np.frombuffer(self._map, dtype=eastingType, count=count, offset=offset)
+        offset += count * eastingType.itemsize
+        northing = np.frombuffer(self._map, dtype=northingType, count=count, offset=offset)
+        offset += count * northingType.itemsize
+
+        easting = int(entry['easting']) + np.cumsum(easting, dtype=np.int64)
+        northing = int(entry['northing']) + np.cumsum(northing, dtype=np.int64)
+        keys = (np.int64(entry['square']) << _SQUARE_SHIFT) | (easting << mgrsarray._EASTING_SHIFT) | northing
+
+        ids = None
+        if entry['ids']:
+            ids = np.frombuffer(self._map, dtype=_ID_DTYPE, count=count, offset=offset).copy()
+        return MgrsArray.fromKeys(keys), ids
+
+
+def writeArchive(path, cells, ids=None, chunkSize=1 << 20):
+    """ Writes MGRS cells to the archive file in chunks
+
+    @param path - path to the archive file
+    @param cells - MgrsArray or array-like of MGRS coordinate strings
+    @param ids - optional array-like of integer record ids
+    @param chunkSize - number of records grouped together
+    @returns - number of written records
+    """
+    with ArchiveWriter(path) as writer:
+        for start in range(0, len(cells), chunkSize):
+            writer.write(cells[start:start + chunkSize], None if ids is None else ids[start:start + chunkSize])
+        return writer.count
+
+
+def _width(deltas):
+    """ Returns the smallest number of bytes storing all deltas
+
+    @param deltas - array of deltas
+    @returns - 1, 2 or 4
+    """
+    if len(deltas) == 0:
+        return 1
+
+    low, high = deltas.min(), deltas.max()
+    for width, dtype in sorted(_WIDTHS.items()):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return width
+    raise ValueError('Delta does not fit into 4 bytes')
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    arrow.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import validation
+
+
+def toMgrsArrow(latitudes, longitudes, precision=5, binary=False):
+    """ Converts Arrow arrays of geodetic (latitude and longitude)
+    coordinates to Arrow array of MGRS coordinate strings. Failed rows
+    are null.
+
+    @param latitudes - Arrow array or chunked array of latitude values
+    @param longitudes - Arrow array or chunked array of longitude values
+    @param precision - precision level of MGRS strings
+    @param binary - if True fixed-size binary array is returned instead
+    of string array
+    @returns - tuple containing Arrow array of MGRS coordinate strings and
+    Arrow array of per-row status codes
+    """
+    result, status = batch.toMgrsBatch(_floats(latitudes), _floats(longitudes), precision)
+    encoded = result.astype('S%d' % validation.MAX_LENGTH)
+    valid = status == mgrs.STATUS_OK
+    if binary:
+        array = _fixedSizeBinaryArray(encoded, valid)
+    else:
+        array = _stringArray(encoded, valid)
+
+    return array, pa.array(status, type=pa.uint8())
+
+
+def toWgsArrow(mgrsStrings):
+    """ Converts Arrow array of MGRS coordinate strings to Arrow arrays of
+    geodetic (latitude and longitude) coordinates. Null and failed rows
+    get NaN coordinates.
+
+    @param mgrsStrings - Arrow string, large string or fixed-size binary
+    array (or chunked array)
+    @returns - tuple containing Arrow arrays of latitude values, longitude
+    values and per-row status codes
+    """
+    values, tooLong = _bytes(mgrsStrings)
+    latitudes, longitudes, status = batch.toWgsBatch(values)
+    latitudes[tooLong] = np.nan
+    longitudes[tooLong] = np.nan
+    status[tooLong] = mgrs.STATUS_MALFORMED
+    return (pa.array(latitudes, type=pa.float64()),
+            pa.array(longitudes, type=pa.float64()),
+            pa.array(status, type=pa.uint8()))
+
+
+def addMgrsColumn(table, latitudeColumn='latitude', longitudeColumn='longitude',
+                  mgrsColumn='mgrs', precision=5, binary=False, statusColumn=None):
+    """ Appends column with MGRS coordinate strings to the Arrow table
+
+    @param table - Arrow table
+    @param latitudeColumn - name of the latitude column
+    @param longitudeColumn - name of the longitude column
+    @param mgrsColumn - name of the new MGRS column
+    @param precision - precision level of MGRS strings
+    @param binary - if True MGRS column is fixed-size binary instead of string
+    @param statusColumn - name of the new status codes column or None
+    if status codes should not be stored
+    @returns - new Arrow table
+    """
+    result, status = toMgrsArrow(table.column(latitudeColumn), table.column(longitudeColumn),
+                                 precision, binary)
+    table = table.append_column(mgrsColumn, result)
+    if statusColumn is not None:
+        table = table.append_column(statusColumn, status)
+
+    return table
+
+
+def addWgsColumns(table, mgrsColumn='mgrs', latitudeColumn='latitude',
+                  longitudeColumn='longitude', statusColumn=None):
+    """ Appends columns with latitude and longitude values to the Arrow table
+
+    @param table - Arrow table
+    @param mgrsColumn - name of the MGRS column
+    @param latitudeColumn - name of the new latitude column
+    @param longitudeColumn - name of the new longitude column
+    @param statusColumn - name of the new status codes column or None
+    if status codes should not be stored
+    @returns - new Arrow table
+    """
+    latitudes, longitudes, status = toWgsArrow(table.column(mgrsColumn))
+    table = table.append_column(latitudeColumn, latitudes)
+    table = table.append_column(longitudeColumn, longitudes)
+    if statusColumn is not None:
+        table = table.append_column(statusColumn, status)
+
+    return table
+
+
+def parquetToMgrs(source, destination, latitudeColumn='latitude', longitudeColumn='longitude',
+                  mgrsColumn='mgrs', precision=5, binary=False, statusColumn=None):
+    """ Converts Parquet file with latitude and longitude columns, writing
+    it to the new file with additional MGRS column. File is processed one
+    row group at a time, so memory usage is bounded by the row group size.
+
+    @param source - path or file-like object of the input Parquet file
+    @param destination - path or file-like object of the output Parquet file
+    @param latitudeColumn - name of the latitude column
+    @param longitudeColumn - name of the longitude column
+    @param mgrsColumn - name of the new MGRS column
+    @param precision - precision level of MGRS strings
+    @param binary - if True MGRS column is fixed-size binary instead of string
+    @param statusColumn - name of the new status codes column or None
+    if status codes should not be stored
+    @returns - number of converted rows
+    """
+    return _convertParquet(source, destination, addMgrsColumn, latitudeColumn=latitudeColumn,
+                           longitudeColumn=longitudeColumn, mgrsColumn=mgrsColumn,
+                           precision=precision, binary=binary, statusColumn=statusColumn)
+
+
+def parquetToWgs(source, destination, mgrsColumn='mgrs', latitudeColumn='latitude',
+                 longitudeColumn='longitude', statusColumn=None):
+    """ Converts Parquet file with MGRS column, writing it to the new file
+    with additional latitude and longitude columns. File is processed one
+    row group at a time, so memory usage is bounded by the row group size.
+
+    @param source - path or file-like object of the input Parquet file
+    @param destination - path or file-like object of the output Parquet file
+    @param mgrsColumn - name of the MGRS column
+    @param latitudeColumn - name of the new latitude column
+    @param longitudeColumn - name of the new longitude column
+    @param statusColumn - name of the new status codes column or None
+    if status codes should not be stored
+    @returns - number of converted rows
+    """
+    return _convertParquet(source, destination, addWgsColumns, mgrsColumn=mgrsColumn,
+                           latitudeColumn=latitudeColumn, longitudeColumn=longitudeColumn,
+                           statusColumn=statusColumn)
+
+
+def _convertParquet(source, destination, func, **kwargs):
+    """ Applies table conversion function to each row group of the Parquet
+    file and writes results to the new file
+
+    @param source - path or file-like object of the input Parquet file
+    @param destination - path or file-like object of the output Parquet file
+    @param func - function accepting Arrow table and keyword arguments
+    and returning new table
+    @returns - number of converted rows
+    """
+    reader = pq.ParquetFile(source)
+    writer = None
+    rows = 0
+    try:
+        for i in range(reader.num_row_groups):
+            table = func(reader.read_row_group(i), **kwargs)
+            if writer is None:
+                writer = pq.ParquetWriter(destination, table.schema)
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows
+
+
+def _floats(values):
+    """ Returns NumPy view of the Arrow float64 array. Memory is copied only
+    if array has several chunks, nulls (converted to NaN) or other type.
+
+    @param values - Arrow array or chunked array
+    @returns - NumPy float64 array
+    """
+    if isinstance(values, pa.ChunkedArray):
+        if values.num_chunks == 1:
+            values = values.chunk(0)
+        else:
+            return np.concatenate([_floats(c) for c in values.chunks]) if values.num_chunks else np.empty(0)
+
+    if values.type != pa.float64():
+        values = values.cast(pa.float64())
+
+    return values.to_numpy(zero_copy_only=values.null_count == 0)
+
+
+def _bytes(values):
+    """ Returns NumPy fixed-width bytes array for the Arrow string, large
+    string or fixed-size binary array without creating Python objects.
+    Null values become empty strings. Leading and trailing whitespace of
+    strings is dropped and at most MAX_LENGTH + 1 characters are kept, so
+    a few very long values do not inflate the whole matrix.
+
+    @param values - Arrow array or chunked array
+    @returns - tuple containing NumPy bytes array and boolean array marking
+    values longer than the longest valid MGRS string
+    """
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+
+    count = len(values)
+    tooLong = np.zeros(count, dtype=bool)
+    if pa.types.is_fixed_size_binary(values.type):
+        width = values.type.byte_width
+        data = np.frombuffer(values.buffers()[1], dtype=np.uint8)
+        matrix = data[values.offset * width:(values.offset + count) * width].reshape(count, width)
+    else:
+        if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+            values = values.cast(pa.string())
+
+        offsetType = np.int64 if pa.types.is_large_string(values.type) else np.int32
+        offsets = np.frombuffer(values.buffers()[1], dtype=offsetType)[values.offset:values.offset + count + 1]
+        data = np.frombuffer(values.buffers()[2], dtype=np.uint8) if values.buffers()[2] else np.zeros(1, np.uint8)
+
+        # first and last non-blank character of each value, like
+        # validation.parseBuffer() does
+        blank = (data == 0) | (data == ord(' ')) | ((data >= 9) & (data <= 13))
+        characters = np.concatenate(([-1], np.flatnonzero(~blank), [len(data)]))
+        starts, ends = offsets[:-1].astype(np.int64), offsets[1:].astype(np.int64)
+        first = characters[np.searchsorted(characters, starts)]
+        last = characters[np.searchsorted(characters, ends) - 1]
+        lengths = np.where(first < ends, last - first + 1, 0)
+        tooLong = lengths > validation.MAX_LENGTH
+
+        width = max(min(int(lengths.max()) if count else 0, validation.MAX_LENGTH + 1), 1)
+        columns = np.arange(width)
+        idx = np.minimum(first[:, None] + columns, len(data) - 1)
+        matrix = np.where(columns < lengths[:, None], data[idx], 0).astype(np.uint8)
+
+    if values.null_count:
+        valid = values.is_valid().to_numpy(zero_copy_only=False)
+        matrix = np.where(valid[:, None], matrix, 0)
+        tooLong &= valid
+
+    return np.ascontiguousarray(matrix, dtype=np.uint8).view('S%d' % matrix.shape[1]).ravel(), tooLong
+
+
+def _stringArray(encoded, valid):
+    """ Builds Arrow string array directly from the buffers of NumPy
+    fixed-width bytes array
+
+    @param encoded - NumPy bytes array
+    @param valid - boolean NumPy array, False marks null values
+    @returns - Arrow string array
+    """
+    count = len(encoded)
+    width = encoded.dtype.itemsize
+    matrix = np.ascontiguousarray(encoded).view(np.uint8).reshape(count, width)
+    lengths = np.where(valid, np.char.str_len(encoded), 0)
+    data = matrix[np.arange(width) < lengths[:, None]]
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int32)
+    return pa.StringArray.from_buffers(count, pa.py_buffer(offsets), pa.py_buffer(data),
+                                       _validity(valid), null_count=int(count - valid.sum()))
+
+
+def _fixedSizeBinaryArray(encoded, valid):
+    """ Builds Arrow fixed-size binary array directly from the buffer of
+    NumPy fixed-width bytes array
+
+    @param encoded - NumPy bytes array
+    @param valid - boolean NumPy array, False marks null values
+    @returns - Arrow fixed-size binary array
+    """
+    count = len(encoded)
+    return pa.Array.from_buffers(pa.binary(encoded.dtype.itemsize), count,
+                                 [_validity(valid), pa.py_buffer(np.ascontiguousarray(encoded))],
+                                 null_count=int(count - valid.sum()))
+
+
+def _validity(valid):
+    """ Returns Arrow validity bitmap buffer
+
+    @param valid - boolean NumPy array, False marks null values
+    @returns - Arrow buffer or None if there are no null values
+    """
+    if valid.all():
+        return None
+
+    return pa.py_buffer(np.packbits(valid, bitorder='little'))
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    batch.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+from mgrspy import validation
+from mgrspy import zones
+
+
+def toMgrsBatch(latitudes, longitudes, precision=5):
+    """ Converts arrays of geodetic (latitude and longitude) coordinates
+    to MGRS coordinate strings. Invalid rows do not raise exceptions,
+    instead they get empty string and non-zero status code.
+
+    @param latitudes - array-like of latitude values
+    @param longitudes - array-like of longitude values
+    @param precision - precision level of MGRS strings, single value or
+    array-like with value for each row
+    @returns - tuple containing array of MGRS coordinate strings and array
+    of per-row status codes (STATUS_* constants from the mgrs module)
+    """
+    latitudes, longitudes, precision = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                           np.asarray(longitudes, dtype=np.float64),
+                                                           np.asarray(precision))
+    components, status = _toMgrsComponents(latitudes.ravel(), longitudes.ravel(), precision.ravel())
+    return grid._format(components, status).reshape(latitudes.shape), status.reshape(latitudes.shape)
+
+
+def toMgrsLevels(latitudes, longitudes, precisions=(1, 2, 3, 4, 5)):
+    """ Converts arrays of geodetic (latitude and longitude) coordinates
+    to MGRS coordinate strings of several precision levels with a single
+    reprojection, see toMgrsBatch()
+
+    @param latitudes - array-like of latitude values
+    @param longitudes - array-like of longitude values
+    @param precisions - sequence of precision levels
+    @returns - tuple containing array of MGRS coordinate strings with one
+    column per precision level and array of per-row status codes
+    """
+    latitudes, longitudes = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                np.asarray(longitudes, dtype=np.float64))
+    levels, status = _toMgrsLevels(latitudes.ravel(), longitudes.ravel(), precisions)
+    result = np.empty((len(status), len(levels)), dtype='U%d' % validation.MAX_LENGTH)
+    for i, components in enumerate(levels):
+        result[:, i] = grid._format(components, status)
+    return result.reshape(latitudes.shape + (len(levels),)), status.reshape(latitudes.shape)
+
+
+def toWgsBatch(mgrsStrings):
+    """ Converts array of MGRS coordinate strings to geodetic (latitude and
+    longitude) coordinates. Invalid rows do not raise exceptions, instead
+    they get NaN coordinates and non-zero status code.
+
+    @param mgrsStrings - array-like of MGRS coordinate strings
+    @returns - tuple containing arrays of latitude values, longitude values
+    and per-row status codes (STATUS_* constants from the mgrs module)
+    """
+    codes, shape = validation._codes(mgrsStrings)
+    status, zone, letters, eastings, northings = validation._parse(codes)[:5]
+
+    latitudes = np.full(status.shape, np.nan)
+    longitudes = np.full(status.shape, np.nan)
+
+    north, eastings, northings = grid._mgrsToGrid(zone, letters, eastings, northings)
+    epsgs = np.where(north, 32600, 32700) + np.where(zone > 0, zone, 61)
+
+    rows = np.flatnonzero(status == mgrs.STATUS_OK)
+    for epsg in np.unique(epsgs[rows]):
+        idx = rows[epsgs[rows] == epsg]
+        x, y = _transform(int(epsg), 4326, eastings[idx], northings[idx])
+        failed = ~(np.isfinite(x) & np.isfinite(y))
+        status[idx[failed]] = mgrs.STATUS_TRANSFORM
+        longitudes[idx[~failed]] = x[~failed]
+        latitudes[idx[~failed]] = y[~failed]
+
+    return latitudes.reshape(shape), longitudes.reshape(shape), status.reshape(shape)
+
+
+def _toMgrsComponents(latitudes, longitudes, precision):
+    """ Converts arrays of geodetic coordinates to MGRS components
+
+    @param latitudes - array of latitude values
+    @param longitudes - array of longitude values
+    @param precision - array of precision levels
+    @returns - tuple containing MGRS components (arrays of zones, letters,
+    easting, northing and precision, see grid._components()) and array of
+    per-row status codes
+    """
+    status = _checkWgs(latitudes, longitudes, precision)
+    components = [np.zeros(latitudes.shape, dtype=np.int64) for i in range(7)]
+
+    rows = np.flatnonzero(status == mgrs.STATUS_OK)
+    epsgs = zones.classifyZones(latitudes[rows], longitudes[rows])[3]
+    for epsg in np.unique(epsgs):
+        idx = rows[epsgs == epsg]
+        x, y = _transform(4326, int(epsg), longitudes[idx], latitudes[idx])
+        zone, hemisphere = _zoneForEpsg(epsg)
+        north = np.full(len(idx), hemisphere == 'N')
+        if zone == 0:
+            converted, st = grid._upsToComponents(north, x, y, precision[idx])
+        else:
+            converted, st = grid._utmToComponents(np.full(len(idx), zone), north, latitudes[idx],
+                                                  x, y, precision[idx])
+        for component, values in zip(components, converted):
+            component[idx] = values
+        status[idx] = np.where(st == mgrs.STATUS_OK, mgrs.STATUS_OK, mgrs.STATUS_TRANSFORM)
+
+    return tuple(components), status
+
+
+def _toMgrsLevels(latitudes, longitudes, precisions):
+    """ Converts arrays of geodetic coordinates to MGRS components of
+    several precision levels. Components are calculated once with maximum
+    precision, other levels only truncate eastings and northings.
+
+    @param latitudes - array of latitude values
+    @param longitudes - array of longitude values
+    @param precisions - sequence of precision levels
+    @returns - tuple containing list of MGRS components for each precision
+    level and array of per-row status codes
+    """
+    for precision in precisions:
+        if (precision < 0) or (precision > mgrs.MAX_PRECISION) or precision != int(precision):
+            raise mgrs.MgrsException('The precision must be between 0 and 5 inclusive.')
+
+    components, status = _toMgrsComponents(latitudes, longitudes,
+                                           np.full(latitudes.shape, mgrs.MAX_PRECISION))
+    zone, band, column, row, easting, northing, precision = components
+    levels = []
+    for precision in precisions:
+        divisor = 10 ** (mgrs.MAX_PRECISION - int(precision))
+        levels.append((zone, band, column, row, easting // divisor, northing // divisor,
+                       np.full(latitudes.shape, int(precision), dtype=np.int64)))
+
+    return levels, status
+
+
+def _checkWgs(latitudes, longitudes, precision):
+    """ Performs the same range checks as toMgrs() on the whole arrays
+
+    @param latitudes - array of latitude values
+    @param longitudes - array of longitude values
+    @param precision - array of precision levels
+    @returns - array of per-row status codes
+    """
+    status = np.zeros(latitudes.shape, dtype=np.uint8)
+    with np.errstate(invalid='ignore'):
+        status[~(np.abs(latitudes) <= 90)] = mgrs.STATUS_LATITUDE_RANGE
+        invalid = ~((longitudes >= -180) & (longitudes <= 360))
+        status[(status == mgrs.STATUS_OK) & invalid] = mgrs.STATUS_LONGITUDE_RANGE
+        invalid = ~((precision >= 0) & (precision <= mgrs.MAX_PRECISION) & (precision == np.floor(precision)))
+        status[(status == mgrs.STATUS_OK) & invalid] = mgrs.STATUS_PRECISION
+
+    return status
+
+
+def _transform(srcEpsg, dstEpsg, xs, ys):
+    """ Transforms arrays of coordinates with a single coordinate
+    transformation call, reusing cached transformation
+
+    @param srcEpsg - EPSG code of the source coordinate reference system
+    @param dstEpsg - EPSG code of the destination coordinate reference system
+    @param xs - array of X coordinates (longitudes or eastings)
+    @param ys - array of Y coordinates (latitudes or northings)
+    @returns - tuple containing arrays of transformed X and Y coordinates
+    """
+    ct = mgrs._cachedTransformation(srcEpsg, dstEpsg)
+    points = np.array(ct.TransformPoints(np.column_stack((xs, ys)).tolist()), dtype=np.float64)
+    return points[:, 0], points[:, 1]
+
+
+def _zoneForEpsg(epsg):
+    """ Returns UTM zone and hemisphere for given UTM or UPS EPSG code
+
+    @param epsg - EPSG code
+    @returns - tuple containing UTM zone (0 for UPS) and hemisphere
+    """
+    zone = int(epsg) % 100
+    hemisphere = 'N' if int(epsg) // 100 == 326 else 'S'
+    return (0 if zone == 61 else zone), hemisphere
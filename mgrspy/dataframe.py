@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    dataframe.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+import pandas as pd
+
+from mgrspy import mgrs
+from mgrspy import grid
+from mgrspy import batch
+from mgrspy import validation
+
+
+_ERRORS = ('raise', 'coerce')
+
+
+@pd.api.extensions.register_dataframe_accessor('mgrs')
+class MgrsDataFrameAccessor(object):
+    """ DataFrame accessor converting whole columns with the batch engine,
+    available as df.mgrs after importing this module
+    """
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def fromLatLon(self, latitude='latitude', longitude='longitude', precision=5, errors='raise',
+                   categorical=True):
+        """ Converts latitude and longitude columns to MGRS coordinate
+        strings, with the same semantics as toMgrs()
+
+        @param latitude - name of the latitude column
+        @param longitude - name of the longitude column
+        @param precision - precision level of MGRS strings
+        @param errors - 'raise' to raise MgrsException for the first invalid
+        row, 'coerce' to set invalid rows to missing values
+        @param categorical - if True categorical column is returned, which
+        stores each distinct cell only once, otherwise string column
+        @returns - Series of MGRS coordinate strings with the frame index
+        """
+        _checkErrors(errors)
+        strings, status = batch.toMgrsBatch(_floats(self._frame[latitude]), _floats(self._frame[longitude]),
+                                            precision)
+        if errors == 'raise':
+            grid._check(status)
+
+        return pd.Series(_strings(strings, status != mgrs.STATUS_OK, categorical),
+                         index=self._frame.index, name='mgrs')
+
+    def toLatLon(self, column='mgrs', errors='raise'):
+        """ Converts column of MGRS coordinate strings to latitude and
+        longitude, see MgrsSeriesAccessor.toLatLon()
+
+        @param column - name of the MGRS column
+        @param errors - either 'raise' or 'coerce'
+        @returns - DataFrame with 'latitude' and 'longitude' columns and the
+        frame index
+        """
+        return self._frame[column].mgrs.toLatLon(errors)
+
+
+@pd.api.extensions.register_series_accessor('mgrs')
+class MgrsSeriesAccessor(object):
+    """ Series accessor converting MGRS coordinate strings with the batch
+    engine, available as s.mgrs after importing this module
+    """
+
+    def __init__(self, series):
+        self._series = series
+
+    def toLatLon(self, errors='raise'):
+        """ Converts MGRS coordinate strings to latitude and longitude, with
+        the same semantics as toWgs(). Categorical series are converted once
+        per category.
+
+        @param errors - 'raise' to raise MgrsException for the first invalid
+        row, 'coerce' to set invalid (and missing) rows to NaN
+        @returns - DataFrame with 'latitude' and 'longitude' columns and the
+        series index
+        """
+        _checkErrors(errors)
+        values = self._series.array
+        if isinstance(self._series.dtype, pd.CategoricalDtype):
+            latitudes, longitudes, status = batch.toWgsBatch(_objects(values.categories))
+            codes = values.codes
+            missing = codes < 0
+            latitudes = np.where(missing, np.nan, latitudes[codes])
+            longitudes = np.where(missing, np.nan, longitudes[codes])
+            status = np.where(missing, mgrs.STATUS_MALFORMED, status[codes])
+        else:
+            latitudes, longitudes, status = batch.toWgsBatch(_objects(values))
+
+        if errors == 'raise':
+            grid._check(status)
+
+        return pd.DataFrame({'latitude': latitudes, 'longitude': longitudes}, index=self._series.index)
+
+    def status(self):
+        """ Checks MGRS coordinate strings without converting them, see
+        validateMgrs()
+
+        @returns - Series of per-row status codes (STATUS_* constants from
+        the mgrs module)
+        """
+        return pd.Series(validation.validateMgrs(_objects(self._series.array)), index=self._series.index,
+                         name='status')
+
+
+def _checkErrors(errors):
+    """ Checks value of the errors argument
+    """
+    if errors not in _ERRORS:
+        raise ValueError('errors must be either "raise" or "coerce"')
+
+
+def _floats(column):
+    """ Returns column values as float array, missing values become NaN
+    """
+    return column.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _objects(values):
+    """ Returns values as object array, missing values become None
+    """
+    return np.asarray(pd.array(values, dtype=object).to_numpy(na_value=None), dtype=object)
+
+
+def _strings(strings, failed, categorical):
+    """ Creates pandas array of MGRS coordinate strings
+
+    @param strings - array of MGRS coordinate strings
+    @param failed - boolean array, True marks rows set to missing value
+    @param categorical - if True categorical array is created, otherwise
+    string array
+    @returns - pandas extension array
+    """
+    if categorical:
+        codes, categories = pd.factorize(strings)
+        codes[failed] = -1
+        return pd.Categorical.from_codes(codes, categories=categories).remove_unused_categories()
+
+    result = pd.array(strings, dtype='string')
+    result[failed] = pd.NA
+    return result
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    diskcache.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import sqlite3
+
+import numpy as np
+
+from osgeo import gdal
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import validation
+
+
+# version of the cached values, must be increased whenever conversion
+# results change, so old cache files are invalidated
+CACHE_VERSION = 1
+
+# default maximum number of entries per conversion direction
+MAX_ENTRIES = 1000000
+
+# number of rows looked up or inserted by one SQL statement
+BATCH_SIZE = 50000
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS mgrs (latitude REAL, longitude REAL, precision INTEGER, value TEXT,
+                                 used INTEGER, PRIMARY KEY (latitude, longitude, precision));
+CREATE TABLE IF NOT EXISTS wgs (mgrs TEXT PRIMARY KEY, latitude REAL, longitude REAL, used INTEGER);
+CREATE INDEX IF NOT EXISTS mgrs_used ON mgrs (used);
+CREATE INDEX IF NOT EXISTS wgs_used ON wgs (used);
+'''
+
+
+class ConversionCache(object):
+    """ Persistent cache of toMgrs() and toWgs() results stored in a local
+    SQLite file, so repeated runs over the same points skip coordinate
+    transformations. Entries are keyed by normalized input, looked up and
+    inserted in batches and evicted least recently used first when the
+    number of entries exceeds the limit. Cache file is cleared when it was
+    written by a different GDAL version or CACHE_VERSION.
+    """
+
+    def __init__(self, path, maxEntries=MAX_ENTRIES):
+        """ Opens or creates cache file
+
+        @param path - path to the cache file, ':memory:' for a temporary
+        in-memory cache
+        @param maxEntries - maximum number of entries per conversion
+        direction
+        """
+        if maxEntries < 1:
+            raise ValueError('maxEntries must be positive')
+
+        self.maxEntries = int(maxEntries)
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+        self._connection.execute('CREATE TEMP TABLE lookup (idx INTEGER PRIMARY KEY, a, b, c)')
+
+        meta = dict(self._connection.execute('SELECT key, value FROM meta'))
+        if meta.get('fingerprint') != fingerprint():
+            self.clear()
+            meta = {}
+        self._tick = int(meta.get('tick', 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return sum(self._count(table) for table in ('mgrs', 'wgs'))
+
+    def toMgrs(self, latitudes, longitudes, precision=5):
+        """ Cached version of batch.toMgrsBatch(), with the same arguments
+        and results. Only successfully converted rows are cached.
+
+        @param latitudes - array-like of latitude values
+        @param longitudes - array-like of longitude values
+        @param precision - precision level of MGRS strings, single value or
+        array-like with value for each row
+        @returns - tuple containing array of MGRS coordinate strings and
+        array of per-row status codes
+        """
+        latitudes, longitudes, precision = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                               np.asarray(longitudes, dtype=np.float64),
+                                                               np.asarray(precision))
+        shape = latitudes.shape
+        latitudes, longitudes = _normalizeWgs(latitudes.ravel(), longitudes.ravel())
+        precision = precision.ravel()
+
+        status = batch._checkWgs(latitudes, longitudes, precision)
+        result = np.zeros(len(status), dtype='U%d' % validation.MAX_LENGTH)
+        rows = np.flatnonzero(status == mgrs.STATUS_OK)
+        precision = np.where(status == mgrs.STATUS_OK, precision, 0).astype(np.int64)
+
+        keys = list(zip(latitudes[rows].tolist(), longitudes[rows].tolist(), precision[rows].tolist()))
+        found = self._lookup('SELECT lookup.idx, mgrs.value FROM lookup JOIN mgrs ON '
+                             'mgrs.latitude = lookup.a AND mgrs.longitude = lookup.b AND mgrs.precision = lookup.c',
+                             'UPDATE mgrs SET used = ? WHERE (latitude, longitude, precision) IN '
+                             '(SELECT a, b, c FROM lookup)', keys)
+        for i, value in found:
+            result[rows[i]] = value
+
+        missing = rows[np.setdiff1d(np.arange(len(rows)), [i for i, value in found]).astype(np.int64)]
+        if len(missing):
+            converted, st = batch.toMgrsBatch(latitudes[missing], longitudes[missing], precision[missing])
+            result[missing] = converted
+            status[missing] = st
+            ok = np.flatnonzero(st == mgrs.STATUS_OK)
+            self._insert('INSERT OR REPLACE INTO mgrs VALUES (?, ?, ?, ?, ?)',
+                         zip(latitudes[missing[ok]].tolist(), longitudes[missing[ok]].tolist(),
+                             precision[missing[ok]].tolist(), converted[ok].tolist()), 'mgrs')
+
+        return result.reshape(shape), status.reshape(shape)
+
+    def toWgs(self, mgrsStrings):
+        """ Cached version of batch.toWgsBatch(), with the same arguments
+        and results. Strings are normalized with canonicalizeMgrs() and only
+        successfully converted rows are cached.
+
+        @param mgrsStrings - array-like of MGRS coordinate strings
+        @returns - tuple containing arrays of latitude values, longitude
+        values and per-row status codes
+        """
+        canonical, status = validation.canonicalizeMgrs(mgrsStrings)
+        shape = canonical.shape
+        canonical = canonical.ravel()
+        status = status.ravel()
+        latitudes = np.full(len(status), np.nan)
+        longitudes = np.full(len(status), np.nan)
+
+        rows = np.flatnonzero(status == mgrs.STATUS_OK)
+        keys = [(value, None, None) for value in canonical[rows].tolist()]
+        found = self._lookup('SELECT lookup.idx, wgs.latitude, wgs.longitude FROM lookup JOIN wgs ON '
+                             'wgs.mgrs = lookup.a',
+                             'UPDATE wgs SET used = ? WHERE mgrs IN (SELECT a FROM lookup)', keys)
+        for i, latitude, longitude in found:
+            latitudes[rows[i]] = latitude
+            longitudes[rows[i]] = longitude
+
+        missing = rows[np.setdiff1d(np.arange(len(rows)), [row[0] for row in found]).astype(np.int64)]
+        if len(missing):
+            lat, lon, st = batch.toWgsBatch(canonical[missing])
+            latitudes[missing] = lat
+            longitudes[missing] = lon
+            status[missing] = st
+            ok = np.flatnonzero(st == mgrs.STATUS_OK)
+            self._insert('INSERT OR REPLACE INTO wgs VALUES (?, ?, ?, ?)',
+                         zip(canonical[missing[ok]].tolist(), lat[ok].tolist(), lon[ok].tolist()), 'wgs')
+
+        return latitudes.reshape(shape), longitudes.reshape(shape), status.reshape(shape)
+
+    def clear(self):
+        """ Removes all entries and stores the current fingerprint
+        """
+        with self._connection:
+            self._connection.execute('DELETE FROM mgrs')
+            self._connection.execute('DELETE FROM wgs')
+            self._connection.execute('DELETE FROM meta')
+            self._connection.execute('INSERT INTO meta VALUES (?, ?)', ('fingerprint', fingerprint()))
+        self._tick = 0
+
+    def close(self):
+        """ Closes cache file
+        """
+        self._connection.close()
+
+    def _lookup(self, select, touch, keys):
+        """ Finds cached entries and marks them as recently used
+
+        @param select - query joining lookup table with the cache table,
+        the first column is the lookup index
+        @param touch - statement updating usage of the looked up entries
+        @param keys - list of (a, b, c) key tuples
+        @returns - list of result rows
+        """
+        self._tick += 1
+        found = []
+        with self._connection:
+            for start in range(0, len(keys), BATCH_SIZE):
+                self._connection.execute('DELETE FROM lookup')
+                self._connection.executemany('INSERT INTO lookup VALUES (?, ?, ?, ?)',
+                                             [(start + i,) + key for i, key in
+                                              enumerate(keys[start:start + BATCH_SIZE])])
+                rows = self._connection.execute(select).fetchall()
+                if rows:
+                    self._connection.execute(touch, (self._tick,))
+                found.extend(rows)
+            self._connection.execute('DELETE FROM lookup')
+            self._connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', ('tick', str(self._tick)))
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def _insert(self, statement, values, table):
+        """ Stores new entries and evicts least recently used ones over
+        the limit
+
+        @param statement - insert statement
+        @param values - iterable of value tuples without the usage column
+        @param table - name of the cache table
+        """
+        with self._connection:
+            self._connection.executemany(statement, (value + (self._tick,) for value in values))
+            excess = self._count(table) - self.maxEntries
+            if excess > 0:
+                self._connection.execute('DELETE FROM {0} WHERE rowid IN (SELECT rowid FROM {0} '
+                                         'ORDER BY used LIMIT ?)'.format(table), (excess,))
+
+    def _count(self, table):
+        return self._connection.execute('SELECT COUNT(*) FROM {}'.format(table)).fetchone()[0]
+
+
+def fingerprint():
+    """ Returns string identifying conversion backend and cache format,
+    cached entries are valid only for the same fingerprint
+
+    @returns - fingerprint string
+    """
+    return 'mgrspy-cache-{}/gdal-{}'.format(CACHE_VERSION, gdal.VersionInfo('RELEASE_NAME'))
+
+
+def _normalizeWgs(latitudes, longitudes):
+    """ Normalizes geodetic coordinates used as cache keys: longitudes are
+    moved to the -180 to 180 degrees range and negative zeros are removed
+
+    @param latitudes - array of latitude values
+    @param longitudes - array of longitude values
+    @returns - tuple containing arrays of normalized latitudes and
+    longitudes
+    """
+    with np.errstate(invalid='ignore'):
+        longitudes = np.where(longitudes >= 180, longitudes - 360.0, longitudes)
+    return latitudes + 0.0, longitudes + 0.0
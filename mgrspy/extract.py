@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    extract.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import re
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import validation
+
+
+# number of bytes read from streams at once
+CHUNK_SIZE = 1 << 24
+
+# candidate MGRS references: UTM zone and band or UPS letter, 100 km square
+# letters and digits, optionally separated by single spaces, easting and
+# northing may be separated too. Only upper case letters are accepted to
+# avoid matching ordinary words.
+_PATTERN = (r'(?<![0-9A-Za-z])(?:(?P<zone>[0-9]{1,2})[C-HJ-NP-X]|[ABYZ]) ?[A-HJ-NP-Z]{2}'
+            r'(?: ?(?:(?P<easting>[0-9]{1,5}) (?P<northing>[0-9]{1,5})|(?P<digits>[0-9]{2,10})))?'
+            r'(?![0-9A-Za-z])')
+_TEXT_PATTERN = re.compile(_PATTERN)
+_BYTES_PATTERN = re.compile(_PATTERN.encode('ascii'))
+
+# longest candidate plus the character checked after it
+_OVERLAP = 32
+
+# character classes used by _candidates()
+_UPPER = 1
+_DIGIT = 2
+_ALPHANUMERIC = 4
+_BAND = 8
+_UPS = 16
+_SPACE = ord(' ')
+
+_CLASSES = np.zeros(256, dtype=np.uint8)
+for _c in range(256):
+    _ch = chr(_c)
+    if 'A' <= _ch <= 'Z':
+        _CLASSES[_c] |= _UPPER | _ALPHANUMERIC
+        _CLASSES[_c] |= _BAND if 'C' <= _ch <= 'X' and _ch not in 'IO' else 0
+        _CLASSES[_c] |= _UPS if _ch in 'ABYZ' else 0
+    elif '0' <= _ch <= '9':
+        _CLASSES[_c] |= _DIGIT | _ALPHANUMERIC
+    elif 'a' <= _ch <= 'z':
+        _CLASSES[_c] |= _ALPHANUMERIC
+
+
+def extractMgrs(text, normalize=True):
+    """ Finds all valid MGRS references in the text, in forms like
+    '33UXP0500444996', '33U XP 05004 44996' or '  YYL4939146492'.
+    Candidates are validated in bulk with the same rules as toWgs(). UPS
+    references must contain at least one pair of digits.
+
+    @param text - str or bytes-like object (bytes, bytearray, memoryview,
+    mmap)
+    @param normalize - if True references are returned in the canonical
+    form produced by toMgrs(), otherwise as they appear in the text
+    @returns - tuple containing arrays of start and end offsets of the
+    references and array of reference strings
+    """
+    pattern = _TEXT_PATTERN if isinstance(text, str) else _BYTES_PATTERN
+    return _scan(pattern, text, 0, len(text), normalize)
+
+
+def extractWgs(text):
+    """ Finds all valid MGRS references in the text and converts them to
+    geodetic coordinates in bulk, see extractMgrs()
+
+    @param text - str or bytes-like object
+    @returns - tuple containing arrays of start and end offsets, canonical
+    reference strings, latitudes and longitudes. References which can not
+    be transformed are skipped.
+    """
+    starts, ends, strings = extractMgrs(text)
+    latitudes, longitudes, status = batch.toWgsBatch(strings)
+    ok = status == mgrs.STATUS_OK
+    return starts[ok], ends[ok], strings[ok], latitudes[ok], longitudes[ok]
+
+
+def iterMgrs(stream, normalize=True, chunkSize=CHUNK_SIZE):
+    """ Finds all valid MGRS references in the binary stream, reading it in
+    chunks, see extractMgrs()
+
+    @param stream - binary file-like object
+    @param normalize - if True references are returned in the canonical
+    form produced by toMgrs()
+    @param chunkSize - number of bytes read at once
+    @returns - iterator over tuples containing arrays of start and end
+    offsets (from the stream start) and reference strings, one tuple per
+    chunk
+    """
+    buffer = b''
+    offset = 0
+    position = 0
+    while True:
+        chunk = stream.read(chunkSize)
+        buffer = buffer + chunk if buffer else chunk
+        limit = len(buffer) if not chunk else max(len(buffer) - _OVERLAP, position)
+        starts, ends, strings = _scan(_BYTES_PATTERN, buffer, position, limit, normalize)
+        if len(starts):
+            yield starts + offset, ends + offset, strings
+
+        if not chunk:
+            return
+
+        # keep one character before the next position for the lookbehind
+        position = max(limit, ends[-1] if len(ends) else 0)
+        keep = max(position - 1, 0)
+        buffer = buffer[keep:]
+        offset += keep
+        position -= keep
+
+
+def _candidates(text, position, limit):
+    """ Finds possible starts of MGRS references with vectorized checks of
+    the 100 km square letters, the letter before them and the zone digits,
+    so the pattern is matched only at a few positions
+
+    @param text - str or bytes-like object
+    @param position - offset where search starts
+    @param limit - candidates starting at or after this offset are ignored
+    @returns - sorted array of candidate offsets
+    """
+    if isinstance(text, str):
+        codes = np.frombuffer(text[max(position - 3, 0):limit + 20].encode('utf-32-le'), dtype='<u4')
+    else:
+        codes = np.frombuffer(text, dtype=np.uint8)[max(position - 3, 0):limit + 20]
+    base = max(position - 3, 0)
+    classes = _CLASSES[np.minimum(codes, 255)]
+
+    upper = (classes & _UPPER) > 0
+    pairs = np.flatnonzero(upper[1:-1] & upper[2:]) + 1
+    separated = (codes[pairs - 1] == _SPACE) & (pairs >= 2)
+    band = np.where(separated, pairs - 2, pairs - 1)
+    band = band[upper[band]]
+
+    # zone digits, three or more are not allowed
+    zone = np.zeros(len(band), dtype=np.int64)
+    for k in (1, 2, 3):
+        digit = band >= k
+        digit[digit] = (classes[band[digit] - k] & _DIGIT) > 0
+        zone += digit & (zone == k - 1)
+    start = band - zone
+
+    ok = (zone < 3) & (np.where(zone > 0, classes[band] & _BAND, classes[band] & _UPS) > 0)
+    boundary = start > 0
+    boundary[boundary] = (classes[start[boundary] - 1] & _ALPHANUMERIC) > 0
+    start = start[ok & ~boundary] + base
+    return np.unique(start[(start >= position) & (start < limit)])
+
+
+def _scan(pattern, text, position, limit, normalize):
+    """ Finds candidates starting before the limit and validates them
+
+    @param pattern - compiled candidate pattern matching type of the text
+    @param text - str or bytes-like object
+    @param position - offset where search starts
+    @param limit - candidates starting at or after this offset are ignored
+    @param normalize - if True canonical strings are returned
+    @returns - tuple containing arrays of start and end offsets and
+    reference strings
+    """
+    space = ' ' if isinstance(text, str) else b' '
+    starts = []
+    ends = []
+    references = []
+    end = 0
+    for start in _candidates(text, position, limit).tolist():
+        if start < end:
+            continue
+
+        match = pattern.match(text, start)
+        if match is None:
+            continue
+
+        reference = match.group()
+        zone, easting, northing, digits = match.groups()
+        if easting is not None:
+            # separated easting and northing must have the same length,
+            # otherwise only the easting may belong to the reference
+            if len(easting) != len(northing):
+                if len(easting) % 2:
+                    continue
+                reference = reference[:match.end(2) - start]
+        elif zone is None and digits is None:
+            continue
+
+        end = start + len(reference)
+        starts.append(start)
+        ends.append(end)
+        references.append(reference)
+
+    starts = np.array(starts, dtype=np.int64)
+    ends = np.array(ends, dtype=np.int64)
+    if not references:
+        return starts, ends, np.array([], dtype='U%d' % validation.MAX_LENGTH)
+
+    canonical, status = validation.canonicalizeMgrs(np.array([r.replace(space, space[:0]) for r in references]))
+    ok = status == mgrs.STATUS_OK
+    if normalize:
+        return starts[ok], ends[ok], canonical[ok]
+
+    references = np.array(references)[ok]
+    if references.dtype.kind == 'S':
+        references = np.char.decode(references, 'ascii')
+    return starts[ok], ends[ok], references
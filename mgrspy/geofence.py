@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    geofence.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+from mgrspy import zones
+from mgrspy.mgrsarray import MgrsArray
+
+
+# cell index of the points outside of the geofence
+NO_MATCH = -1
+
+# pseudo zone numbers of the UPS systems
+_UPS_NORTH = 61
+_UPS_SOUTH = 62
+
+# bit offsets of the first letter and column index in cell keys
+_BAND_SHIFT = 48
+_COLUMN_SHIFT = 24
+
+
+class Geofence(object):
+    """ Set of MGRS cells compiled to per-zone tables of grid rectangles.
+    Points are classified into zones and latitude bands once, reprojected
+    once per zone of the geofence and matched to the cells of every
+    precision by sorted key lookups, so the result is the same as
+    converting each point with toMgrs() at the precision of each cell and
+    comparing strings.
+    """
+
+    def __init__(self, cells):
+        """ Compiles geofence
+
+        @param cells - array-like of MGRS coordinate strings or MgrsArray,
+        cells may have different precisions and may be nested
+        """
+        if not isinstance(cells, MgrsArray):
+            cells = MgrsArray.fromStrings(np.atleast_1d(np.asarray(cells)).ravel())[0]
+
+        if not cells.valid.all():
+            raise mgrs.MgrsException('An MGRS string error: string too long, too short, or badly formed')
+
+        self.cells = cells
+        self._tables = {}
+
+        north, easting, northing = cells.gridCoordinates()
+        size = cells.cellSize()
+        system = _system(cells.zone.astype(np.int64), north)
+        keys = _keys(cells.band, np.round(easting / size), np.round(northing / size))
+        for s in np.unique(system):
+            table = self._tables[int(s)] = []
+            for precision in np.unique(cells.precision[system == s]):
+                rows = np.flatnonzero((system == s) & (cells.precision == precision))
+                order = np.argsort(keys[rows], kind='stable')
+                table.append((10.0 ** (mgrs.MAX_PRECISION - int(precision)), keys[rows[order]], rows[order]))
+
+    def __len__(self):
+        return len(self.cells)
+
+    def contains(self, latitudes, longitudes):
+        """ Tests which points lie inside any cell of the geofence
+
+        @param latitudes - array-like of latitude values
+        @param longitudes - array-like of longitude values
+        @returns - boolean array of the broadcast input shape, points with
+        invalid coordinates are never inside
+        """
+        return self.cellIndices(latitudes, longitudes) != NO_MATCH
+
+    def cellIndices(self, latitudes, longitudes):
+        """ Finds cells of the geofence containing the points
+
+        @param latitudes - array-like of latitude values
+        @param longitudes - array-like of longitude values
+        @returns - array of the broadcast input shape with indices to the
+        cells array, the most precise cell is reported for points inside
+        nested cells, NO_MATCH for points outside of the geofence
+        """
+        latitudes, longitudes = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                    np.asarray(longitudes, dtype=np.float64))
+        shape = latitudes.shape
+        latitudes = latitudes.ravel()
+        longitudes = longitudes.ravel()
+
+        zone, band, north, epsg = zones.classifyZones(latitudes, longitudes)
+        system = np.where(band != zones.INVALID, _system(zone, north), 0)
+        result = np.full(len(latitudes), NO_MATCH, dtype=np.int64)
+        for s, table in self._tables.items():
+            rows = np.flatnonzero(system == s)
+            if len(rows) == 0:
+                continue
+
+            # grid coordinates are truncated to meters like in toMgrs()
+            easting, northing = grid._wgsToGrid(zone[rows], north[rows], latitudes[rows], longitudes[rows])
+            easting = np.floor(easting)
+            northing = np.floor(northing)
+            for size, keys, cells in table:
+                found = _keys(band[rows], np.floor(easting / size), np.floor(northing / size))
+                idx = np.minimum(np.searchsorted(keys, found), len(keys) - 1)
+                hit = keys[idx] == found
+                result[rows[hit]] = cells[idx[hit]]
+
+        return result.reshape(shape)
+
+
+def _system(zone, north):
+    """ Returns grid systems, UTM zone numbers or UPS pseudo zones
+
+    @param zone - array of UTM zones, 0 for UPS
+    @param north - boolean array, True for northern hemisphere
+    @returns - array of grid systems
+    """
+    return np.where(zone > 0, zone, np.where(north, _UPS_NORTH, _UPS_SOUTH))
+
+
+def _keys(band, column, row):
+    """ Packs first letter, column and row index of the cells into integers
+
+    @param band - array of the first MGRS letters
+    @param column - array of cell column indices
+    @param row - array of cell row indices
+    @returns - array of int64 keys
+    """
+    return (band.astype(np.int64) << _BAND_SHIFT | column.astype(np.int64) << _COLUMN_SHIFT |
+            row.astype(np.int64))
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    geojson.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import json
+import itertools
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+
+
+# GeoJSON text sequence record separator (RFC 8142)
+RS = '\x1e'
+
+BATCH_SIZE = 1024
+
+
+def annotateFeatures(features, mgrsProperty='mgrs', precision=5, batchSize=BATCH_SIZE, statusProperty=None):
+    """ Adds MGRS coordinate string property to each GeoJSON Point feature.
+    Features are converted in batches of the given size, so only one batch
+    is kept in memory. Features without Point geometry and failed features
+    get null property value.
+
+    @param features - iterable of GeoJSON feature dictionaries
+    @param mgrsProperty - name of the property to store MGRS coordinate string
+    @param precision - precision level of MGRS strings
+    @param batchSize - number of features converted at once
+    @param statusProperty - name of the property to store conversion status
+    code or None if status codes should not be stored
+    @returns - iterator over annotated features
+    """
+    for chunk in _chunks(features, batchSize):
+        latitudes = np.full(len(chunk), np.nan)
+        longitudes = np.full(len(chunk), np.nan)
+        for i, feature in enumerate(chunk):
+            coordinates = _pointCoordinates(feature)
+            if coordinates is not None:
+                try:
+                    longitudes[i], latitudes[i] = coordinates[0], coordinates[1]
+                except (TypeError, ValueError):
+                    longitudes[i], latitudes[i] = np.nan, np.nan
+
+        result, status = batch.toMgrsBatch(latitudes, longitudes, precision)
+        for i, feature in enumerate(chunk):
+            properties = _properties(feature)
+            properties[mgrsProperty] = str(result[i]) if status[i] == mgrs.STATUS_OK else None
+            if statusProperty is not None:
+                properties[statusProperty] = int(status[i])
+            yield feature
+
+
+def locateFeatures(features, mgrsProperty='mgrs', batchSize=BATCH_SIZE, statusProperty=None):
+    """ Sets geometry of each GeoJSON feature to the Point located at its
+    MGRS coordinate string property, using the same semantics as toWgs().
+    Features are converted in batches of the given size, so only one batch
+    is kept in memory. Failed features get null geometry.
+
+    @param features - iterable of GeoJSON feature dictionaries
+    @param mgrsProperty - name of the property with MGRS coordinate string
+    @param batchSize - number of features converted at once
+    @param statusProperty - name of the property to store conversion status
+    code or None if status codes should not be stored
+    @returns - iterator over located features
+    """
+    for chunk in _chunks(features, batchSize):
+        latitudes, longitudes, status = batch.toWgsBatch([_properties(f).get(mgrsProperty) for f in chunk])
+        for i, feature in enumerate(chunk):
+            if status[i] == mgrs.STATUS_OK:
+                feature['geometry'] = {'type': 'Point',
+                                       'coordinates': [float(longitudes[i]), float(latitudes[i])]}
+            else:
+                feature['geometry'] = None
+            if statusProperty is not None:
+                _properties(feature)[statusProperty] = int(status[i])
+            yield feature
+
+
+def annotateStream(source, destination, mgrsProperty='mgrs', precision=5, batchSize=BATCH_SIZE,
+                   statusProperty=None, textSequence=False):
+    """ Reads newline-delimited GeoJSON or GeoJSON text sequence from the
+    source, adds MGRS coordinate string property to each feature and
+    writes them to the destination.
+
+    @param source - text file-like object or iterable of lines
+    @param destination - writable text file-like object
+    @param mgrsProperty - name of the property to store MGRS coordinate string
+    @param precision - precision level of MGRS strings
+    @param batchSize - number of features converted at once
+    @param statusProperty - name of the property to store conversion status
+    code or None if status codes should not be stored
+    @param textSequence - if True output is written as GeoJSON text sequence
+    (RFC 8142), otherwise as newline-delimited GeoJSON
+    @returns - number of written features
+    """
+    features = annotateFeatures(readFeatures(source), mgrsProperty, precision, batchSize, statusProperty)
+    return writeFeatures(features, destination, textSequence)
+
+
+def locateStream(source, destination, mgrsProperty='mgrs', batchSize=BATCH_SIZE,
+                 statusProperty=None, textSequence=False):
+    """ Reads newline-delimited GeoJSON or GeoJSON text sequence from the
+    source, sets geometry of each feature to the Point located at its MGRS
+    coordinate string property and writes them to the destination.
+
+    @param source - text file-like object or iterable of lines
+    @param destination - writable text file-like object
+    @param mgrsProperty - name of the property with MGRS coordinate string
+    @param batchSize - number of features converted at once
+    @param statusProperty - name of the property to store conversion status
+    code or None if status codes should not be stored
+    @param textSequence - if True output is written as GeoJSON text sequence
+    (RFC 8142), otherwise as newline-delimited GeoJSON
+    @returns - number of written features
+    """
+    features = locateFeatures(readFeatures(source), mgrsProperty, batchSize, statusProperty)
+    return writeFeatures(features, destination, textSequence)
+
+
+def readFeatures(source):
+    """ Incrementally reads GeoJSON features from newline-delimited GeoJSON
+    or GeoJSON text sequence (RFC 8142)
+
+    @param source - text file-like object or iterable of lines
+    @returns - iterator over GeoJSON feature dictionaries
+    """
+    record = []
+    for line in source:
+        if line.startswith(RS):
+            if record:
+                yield json.loads(''.join(record))
+            record = [line.lstrip(RS)]
+        elif record and record[0].strip():
+            # continuation of the multi-line text sequence record
+            record.append(line)
+        elif line.strip():
+            yield json.loads(line)
+
+    if record and ''.join(record).strip():
+        yield json.loads(''.join(record))
+
+
+def writeFeatures(features, destination, textSequence=False):
+    """ Writes GeoJSON features as newline-delimited GeoJSON or GeoJSON
+    text sequence (RFC 8142)
+
+    @param features - iterable of GeoJSON feature dictionaries
+    @param destination - writable text file-like object
+    @param textSequence - if True output is written as GeoJSON text sequence,
+    otherwise as newline-delimited GeoJSON
+    @returns - number of written features
+    """
+    prefix = RS if textSequence else ''
+    count = 0
+    for feature in features:
+        destination.write(prefix + json.dumps(feature, separators=(',', ':')) + '\n')
+        count += 1
+
+    return count
+
+
+def _chunks(iterable, size):
+    """ Splits iterable into lists of the given size
+
+    @param iterable - iterable to split
+    @param size - maximum chunk size
+    @returns - iterator over lists
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _pointCoordinates(feature):
+    """ Returns coordinates of the feature Point geometry
+
+    @param feature - GeoJSON feature dictionary
+    @returns - list of coordinates or None if feature has no Point geometry
+    """
+    geometry = feature.get('geometry')
+    if not geometry or geometry.get('type') != 'Point':
+        return None
+
+    coordinates = geometry.get('coordinates')
+    if not coordinates or len(coordinates) < 2:
+        return None
+
+    return coordinates
+
+
+def _properties(feature):
+    """ Returns feature properties dictionary, creating it if needed
+
+    @param feature - GeoJSON feature dictionary
+    @returns - properties dictionary
+    """
+    if feature.get('properties') is None:
+        feature['properties'] = {}
+
+    return feature['properties']
@@ -0,0 +1,638 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    grid.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import math
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import validation
+
+
+A = mgrs.ALPHABET
+
+# WGS84 ellipsoid and UTM projection parameters
+_SEMI_MAJOR = 6378137.0
+_FLATTENING = 1 / 298.257223563
+_K0 = 0.9996
+_FALSE_EASTING = 500000.0
+_FALSE_NORTHING = 10000000.0
+_UPS_K0 = 0.994
+_UPS_FALSE_EASTING_NORTHING = 2000000.0
+
+# Krueger series coefficients for the inverse transverse Mercator projection
+_N = _FLATTENING / (2 - _FLATTENING)
+_RECTIFYING_RADIUS = _SEMI_MAJOR / (1 + _N) * (1 + _N ** 2 / 4 + _N ** 4 / 64)
+_ALPHA = [_N / 2 - 2 * _N ** 2 / 3 + 5 * _N ** 3 / 16,
+          13 * _N ** 2 / 48 - 3 * _N ** 3 / 5,
+          61 * _N ** 3 / 240]
+_BETA = [_N / 2 - 2 * _N ** 2 / 3 + 37 * _N ** 3 / 96,
+         _N ** 2 / 48 + _N ** 3 / 15,
+         17 * _N ** 3 / 480]
+_DELTA = [2 * _N - 2 * _N ** 2 / 3 - 2 * _N ** 3,
+          7 * _N ** 2 / 3 - 8 * _N ** 3 / 5,
+          56 * _N ** 3 / 15]
+
+# polar stereographic projection constant
+_ECCENTRICITY = math.sqrt(_FLATTENING * (2 - _FLATTENING))
+_UPS_SCALE = 2 * _SEMI_MAJOR * _UPS_K0 / math.sqrt((1 + _ECCENTRICITY) ** (1 + _ECCENTRICITY) *
+                                                    (1 - _ECCENTRICITY) ** (1 - _ECCENTRICITY))
+
+# LATITUDE_BANDS values indexed by the band letter
+_BAND_LETTERS = np.array([band[0] for band in mgrs.LATITUDE_BANDS])
+_BAND_MIN_NORTHING = np.zeros(26)
+_BAND_NORTHING_OFFSET = np.zeros(26)
+for band in mgrs.LATITUDE_BANDS:
+    _BAND_MIN_NORTHING[band[0]] = band[1]
+    _BAND_NORTHING_OFFSET[band[0]] = band[4]
+
+_ZERO = ord('0')
+_SPACE = ord(' ')
+
+
+def utmToMgrs(zone, hemisphere, easting, northing, precision=5, latitude=None):
+    """ Converts UTM coordinates to MGRS coordinate strings without any
+    coordinate transformations. Accepts scalars or arrays.
+
+    @param zone - UTM zone number
+    @param hemisphere - hemisphere either 'N' or 'S'
+    @param easting - easting/X in meters
+    @param northing - northing/Y in meters
+    @param precision - precision level of MGRS string
+    @param latitude - latitude value used to select latitude band, if not
+    given it is calculated from the UTM coordinates
+    @returns - MGRS coordinate string or array of strings
+    """
+    scalar = _isScalar(zone, hemisphere, easting, northing, precision, latitude)
+    north = _north(hemisphere)
+    if latitude is None:
+        latitude = utmToWgs(zone, hemisphere, easting, northing)[0]
+
+    zone, north, easting, northing, precision, latitude = np.broadcast_arrays(
+        np.asarray(zone), north, np.asarray(easting, dtype=np.float64), np.asarray(northing, dtype=np.float64),
+        np.asarray(precision), np.asarray(latitude, dtype=np.float64))
+
+    result, status = _utmToMgrs(zone.ravel(), north.ravel(), latitude.ravel(), easting.ravel(),
+                                northing.ravel(), precision.ravel())
+    _check(status)
+    return _result(scalar, result.reshape(zone.shape))
+
+
+def upsToMgrs(hemisphere, easting, northing, precision=5):
+    """ Converts UPS coordinates to MGRS coordinate strings without any
+    coordinate transformations. Accepts scalars or arrays.
+
+    @param hemisphere - hemisphere either 'N' or 'S'
+    @param easting - easting/X in meters
+    @param northing - northing/Y in meters
+    @param precision - precision level of MGRS string
+    @returns - MGRS coordinate string or array of strings
+    """
+    scalar = _isScalar(hemisphere, easting, northing, precision)
+    north, easting, northing, precision = np.broadcast_arrays(
+        _north(hemisphere), np.asarray(easting, dtype=np.float64), np.asarray(northing, dtype=np.float64),
+        np.asarray(precision))
+
+    result, status = _upsToMgrs(north.ravel(), easting.ravel(), northing.ravel(), precision.ravel())
+    _check(status)
+    return _result(scalar, result.reshape(north.shape))
+
+
+def mgrsToUtm(mgrsStrings):
+    """ Converts MGRS coordinate strings to UTM coordinates without any
+    coordinate transformations, with the same semantics as toWgs().
+    Accepts single string or array of strings.
+
+    @param mgrsStrings - MGRS coordinate string or array of strings
+    @returns - tuple containing UTM zone, hemisphere, easting and northing
+    (scalars or arrays)
+    """
+    return _fromMgrs(mgrsStrings, True)
+
+
+def mgrsToUps(mgrsStrings):
+    """ Converts MGRS coordinate strings to UPS coordinates without any
+    coordinate transformations, with the same semantics as toWgs().
+    Accepts single string or array of strings.
+
+    @param mgrsStrings - MGRS coordinate string or array of strings
+    @returns - tuple containing hemisphere, easting and northing
+    (scalars or arrays)
+    """
+    return _fromMgrs(mgrsStrings, False)[1:]
+
+
+def utmToWgs(zone, hemisphere, easting, northing):
+    """ Converts UTM coordinates to geodetic (latitude and longitude)
+    coordinates using Krueger series (accurate to a few millimeters within
+    the zone). Accepts scalars or arrays.
+
+    @param zone - UTM zone number
+    @param hemisphere - hemisphere either 'N' or 'S'
+    @param easting - easting/X in meters
+    @param northing - northing/Y in meters
+    @returns - tuple containing latitude and longitude
+    """
+    scalar = _isScalar(zone, hemisphere, easting, northing)
+    north = _north(hemisphere)
+    latitude, longitude = _utmToWgs(np.asarray(zone), north, np.asarray(easting, dtype=np.float64),
+                                    np.asarray(northing, dtype=np.float64))
+    if scalar:
+        return float(latitude), float(longitude)
+
+    return latitude, longitude
+
+
+def upsToWgs(hemisphere, easting, northing):
+    """ Converts UPS coordinates to geodetic (latitude and longitude)
+    coordinates. Accepts scalars or arrays.
+
+    @param hemisphere - hemisphere either 'N' or 'S'
+    @param easting - easting/X in meters
+    @param northing - northing/Y in meters
+    @returns - tuple containing latitude and longitude
+    """
+    scalar = _isScalar(hemisphere, easting, northing)
+    latitude, longitude = _upsToWgs(_north(hemisphere), np.asarray(easting, dtype=np.float64),
+                                    np.asarray(northing, dtype=np.float64))
+    if scalar:
+        return float(latitude), float(longitude)
+
+    return latitude, longitude
+
+
+def _fromMgrs(mgrsStrings, utm):
+    """ Converts MGRS coordinate strings to UTM or UPS coordinates
+
+    @param mgrsStrings - MGRS coordinate string or array of strings
+    @param utm - True if strings must contain UTM zone, False if they
+    must not
+    @returns - tuple containing zone, hemisphere, easting and northing
+    """
+    scalar = np.ndim(mgrsStrings) == 0
+    codes, shape = validation._codes(mgrsStrings)
+    status, zone, letters, easting, northing, precision, digits = validation._parse(codes)
+    status[(status == mgrs.STATUS_OK) & ((zone > 0) != utm)] = mgrs.STATUS_MALFORMED
+    _check(status)
+
+    north, easting, northing = _mgrsToGrid(zone, letters, easting, northing)
+    hemisphere = np.where(north, 'N', 'S')
+    if scalar:
+        return int(zone[0]), str(hemisphere[0]), float(easting[0]), float(northing[0])
+
+    return zone.reshape(shape), hemisphere.reshape(shape), easting.reshape(shape), northing.reshape(shape)
+
+
+def _utmToMgrs(zone, north, latitude, easting, northing, precision):
+    """ Vectorized version of _utmToMgrs(), which does not raise exceptions
+
+    @param zone - array of UTM zone numbers
+    @param north - boolean array, True for northern hemisphere
+    @param latitude - array of latitude values
+    @param easting - array of eastings in meters
+    @param northing - array of northings in meters
+    @param precision - array of precision levels
+    @returns - tuple containing array of MGRS coordinate strings (empty
+    for failed rows) and array of status codes
+    """
+    components, status = _utmToComponents(zone, north, latitude, easting, northing, precision)
+    return _format(components, status), status
+
+
+def _utmToComponents(zone, north, latitude, easting, northing, precision):
+    """ Calculates MGRS components for UTM coordinates
+
+    @param zone - array of UTM zone numbers
+    @param north - boolean array, True for northern hemisphere
+    @param latitude - array of latitude values
+    @param easting - array of eastings in meters
+    @param northing - array of northings in meters
+    @param precision - array of precision levels
+    @returns - tuple containing MGRS components (see _components()) and
+    array of status codes
+    """
+    status = np.zeros(len(zone), dtype=np.uint8)
+    _fail(status, (zone < 1) | (zone > 60), mgrs.STATUS_INVALID_ZONE_BAND)
+    _fail(status, ~((precision >= 0) & (precision <= mgrs.MAX_PRECISION) & (precision == np.floor(precision))),
+          mgrs.STATUS_PRECISION)
+    _fail(status, ~((easting >= 100000) & (easting <= 900000)), mgrs.STATUS_EASTING_RANGE)
+    _fail(status, ~((northing >= 0) & (northing <= 10000000)), mgrs.STATUS_NORTHING_RANGE)
+
+    special = (latitude <= 0.0) & (northing == 1.0e7)
+    latitude = np.where(special, 0.0, latitude)
+    northing = np.where(special, 0.0, northing)
+
+    band = _latitudeLetter(latitude)
+    _fail(status, band < 0, mgrs.STATUS_LATITUDE_RANGE)
+
+    # avoid invalid values in calculations below
+    ok = status == mgrs.STATUS_OK
+    zone = np.where(ok, zone, 1).astype(np.int64)
+    band = np.where(ok, band, A['N'])
+    easting = np.where(ok, easting, 500000.0)
+    northing = np.where(ok, northing, 0.0)
+    precision = np.where(ok, precision, 0).astype(np.int64)
+
+    ltr2LowValue, patternOffset = _gridValues(zone)
+
+    northing = np.where(northing >= mgrs.TWOMIL, np.fmod(northing, mgrs.TWOMIL), northing)
+    northing = northing + patternOffset
+    northing = np.where(northing >= mgrs.TWOMIL, northing - mgrs.TWOMIL, northing)
+
+    row = np.trunc(northing / mgrs.ONEHT).astype(np.int64)
+    row += row > A['H']
+    row += row > A['N']
+
+    easting = np.where((band == A['V']) & (zone == 31) & (easting == 500000.0), easting - 1.0, easting)
+    column = ltr2LowValue + np.trunc(easting / mgrs.ONEHT - 1).astype(np.int64)
+    column += (ltr2LowValue == A['J']) & (column > A['N'])
+
+    return _components(zone, band, column, row, easting, northing, precision), status
+
+
+def _upsToMgrs(north, easting, northing, precision):
+    """ Vectorized version of _upsToMgrs(), which does not raise exceptions
+
+    @param north - boolean array, True for northern hemisphere
+    @param easting - array of eastings in meters
+    @param northing - array of northings in meters
+    @param precision - array of precision levels
+    @returns - tuple containing array of MGRS coordinate strings (empty
+    for failed rows) and array of status codes
+    """
+    components, status = _upsToComponents(north, easting, northing, precision)
+    return _format(components, status), status
+
+
+def _upsToComponents(north, easting, northing, precision):
+    """ Calculates MGRS components for UPS coordinates
+
+    @param north - boolean array, True for northern hemisphere
+    @param easting - array of eastings in meters
+    @param northing - array of northings in meters
+    @param precision - array of precision levels
+    @returns - tuple containing MGRS components (see _components()) and
+    array of status codes
+    """
+    status = np.zeros(len(north), dtype=np.uint8)
+    _fail(status, ~((easting >= mgrs.MIN_EAST_NORTH) & (easting <= mgrs.MAX_EAST_NORTH)), mgrs.STATUS_EASTING_RANGE)
+    _fail(status, ~((northing >= mgrs.MIN_EAST_NORTH) & (northing <= mgrs.MAX_EAST_NORTH)),
+          mgrs.STATUS_NORTHING_RANGE)
+    _fail(status, ~((precision >= 0) & (precision <= mgrs.MAX_PRECISION) & (precision == np.floor(precision))),
+          mgrs.STATUS_PRECISION)
+
+    ok = status == mgrs.STATUS_OK
+    easting = np.where(ok, easting, mgrs.TWOMIL)
+    northing = np.where(ok, northing, mgrs.TWOMIL)
+    precision = np.where(ok, precision, 0).astype(np.int64)
+
+    east = easting >= mgrs.TWOMIL
+    first = np.where(north, np.where(east, A['Z'], A['Y']), np.where(east, A['B'], A['A']))
+    constants = validation._UPS_CONSTANTS[validation._UPS_INDEX[first]]
+
+    row = np.trunc((northing - constants[:, 5]) / mgrs.ONEHT).astype(np.int64)
+    row += row > A['H']
+    row += row > A['N']
+
+    column = constants[:, 1].astype(np.int64) + np.trunc((easting - constants[:, 4]) / mgrs.ONEHT).astype(np.int64)
+    west = ~east
+    column += 3 * (west & (column > A['L']))
+    column += 2 * (west & (column > A['U']))
+    column += 2 * (east & (column > A['C']))
+    column += 1 * (east & (column > A['H']))
+    column += 3 * (east & (column > A['L']))
+
+    # corners of the UPS square are outside of the MGRS polar grid
+    _fail(status, (row < 0) | (row > constants[:, 3]) | (column < constants[:, 1]) | (column > constants[:, 2]),
+          mgrs.STATUS_INVALID_LETTER)
+    row = np.clip(row, 0, 25)
+    column = np.clip(column, 0, 25)
+
+    zone = np.zeros(len(north), dtype=np.int64)
+    return _components(zone, first, column, row, easting, northing, precision), status
+
+
+def _mgrsToGrid(zone, letters, easting, northing):
+    """ Vectorized version of _mgrsToUtm() and _mgrsToUps() working on
+    components returned by the validation._parse(). Rows must be valid.
+
+    @param zone - array of UTM zones, 0 for UPS
+    @param letters - matrix of MGRS letters, one row per string
+    @param easting - array of eastings as written in MGRS strings
+    @param northing - array of northings as written in MGRS strings
+    @returns - tuple containing boolean array (True for northern hemisphere),
+    arrays of eastings and northings
+    """
+    band, column, row = letters[:, 0], letters[:, 1], letters[:, 2]
+    utm = zone > 0
+
+    # UTM
+    ltr2LowValue, patternOffset = _gridValues(np.where(utm, zone, 1))
+    rowLetterNorthing = row * mgrs.ONEHT
+    rowLetterNorthing -= mgrs.ONEHT * (row > A['O'])
+    rowLetterNorthing -= mgrs.ONEHT * (row > A['I'])
+    rowLetterNorthing = np.where(rowLetterNorthing >= mgrs.TWOMIL, rowLetterNorthing - mgrs.TWOMIL,
+                                 rowLetterNorthing)
+    utmEasting = (column - ltr2LowValue + 1) * mgrs.ONEHT
+    utmEasting -= mgrs.ONEHT * ((ltr2LowValue == A['J']) & (column > A['O']))
+
+    utmNorthing = rowLetterNorthing - patternOffset
+    utmNorthing = np.where(utmNorthing < 0, utmNorthing + mgrs.TWOMIL, utmNorthing)
+    utmNorthing += _BAND_NORTHING_OFFSET[band]
+    utmNorthing = np.where(utmNorthing < _BAND_MIN_NORTHING[band], utmNorthing + mgrs.TWOMIL, utmNorthing)
+
+    # UPS
+    constants = validation._UPS_CONSTANTS[np.maximum(validation._UPS_INDEX[band], 0)]
+    upsNorthing = row * mgrs.ONEHT + constants[:, 5]
+    upsNorthing -= mgrs.ONEHT * (row > A['I'])
+    upsNorthing -= mgrs.ONEHT * (row > A['O'])
+
+    ltr2LowValue = constants[:, 1]
+    upsEasting = (column - ltr2LowValue) * mgrs.ONEHT + constants[:, 4]
+    fromA = ltr2LowValue == A['A']
+    upsEasting -= 300000.0 * (~fromA & (column > A['L']))
+    upsEasting -= 200000.0 * (~fromA & (column > A['U']))
+    upsEasting -= 200000.0 * (fromA & (column > A['C']))
+    upsEasting -= mgrs.ONEHT * (fromA & (column > A['I']))
+    upsEasting -= 300000.0 * (fromA & (column > A['L']))
+
+    north = np.where(utm, band >= A['N'], band >= A['Y'])
+    easting = easting + np.where(utm, utmEasting, upsEasting)
+    northing = northing + np.where(utm, utmNorthing, upsNorthing)
+    return north, easting, northing
+
+
+def _components(zone, band, column, row, easting, northing, precision):
+    """ Truncates eastings and northings to the given precision, like
+    _mgrsString() does
+
+    @param zone - array of UTM zones, 0 for UPS
+    @param band - array of the first MGRS letters
+    @param column - array of the second MGRS letters
+    @param row - array of the third MGRS letters
+    @param easting - array of eastings
+    @param northing - array of northings
+    @param precision - array of precision levels
+    @returns - tuple containing arrays of zones, letters, easting and
+    northing (as written in MGRS string) and precision levels
+    """
+    divisor = 10 ** (mgrs.MAX_PRECISION - precision)
+    easting = np.fmod(easting + 1e-8, mgrs.ONEHT)
+    easting = np.trunc(np.where(easting >= 99999.5, 99999.0, easting)).astype(np.int64) // divisor
+    northing = np.fmod(northing + 1e-8, mgrs.ONEHT)
+    northing = np.trunc(np.where(northing >= 99999.5, 99999.0, northing)).astype(np.int64) // divisor
+    return zone, band, column, row, easting, northing, precision
+
+
+def _format(components, status=None):
+    """ Vectorized version of _mgrsString()
+
+    @param components - tuple containing arrays of zones (0 for UPS),
+    letters, easting and northing (as written in MGRS string) and
+    precision levels
+    @param status - array of status codes, failed rows get empty strings
+    @returns - array of MGRS coordinate strings
+    """
+    zone, band, column, row, easting, northing, precision = [np.asarray(c, dtype=np.int64) for c in components]
+    out = np.zeros((len(zone), validation.MAX_LENGTH), dtype=np.uint32)
+    out[:, 0] = np.where(zone > 0, zone // 10 + _ZERO, _SPACE)
+    out[:, 1] = np.where(zone > 0, zone % 10 + _ZERO, _SPACE)
+    out[:, 2] = band + ord('A')
+    out[:, 3] = column + ord('A')
+    out[:, 4] = row + ord('A')
+
+    for k in range(mgrs.MAX_PRECISION):
+        rows = np.flatnonzero(k < precision)
+        divisor = 10 ** (precision[rows] - 1 - k)
+        out[rows, 5 + k] = easting[rows] // divisor % 10 + _ZERO
+        out[rows, 5 + precision[rows] + k] = northing[rows] // divisor % 10 + _ZERO
+
+    if status is not None:
+        out[status != mgrs.STATUS_OK] = 0
+    return np.ascontiguousarray(out).view('U%d' % validation.MAX_LENGTH).ravel()
+
+
+def _utmToWgs(zone, north, easting, northing):
+    """ Inverse transverse Mercator projection using Krueger series
+
+    @param zone - array of UTM zone numbers
+    @param north - boolean array, True for northern hemisphere
+    @param easting - array of eastings in meters
+    @param northing - array of northings in meters
+    @returns - tuple containing arrays of latitudes and longitudes
+    """
+    xi = (northing - np.where(north, 0.0, _FALSE_NORTHING)) / (_K0 * _RECTIFYING_RADIUS)
+    eta = (easting - _FALSE_EASTING) / (_K0 * _RECTIFYING_RADIUS)
+
+    xiPrime = xi.copy()
+    etaPrime = eta.copy()
+    for j, beta in enumerate(_BETA, 1):
+        xiPrime = xiPrime - beta * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        etaPrime = etaPrime - beta * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+
+    chi = np.arcsin(np.sin(xiPrime) / np.cosh(etaPrime))
+    latitude = chi.copy()
+    for j, delta in enumerate(_DELTA, 1):
+        latitude = latitude + delta * np.sin(2 * j * chi)
+
+    centralMeridian = np.radians(zone * 6.0 - 183.0)
+    longitude = centralMeridian + np.arctan2(np.sinh(etaPrime), np.cos(xiPrime))
+    return np.degrees(latitude), (np.degrees(longitude) + 180.0) % 360.0 - 180.0
+
+
+def _wgsToUtm(zone, north, latitude, longitude):
+    """ Transverse Mercator projection using Krueger series
+
+    @param zone - array of UTM zone numbers
+    @param north - boolean array, True for northern hemisphere
+    @param latitude - array of latitude values
+    @param longitude - array of longitude values
+    @returns - tuple containing arrays of eastings and northings
+    """
+    phi = np.radians(latitude)
+    lam = np.radians((longitude - (zone * 6.0 - 183.0) + 180.0) % 360.0 - 180.0)
+
+    c = 2 * math.sqrt(_N) / (1 + _N)
+    t = np.sinh(np.arctanh(np.sin(phi)) - c * np.arctanh(c * np.sin(phi)))
+    xiPrime = np.arctan2(t, np.cos(lam))
+    etaPrime = np.arctanh(np.sin(lam) / np.sqrt(1 + t * t))
+
+    xi = xiPrime.copy()
+    eta = etaPrime.copy()
+    for j, alpha in enumerate(_ALPHA, 1):
+        xi = xi + alpha * np.sin(2 * j * xiPrime) * np.cosh(2 * j * etaPrime)
+        eta = eta + alpha * np.cos(2 * j * xiPrime) * np.sinh(2 * j * etaPrime)
+
+    easting = _FALSE_EASTING + _K0 * _RECTIFYING_RADIUS * eta
+    northing = np.where(north, 0.0, _FALSE_NORTHING) + _K0 * _RECTIFYING_RADIUS * xi
+    return easting, northing
+
+
+def _upsToWgs(north, easting, northing):
+    """ Inverse polar stereographic projection
+
+    @param north - boolean array, True for northern hemisphere
+    @param easting - array of eastings in meters
+    @param northing - array of northings in meters
+    @returns - tuple containing arrays of latitudes and longitudes
+    """
+    dx = easting - _UPS_FALSE_EASTING_NORTHING
+    dy = northing - _UPS_FALSE_EASTING_NORTHING
+    chi = np.pi / 2 - 2 * np.arctan(np.hypot(dx, dy) / _UPS_SCALE)
+    latitude = chi.copy()
+    for j, delta in enumerate(_DELTA, 1):
+        latitude = latitude + delta * np.sin(2 * j * chi)
+
+    longitude = np.arctan2(dx, np.where(north, -dy, dy))
+    return np.where(north, 1.0, -1.0) * np.degrees(latitude), np.degrees(longitude)
+
+
+def _wgsToUps(north, latitude, longitude):
+    """ Polar stereographic projection
+
+    @param north - boolean array, True for northern hemisphere
+    @param latitude - array of latitude values
+    @param longitude - array of longitude values
+    @returns - tuple containing arrays of eastings and northings
+    """
+    phi = np.radians(np.abs(latitude))
+    lam = np.radians(longitude)
+    e = _ECCENTRICITY * np.sin(phi)
+    chi = 2 * np.arctan(np.tan(np.pi / 4 + phi / 2) * ((1 - e) / (1 + e)) ** (_ECCENTRICITY / 2)) - np.pi / 2
+    rho = _UPS_SCALE * np.tan(np.pi / 4 - chi / 2)
+    easting = _UPS_FALSE_EASTING_NORTHING + rho * np.sin(lam)
+    northing = _UPS_FALSE_EASTING_NORTHING + np.where(north, -1.0, 1.0) * rho * np.cos(lam)
+    return easting, northing
+
+
+def _wgsToGrid(zone, north, latitude, longitude):
+    """ Converts geodetic coordinates to UTM or UPS coordinates
+
+    @param zone - array of UTM zone numbers, 0 for UPS
+    @param north - boolean array, True for northern hemisphere
+    @param latitude - array of latitude values
+    @param longitude - array of longitude values
+    @returns - tuple containing arrays of eastings and northings
+    """
+    utm = zone > 0
+    easting, northing = _wgsToUtm(np.where(utm, zone, 31), north, np.where(utm, latitude, 0.0),
+                                   np.where(utm, longitude, 3.0))
+    upsEasting, upsNorthing = _wgsToUps(north, latitude, longitude)
+    return np.where(utm, easting, upsEasting), np.where(utm, northing, upsNorthing)
+
+
+def _gridToWgs(zone, north, easting, northing):
+    """ Converts UTM or UPS coordinates to geodetic coordinates
+
+    @param zone - array of UTM zone numbers, 0 for UPS
+    @param north - boolean array, True for northern hemisphere
+    @param easting - array of eastings in meters
+    @param northing - array of northings in meters
+    @returns - tuple containing arrays of latitudes and longitudes
+    """
+    utm = zone > 0
+    latitude, longitude = _utmToWgs(np.where(utm, zone, 31), north, easting, northing)
+    upsLatitude, upsLongitude = _upsToWgs(north, easting, northing)
+    return np.where(utm, latitude, upsLatitude), np.where(utm, longitude, upsLongitude)
+
+
+def _gridValues(zone):
+    """ Vectorized version of _gridValues()
+
+    @param zone - array of UTM zone numbers
+    @returns - tuple containing arrays of 2nd letter low values and
+    pattern offsets
+    """
+    setNumber = np.where(zone % 6 == 0, 6, zone % 6)
+    ltr2LowValue = validation._UTM_LTR2_LOW[(setNumber - 1) % 3]
+    patternOffset = np.where(setNumber % 2 == 1, 0.0, 500000.0)
+    return ltr2LowValue, patternOffset
+
+
+def _latitudeLetter(latitude):
+    """ Vectorized version of _latitudeLetter()
+
+    @param latitude - array of latitude values
+    @returns - array of latitude band letters, -1 for latitudes outside
+    of the UTM area
+    """
+    with np.errstate(invalid='ignore'):
+        inside = (latitude > -80.5) & (latitude < 72)
+        idx = np.trunc(np.where(inside, (latitude + 80.0) / 8.0 + 1.0e-12, 0)).astype(np.int64)
+        return np.where((latitude >= 72) & (latitude < 84.5), A['X'],
+                        np.where(inside, _BAND_LETTERS[np.clip(idx, 0, len(_BAND_LETTERS) - 1)], -1))
+
+
+def _north(hemisphere):
+    """ Converts hemisphere values to boolean array
+
+    @param hemisphere - hemisphere either 'N' or 'S' (or array)
+    @returns - boolean array, True for northern hemisphere
+    """
+    hemisphere = np.asarray(hemisphere)
+    if not np.isin(hemisphere, ['N', 'S']).all():
+        raise mgrs.MgrsException('Invalid hemisphere ("N" or "S").')
+
+    return hemisphere == 'N'
+
+
+def _fail(status, condition, code):
+    """ Sets status code for rows which are not failed yet
+
+    @param status - array of status codes
+    @param condition - boolean array
+    @param code - status code
+    """
+    status[(status == mgrs.STATUS_OK) & condition] = code
+
+
+def _check(status):
+    """ Raises MgrsException for the first failed row
+
+    @param status - array of status codes
+    """
+    failed = np.flatnonzero(status != mgrs.STATUS_OK)
+    if len(failed):
+        raise mgrs.MgrsException(mgrs.STATUS_MESSAGES[status[failed[0]]])
+
+
+def _isScalar(*values):
+    """ Checks whether all given values are scalars
+
+    @returns - True if all values are scalars
+    """
+    return all(np.ndim(v) == 0 for v in values)
+
+
+def _result(scalar, values):
+    """ Returns single string for scalar input
+
+    @param scalar - True if input was scalar
+    @param values - array of strings
+    @returns - string or array of strings
+    """
+    return str(values.ravel()[0]) if scalar else values
@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    gridlines.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import math
+import functools
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+
+
+# southern and northern limits of the UTM area
+MIN_LATITUDE = -80.0
+MAX_LATITUDE = 84.0
+
+# maximum distance in meters between vertices of the densified lines
+STEP = 5000.0
+
+# the finest supported line spacing is 10 m
+MAX_LINE_PRECISION = 4
+
+# number of cached grid zones and 100 km squares
+CACHE_SIZE = 4096
+
+# longitude ranges of the Svalbard zones, missing zones are None
+_X_ZONES = {31: (0.0, 9.0), 32: None, 33: (9.0, 21.0), 34: None, 35: (21.0, 33.0), 36: None, 37: (33.0, 42.0)}
+
+# number of vertices per edge when projecting grid zones to UTM
+_EDGE_SAMPLES = 32
+
+# allowance in meters for the curvature of the projected extent edges
+_WINDOW_MARGIN = 1000.0
+
+
+def gridLines(south, west, north, east, precision=0, step=STEP):
+    """ Generates MGRS grid lines for the latitude and longitude extent.
+    Lines are calculated in UTM space and densified, so they follow grid
+    curvature. Extent must not cross the antimeridian, polar (UPS) areas
+    are not covered.
+
+    @param south - minimum latitude of the extent
+    @param west - minimum longitude of the extent
+    @param north - maximum latitude of the extent
+    @param east - maximum longitude of the extent
+    @param precision - precision of the finest lines: 0 gives only grid zone
+    and 100 km square boundaries, 1 adds 10 km lines and so on
+    @param step - maximum distance in meters between line vertices
+    @returns - list of (kind, label, coordinates) tuples, where kind is
+    'gzd', 'square' or 'line', label is the grid zone designator, 100 km
+    square identifier or line value and coordinates is array of
+    (longitude, latitude) pairs
+    """
+    precision = _checkPrecision(precision)
+    lines = []
+    for gzd in _gzds(south, west, north, east):
+        for kind, label, coordinates in _gzdLines(*gzd):
+            lines.extend((kind, label, c) for c in _clip(coordinates, south, west, north, east))
+
+        window = _utmWindow(gzd, south, west, north, east)
+        for square in _squares(gzd, window):
+            lines.extend(_squareParts(gzd, square, precision, step, window, south, west, north, east))
+
+    return lines
+
+
+def gridLabels(south, west, north, east, precision=0, step=STEP):
+    """ Generates label anchor points for the MGRS grid lines in the
+    latitude and longitude extent, see gridLines() for details
+
+    @param south - minimum latitude of the extent
+    @param west - minimum longitude of the extent
+    @param north - maximum latitude of the extent
+    @param east - maximum longitude of the extent
+    @param precision - precision of the finest lines
+    @param step - maximum distance in meters between line vertices
+    @returns - list of (kind, label, longitude, latitude) tuples, grid zones
+    and 100 km squares are labelled at their centres, other lines at their
+    southern or western end
+    """
+    precision = _checkPrecision(precision)
+    labels = []
+    for gzd in _gzds(south, west, north, east):
+        zone, band, lat0, lat1, lon0, lon1 = gzd
+        lat0, lat1 = max(lat0, south), min(lat1, north)
+        lon0, lon1 = max(lon0, west), min(lon1, east)
+        labels.append(('gzd', _gzdLabel(zone, band), (lon0 + lon1) / 2, (lat0 + lat1) / 2))
+
+        window = _utmWindow(gzd, south, west, north, east)
+        for square in _squares(gzd, window):
+            anchor = _squareAnchor(gzd, square)
+            if anchor is not None and south <= anchor[1] <= north and west <= anchor[0] <= east:
+                labels.append(('square', anchor[2], anchor[0], anchor[1]))
+
+            if precision > 0:
+                for kind, label, c in _squareParts(gzd, square, precision, step, window, south, west, north, east):
+                    if kind == 'line':
+                        labels.append((kind, label, float(c[0, 0]), float(c[0, 1])))
+
+    return labels
+
+
+def gridFeatures(south, west, north, east, precision=0, step=STEP):
+    """ Generates MGRS grid lines and label anchors as GeoJSON features with
+    'kind' and 'label' properties, see gridLines() and gridLabels()
+
+    @param south - minimum latitude of the extent
+    @param west - minimum longitude of the extent
+    @param north - maximum latitude of the extent
+    @param east - maximum longitude of the extent
+    @param precision - precision of the finest lines
+    @param step - maximum distance in meters between line vertices
+    @returns - list of GeoJSON feature dictionaries
+    """
+    features = []
+    for kind, label, coordinates in gridLines(south, west, north, east, precision, step):
+        features.append({'type': 'Feature', 'properties': {'kind': kind, 'label': label},
+                         'geometry': {'type': 'LineString', 'coordinates': coordinates.tolist()}})
+
+    for kind, label, longitude, latitude in gridLabels(south, west, north, east, precision, step):
+        features.append({'type': 'Feature', 'properties': {'kind': kind, 'label': label},
+                         'geometry': {'type': 'Point', 'coordinates': [longitude, latitude]}})
+
+    return features
+
+
+def _checkPrecision(precision):
+    """ Checks line precision
+
+    @param precision - precision of the finest lines
+    @returns - precision as integer
+    """
+    if precision < 0 or precision > MAX_LINE_PRECISION or precision != int(precision):
+        raise mgrs.MgrsException('The precision must be between 0 and {} inclusive.'.format(MAX_LINE_PRECISION))
+
+    return int(precision)
+
+
+def _zoneLongitudes(zone, band):
+    """ Returns longitude range of the grid zone, taking Norway and
+    Svalbard special cases into account
+
+    @param zone - UTM zone number
+    @param band - latitude band letter
+    @returns - tuple containing minimum and maximum longitude or None if
+    grid zone does not exist
+    """
+    if band == mgrs.ALPHABET['X'] and zone in _X_ZONES:
+        return _X_ZONES[zone]
+
+    west = -180.0 + 6.0 * (zone - 1)
+    east = west + 6.0
+    if band == mgrs.ALPHABET['V']:
+        if zone == 31:
+            east = 3.0
+        elif zone == 32:
+            west = 3.0
+
+    return west, east
+
+
+def _gzds(south, west, north, east):
+    """ Finds grid zones intersecting the extent
+
+    @returns - iterator over (zone, band, south, north, west, east) tuples
+    """
+    if not -90 <= south < north <= 90:
+        raise mgrs.MgrsException('Latitude outside of valid range (-90 to 90 degrees).')
+
+    if not -180 <= west < east <= 180:
+        raise mgrs.MgrsException('Longitude outside of valid range (-180 to 180 degrees).')
+
+    for band, minNorthing, maxLatitude, minLatitude, offset in mgrs.LATITUDE_BANDS:
+        lat0 = max(minLatitude, MIN_LATITUDE)
+        lat1 = min(maxLatitude, MAX_LATITUDE)
+        if lat1 <= south or lat0 >= north:
+            continue
+
+        for zone in range(1, 61):
+            longitudes = _zoneLongitudes(zone, band)
+            if longitudes is None or longitudes[1] <= west or longitudes[0] >= east:
+                continue
+
+            yield zone, band, lat0, lat1, longitudes[0], longitudes[1]
+
+
+def _gzdLabel(zone, band):
+    return '{:02d}{}'.format(zone, chr(band + ord('A')))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _gzdLines(zone, band, south, north, west, east):
+    """ Returns grid zone boundary lines. Each grid zone provides its
+    southern and western edges, northern and eastern edges are added only
+    on the UTM area and zone 60 limits.
+
+    @returns - tuple of (kind, label, coordinates) tuples
+    """
+    label = _gzdLabel(zone, band)
+    count = int(math.ceil(max(north - south, east - west))) + 1
+    latitudes = np.linspace(south, north, count)
+    longitudes = np.linspace(west, east, count)
+
+    edges = [np.column_stack((longitudes, np.full(count, south))), np.column_stack((np.full(count, west), latitudes))]
+    if north == MAX_LATITUDE:
+        edges.append(np.column_stack((longitudes, np.full(count, north))))
+    if east == 180.0:
+        edges.append(np.column_stack((np.full(count, east), latitudes)))
+
+    # cached edges are returned by _clip() as they are
+    for e in edges:
+        e.setflags(write=False)
+    return tuple(('gzd', label, e) for e in edges)
+
+
+def _utmWindow(gzd, south, west, north, east):
+    """ Calculates UTM extent of the part of the grid zone lying inside the
+    latitude and longitude extent
+
+    @param gzd - (zone, band, south, north, west, east) tuple
+    @returns - tuple containing minimum and maximum easting, minimum and
+    maximum northing, enlarged by _WINDOW_MARGIN
+    """
+    zone, band, lat0, lat1, lon0, lon1 = gzd
+    lat0, lat1 = max(lat0, south), min(lat1, north)
+    lon0, lon1 = max(lon0, west), min(lon1, east)
+
+    t = np.linspace(0.0, 1.0, _EDGE_SAMPLES)
+    latitudes = np.concatenate((lat0 + (lat1 - lat0) * t, np.full(_EDGE_SAMPLES, lat1),
+                                lat0 + (lat1 - lat0) * t, np.full(_EDGE_SAMPLES, lat0)))
+    longitudes = np.concatenate((np.full(_EDGE_SAMPLES, lon0), lon0 + (lon1 - lon0) * t,
+                                 np.full(_EDGE_SAMPLES, lon1), lon0 + (lon1 - lon0) * t))
+    eastings, northings = grid._wgsToUtm(zone, band >= mgrs.ALPHABET['N'], latitudes, longitudes)
+    return (float(eastings.min() - _WINDOW_MARGIN), float(eastings.max() + _WINDOW_MARGIN),
+            float(northings.min() - _WINDOW_MARGIN), float(northings.max() + _WINDOW_MARGIN))
+
+
+def _squares(gzd, window):
+    """ Finds 100 km squares intersecting the UTM window of the grid zone
+
+    @param gzd - (zone, band, south, north, west, east) tuple
+    @param window - (min easting, max easting, min northing, max northing)
+    tuple, see _utmWindow()
+    @returns - tuple of (easting, northing) tuples with south-west corners
+    of the squares
+    """
+    e0, e1, n0, n1 = window
+    squares = []
+    for e in np.arange(math.floor(e0 / mgrs.ONEHT), math.ceil(e1 / mgrs.ONEHT)):
+        for n in np.arange(math.floor(n0 / mgrs.ONEHT), math.ceil(n1 / mgrs.ONEHT)):
+            squares.append((float(e * mgrs.ONEHT), float(n * mgrs.ONEHT)))
+
+    return tuple(squares)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _squareLines(gzd, square, precision, step):
+    """ Projects boundaries of the 100 km square and lines inside it. Lines
+    are not clipped, so they are shared by all extents, and arrays are
+    read-only, as they are cached.
+
+    @param gzd - (zone, band, south, north, west, east) tuple
+    @param square - (easting, northing) of the south-west square corner
+    @param precision - precision of the finest lines
+    @param step - maximum distance in meters between line vertices
+    @returns - tuple containing array of line offsets from the square
+    corner and arrays of vertical and horizontal lines, one line per row,
+    of (longitude, latitude) pairs
+    """
+    zone, band = gzd[:2]
+    easting, northing = square
+    offsets = np.arange(0.0, mgrs.ONEHT, 10 ** (mgrs.MAX_PRECISION - precision))
+    along = np.linspace(0.0, mgrs.ONEHT, int(math.ceil(mgrs.ONEHT / step)) + 1)
+
+    lines = []
+    for eastings, northings in [np.broadcast_arrays((easting + offsets)[:, None], northing + along),
+                                np.broadcast_arrays(easting + along, (northing + offsets)[:, None])]:
+        latitudes, longitudes = grid._utmToWgs(zone, band >= mgrs.ALPHABET['N'], eastings.ravel(), northings.ravel())
+        coordinates = np.column_stack((longitudes, latitudes)).reshape(len(offsets), len(along), 2)
+        coordinates.setflags(write=False)
+        lines.append(coordinates)
+
+    offsets.setflags(write=False)
+    return offsets, lines[0], lines[1]
+
+
+def _squareParts(gzd, square, precision, step, window, south, west, north, east):
+    """ Selects lines of the 100 km square lying in the UTM window and
+    clips them to the grid zone and the latitude and longitude extent
+
+    @param gzd - (zone, band, south, north, west, east) tuple
+    @param square - (easting, northing) of the south-west square corner
+    @param precision - precision of the finest lines
+    @param step - maximum distance in meters between line vertices
+    @param window - (min easting, max easting, min northing, max northing)
+    tuple, see _utmWindow()
+    @returns - list of (kind, label, coordinates) tuples
+    """
+    zone, band, lat0, lat1, lon0, lon1 = gzd
+    box = (max(lat0, south), max(lon0, west), min(lat1, north), min(lon1, east))
+    spacing = 10 ** (mgrs.MAX_PRECISION - precision)
+    offsets, vertical, horizontal = _squareLines(gzd, square, precision, float(step))
+
+    parts = []
+    for origin, low, high, lines in [(square[0], window[0], window[1], vertical),
+                                     (square[1], window[2], window[3], horizontal)]:
+        for i in np.flatnonzero((origin + offsets >= low) & (origin + offsets <= high)):
+            if offsets[i] == 0:
+                kind, label = 'square', _squareLabel(gzd, square)
+            else:
+                kind, label = 'line', str(int(offsets[i] // spacing)).zfill(precision)
+            parts.extend((kind, label, c) for c in _clip(lines[i], *box))
+
+    return parts
+
+
+def _squareLabel(gzd, square):
+    """ Returns 100 km square identifier, e.g. '18SUJ'
+
+    @param gzd - (zone, band, south, north, west, east) tuple
+    @param square - (easting, northing) of the south-west square corner
+    @returns - 100 km square identifier
+    """
+    zone, band, south, north, west, east = gzd
+    components, status = grid._utmToComponents(np.array([zone]), np.array([band >= mgrs.ALPHABET['N']]),
+                                                np.array([(south + north) / 2]), np.array([square[0] + 1.0]),
+                                                np.array([square[1] + 1.0]), np.array([0]))
+    return _gzdLabel(zone, band) + chr(components[2][0] + ord('A')) + chr(components[3][0] + ord('A'))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _squareAnchor(gzd, square):
+    """ Returns label anchor of the 100 km square, centre of the square part
+    lying inside the grid zone
+
+    @param gzd - (zone, band, south, north, west, east) tuple
+    @param square - (easting, northing) of the south-west square corner
+    @returns - tuple containing longitude, latitude and square identifier or
+    None if square does not intersect grid zone
+    """
+    zone, band, south, north, west, east = gzd
+    offsets = (np.arange(10) + 0.5) * mgrs.ONEHT / 10
+    eastings, northings = np.meshgrid(square[0] + offsets, square[1] + offsets)
+    latitudes, longitudes = grid._utmToWgs(zone, band >= mgrs.ALPHABET['N'], eastings.ravel(), northings.ravel())
+    inside = (latitudes >= south) & (latitudes <= north) & (longitudes >= west) & (longitudes <= east)
+    if not inside.any():
+        return None
+
+    return float(longitudes[inside].mean()), float(latitudes[inside].mean()), _squareLabel(gzd, square)
+
+
+def _clip(coordinates, south, west, north, east):
+    """ Clips polyline to the latitude and longitude extent, each segment
+    is clipped with the Liang-Barsky algorithm, so segments crossing the
+    extent are kept even if both their ends are outside
+
+    @param coordinates - array of (longitude, latitude) pairs
+    @returns - list of arrays with parts of polyline inside the extent,
+    polyline lying entirely inside is returned as it is
+    """
+    longitudes, latitudes = coordinates[:, 0], coordinates[:, 1]
+    if ((latitudes >= south) & (latitudes <= north) & (longitudes >= west) & (longitudes <= east)).all():
+        return [coordinates]
+
+    start = coordinates[:-1]
+    delta = coordinates[1:] - start
+    t0 = np.zeros(len(delta))
+    t1 = np.ones(len(delta))
+    visible = np.ones(len(delta), dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p, q in [(-delta[:, 0], start[:, 0] - west), (delta[:, 0], east - start[:, 0]),
+                     (-delta[:, 1], start[:, 1] - south), (delta[:, 1], north - start[:, 1])]:
+            r = q / p
+            visible &= (p != 0) | (q >= 0)
+            t0 = np.where(p < 0, np.maximum(t0, r), t0)
+            t1 = np.where(p > 0, np.minimum(t1, r), t1)
+    visible &= t0 <= t1
+
+    # visible segments continue the previous part if they join inside
+    joined = np.zeros(len(delta), dtype=bool)
+    joined[1:] = visible[:-1] & (t1[:-1] == 1) & (t0[1:] == 0)
+    segments = np.flatnonzero(visible)
+    parts = []
+    for run in np.split(segments, np.flatnonzero(~joined[segments]))[1:]:
+        points = np.vstack((start[run[0]] + t0[run[0]] * delta[run[0]],
+                            start[run] + t1[run, None] * delta[run]))
+        if (points != points[0]).any():
+            parts.append(points)
+
+    return parts
@@ -27,13 +27,16 @@ __copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
 __revision__ = '$Format:%H$'
 
 
+import re
 import math
 import itertools
+import threading
 
 from osgeo import osr
 
 
-ALPHABET = {l: c for c, l in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+ALPHABET = {l: c for c, l in enumerate(LETTERS)}
 
 ONEHT = 100000.0
 TWOMIL = 2000000.0
@@ -42,6 +45,30 @@ MAX_PRECISION = 5         # Maximum precision of easting & northing
 MIN_EAST_NORTH = 0
 MAX_EAST_NORTH = 4000000
 
+# Per-row status codes reported by non-raising batch conversions
+STATUS_OK = 0
+STATUS_LATITUDE_RANGE = 1     # Latitude outside of valid range
+STATUS_LONGITUDE_RANGE = 2    # Longitude outside of valid range
+STATUS_PRECISION = 3          # Precision outside of valid range
+STATUS_MALFORMED = 4          # MGRS string too long, too short, or badly formed
+STATUS_INVALID_LETTER = 5     # Invalid grid square letter
+STATUS_INVALID_ZONE_BAND = 6  # Invalid zone or zone/band combination
+STATUS_TRANSFORM = 7          # Coordinates can not be transformed
+STATUS_EASTING_RANGE = 8      # Easting outside of valid range
+STATUS_NORTHING_RANGE = 9     # Northing outside of valid range
+
+STATUS_MESSAGES = {STATUS_OK: 'OK',
+                   STATUS_LATITUDE_RANGE: 'Latitude outside of valid range (-90 to 90 degrees).',
+                   STATUS_LONGITUDE_RANGE: 'Longitude outside of valid range (-180 to 360 degrees).',
+                   STATUS_PRECISION: 'The precision must be between 0 and 5 inclusive.',
+                   STATUS_MALFORMED: 'An MGRS string error: string too long, too short, or badly formed',
+                   STATUS_INVALID_LETTER: 'An MGRS string error: invalid grid square letter',
+                   STATUS_INVALID_ZONE_BAND: 'An MGRS string error: invalid zone or zone/band combination',
+                   STATUS_TRANSFORM: 'Coordinates can not be transformed',
+                   STATUS_EASTING_RANGE: 'Easting outside of valid range (100,000 to 900,000 meters for UTM, 0 to 4,000,000 meters for UPS).',
+                   STATUS_NORTHING_RANGE: 'Northing outside of valid range (0 to 10,000,000 meters for UTM, 0 to 4,000,000 meters for UPS).'
+                  }
+
 # letter,
 # 2nd letter range - low,
 # 2nd letter range - high,
@@ -77,6 +104,14 @@ LATITUDE_BANDS = [(ALPHABET['C'], 1100000.0, -72.0, -80.5, 0.0),
                   (ALPHABET['X'], 7900000.0, 84.5, 72.0, 6000000.0)]
 
 
+# MGRS strings handled by the fast path of _breakMgrsString(): zone 1 to 60
+# or none, three letters except I and O, even number of digits
+_MGRS_PATTERN = re.compile(r'(0?[1-9]|[1-5][0-9]|60)?([A-HJ-NP-Za-hj-np-z]{3})((?:[0-9][0-9]){0,5})$')
+
+# Per-thread cache of coordinate transformations
+_transformations = threading.local()
+
+
 class MgrsException(Exception):
     pass
 
@@ -100,12 +135,8 @@ def toMgrs(latitude, longitude, precision=5):
         raise MgrsException('The precision must be between 0 and 5 inclusive.')
 
     hemisphere, zone, epsg = _epsgForWgs(latitude, longitude)
-    src = osr.SpatialReference()
-    src.ImportFromEPSG(4326)
-    dst = osr.SpatialReference()
-    dst.ImportFromEPSG(epsg)
-    ct = osr.CoordinateTransformation(src, dst)
-    x, y, z = ct.TransformPoint(longitude, latitude)
+    ct = _transformation(4326, epsg)
+    x, y, z = _transformPoint(ct, longitude, latitude)
 
     if (latitude < -80) or (latitude > 84):
         # Convert to UPS
@@ -117,6 +148,26 @@ def toMgrs(latitude, longitude, precision=5):
     return mgrs
 
 
+def toMgrsLevels(latitude, longitude, precisions=(1, 2, 3, 4, 5)):
+    """ Converts geodetic (latitude and longitude) coordinates to MGRS
+    coordinate strings of several precision levels. Coordinates are
+    projected and letters are calculated only once, less precise strings
+    are created by truncating digits of the most precise one.
+
+    @param latitude - latitude value
+    @param longitude - longitude value
+    @param precisions - sequence of precision levels
+    @returns - tuple containing MGRS coordinate string for each precision
+    level
+    """
+    for precision in precisions:
+        if (precision < 0) or (precision > MAX_PRECISION) or precision != int(precision):
+            raise MgrsException('The precision must be between 0 and 5 inclusive.')
+
+    mgrs = toMgrs(latitude, longitude, MAX_PRECISION)
+    return tuple(_truncate(mgrs, int(precision)) for precision in precisions)
+
+
 def toWgs(mgrs):
     """ Converts an MGRS coordinate string to geodetic (latitude and longitude)
     coordinates
@@ -124,23 +175,105 @@ def toWgs(mgrs):
     @param mgrs - MGRS coordinate string
     @returns - tuple containning latitude and longitude values
     """
-    if _checkZone(mgrs):
+    # zone digits are counted and checked by _breakMgrsString(), so the
+    # string is scanned only once
+    if mgrs.lstrip()[:1].isdigit():
         zone, hemisphere, easting, northing = _mgrsToUtm(mgrs)
     else:
         zone, hemisphere, easting, northing = _mgrsToUps(mgrs)
 
     epsg = _epsgForUtm(zone, hemisphere)
+    ct = _transformation(epsg, 4326)
+    longitude, latitude, z = _transformPoint(ct, easting, northing)
+
+    return latitude, longitude
+
+
+def toMgrsTrusted(latitude, longitude, precision=5):
+    """ Fast version of toMgrs() for pre-validated input. Latitude,
+    longitude and precision are not checked at all, so invalid values give
+    undefined results. Coordinate transformations are cached per thread.
+
+    @param latitude - latitude value (-90 to 90 degrees)
+    @param longitude - longitude value (-180 to 360 degrees)
+    @param precision - precision level of MGRS string (0 to 5)
+    @returns - MGRS coordinate string
+    """
+    hemisphere, zone, epsg = _zoneForWgs(latitude, longitude)
+    x, y, z = _transformPoint(_cachedTransformation(4326, epsg), longitude, latitude)
+
+    if (latitude < -80) or (latitude > 84):
+        return _upsToMgrs(hemisphere, x, y, precision, False)
+
+    return _utmToMgrs(zone, hemisphere, latitude, longitude, x, y, precision)
+
+
+def toWgsTrusted(mgrs):
+    """ Fast version of toWgs() for pre-validated MGRS strings. String is
+    still parsed and checked once, but coordinate transformations are
+    cached per thread.
+
+    @param mgrs - MGRS coordinate string
+    @returns - tuple containning latitude and longitude values
+    """
+    if mgrs.lstrip()[:1].isdigit():
+        zone, hemisphere, easting, northing = _mgrsToUtm(mgrs)
+    else:
+        zone, hemisphere, easting, northing = _mgrsToUps(mgrs)
+
+    epsg = (32600 if hemisphere == 'N' else 32700) + (zone or 61)
+    longitude, latitude, z = _transformPoint(_cachedTransformation(epsg, 4326), easting, northing)
+
+    return latitude, longitude
+
+
+def _transformation(srcEpsg, dstEpsg):
+    """ Creates coordinate transformation between two EPSG coordinate
+    reference systems
+
+    @param srcEpsg - EPSG code of the source coordinate reference system
+    @param dstEpsg - EPSG code of the destination coordinate reference system
+    @returns - osr.CoordinateTransformation instance
+    """
     src = osr.SpatialReference()
-    src.ImportFromEPSG(epsg)
+    src.ImportFromEPSG(srcEpsg)
     dst = osr.SpatialReference()
-    dst.ImportFromEPSG(4326)
-    ct = osr.CoordinateTransformation(src, dst)
-    longitude, latitude, z = ct.TransformPoint(easting, northing)
+    dst.ImportFromEPSG(dstEpsg)
+    return osr.CoordinateTransformation(src, dst)
 
-    return latitude, longitude
 
+def _cachedTransformation(srcEpsg, dstEpsg):
+    """ Returns coordinate transformation between two EPSG coordinate
+    reference systems. Transformations are cached per thread, as they
+    can not be shared between threads safely.
+
+    @param srcEpsg - EPSG code of the source coordinate reference system
+    @param dstEpsg - EPSG code of the destination coordinate reference system
+    @returns - osr.CoordinateTransformation instance
+    """
+    cache = getattr(_transformations, 'cache', None)
+    if cache is None:
+        cache = _transformations.cache = {}
+
+    ct = cache.get((srcEpsg, dstEpsg))
+    if ct is None:
+        ct = cache[(srcEpsg, dstEpsg)] = _transformation(srcEpsg, dstEpsg)
+
+    return ct
 
-def _upsToMgrs(hemisphere, easting, northing, precision):
+
+def _transformPoint(ct, x, y):
+    """ Transforms single point using given coordinate transformation
+
+    @param ct - osr.CoordinateTransformation instance
+    @param x - X coordinate (longitude or easting)
+    @param y - Y coordinate (latitude or northing)
+    @returns - tuple containing transformed X, Y and Z coordinates
+    """
+    return ct.TransformPoint(x, y)
+
+
+def _upsToMgrs(hemisphere, easting, northing, precision, check=True):
     """ Converts UPS (hemisphere, easting, and northing) coordinates
     to an MGRS coordinate string.
 
@@ -148,19 +281,22 @@ def _upsToMgrs(hemisphere, easting, northing, precision):
     @param easting - easting/X in meters
     @param northing - northing/Y in meters
     @param precision - precision level of MGRS string
+    @param check - if False input is not checked, used by trusted
+    conversions
     @returns - MGRS coordinate string
     """
-    if hemisphere not in ['N', 'S']:
-        raise MgrsException('Invalid hemisphere ("N" or "S").')
+    if check:
+        if hemisphere not in ['N', 'S']:
+            raise MgrsException('Invalid hemisphere ("N" or "S").')
 
-    if (easting < MIN_EAST_NORTH) or (easting > MAX_EAST_NORTH):
-        raise MgrsException('Easting outside of valid range (100,000 to 900,000 meters for UTM, 0 to 4,000,000 meters for UPS).')
+        if (easting < MIN_EAST_NORTH) or (easting > MAX_EAST_NORTH):
+            raise MgrsException('Easting outside of valid range (100,000 to 900,000 meters for UTM, 0 to 4,000,000 meters for UPS).')
 
-    if (northing < MIN_EAST_NORTH) or (northing > MAX_EAST_NORTH):
-        raise MgrsException('Northing outside of valid range (0 to 10,000,000 meters for UTM, 0 to 4,000,000 meters for UPS).')
+        if (northing < MIN_EAST_NORTH) or (northing > MAX_EAST_NORTH):
+            raise MgrsException('Northing outside of valid range (0 to 10,000,000 meters for UTM, 0 to 4,000,000 meters for UPS).')
 
-    if (precision < 0) or (precision > MAX_PRECISION):
-        raise MgrsException('The precision must be between 0 and 5 inclusive.')
+        if (precision < 0) or (precision > MAX_PRECISION):
+            raise MgrsException('The precision must be between 0 and 5 inclusive.')
 
     letters = [None, None, None]
     if hemisphere == 'N':
@@ -229,6 +365,9 @@ def _mgrsToUps(mgrs):
     if zone != 0:
         raise MgrsException('An MGRS string error: string too long, too short, or badly formed')
 
+    if letters[0] not in [ALPHABET['A'], ALPHABET['B'], ALPHABET['Y'], ALPHABET['Z']]:
+        raise MgrsException('An MGRS string error: string too long, too short, or badly formed')
+
     if letters[0] >= ALPHABET['Y']:
         hemisphere = 'N'
 
@@ -250,7 +389,7 @@ def _mgrsToUps(mgrs):
     # Check that the second letter of the MGRS string is within the range
     # of valid second letter values. Also check that the third letter is valid
     invalid = [ALPHABET['D'], ALPHABET['E'], ALPHABET['M'], ALPHABET['N'], ALPHABET['V'], ALPHABET['W']]
-    if (letters[1] < ltr2LowValue) or (letters[1] > ltr2HighValue) or (letters[1] in [invalid]) or (letters[2] > ltr3HighValue):
+    if (letters[1] < ltr2LowValue) or (letters[1] > ltr2HighValue) or (letters[1] in invalid) or (letters[2] > ltr3HighValue):
         raise MgrsException('An MGRS string error: string too long, too short, or badly formed')
 
     gridNorthing = float(letters[2] * ONEHT + falseNorthing)
@@ -369,7 +508,7 @@ def _mgrsToUtm(mgrs):
     if zone == 0:
         raise MgrsException('An MGRS string error: string too long, too short, or badly formed')
 
-    if letters == ALPHABET['X'] and zone in [32, 34, 36]:
+    if letters[0] == ALPHABET['X'] and zone in [32, 34, 36]:
         raise MgrsException('An MGRS string error: string too long, too short, or badly formed')
 
     if letters[0] < ALPHABET['N']:
@@ -432,7 +571,7 @@ def _mgrsString(zone, letters, easting, northing, precision):
         mgrs = '  '
 
     for i in range(3):
-        mgrs += list(ALPHABET.keys())[list(ALPHABET.values()).index(letters[i])]
+        mgrs += LETTERS[letters[i]]
 
     easting = math.fmod(easting + 1e-8, 100000.0)
     if easting >= 99999.5:
@@ -447,6 +586,17 @@ def _mgrsString(zone, letters, easting, northing, precision):
     return mgrs
 
 
+def _truncate(mgrs, precision):
+    """ Reduces precision of the MGRS string created by _mgrsString() with
+    maximum precision
+
+    @param mgrs - MGRS coordinate string with maximum precision
+    @param precision - precision level of the result
+    @returns - MGRS coordinate string
+    """
+    return mgrs[:-10] + mgrs[-10:-5][:precision] + mgrs[-5:][:precision]
+
+
 def _epsgForWgs(latitude, longitude):
     """ Returns corresponding UTM or UPS EPSG code from WGS84 coordinates
     @param latitude - latitude value
@@ -460,6 +610,16 @@ def _epsgForWgs(latitude, longitude):
     if longitude < -180 or longitude > 360:
         return MgrsException('Longitude outside of valid range (-180 to 360 degrees).')
 
+    return _zoneForWgs(latitude, longitude)
+
+
+def _zoneForWgs(latitude, longitude):
+    """ Same as _epsgForWgs() but without range checks
+
+    @param latitude - latitude value
+    @param longitude - longitude value
+    @returns - tuple containing hemisphere, UTM zone and EPSG code
+    """
     # hemisphere
     if latitude < 0:
         hemisphere = 'S'
@@ -595,11 +755,23 @@ def _breakMgrsString(mgrs):
     MGRS coordinate string letters, easting, northing and precision
     """
     mgrs = mgrs.lstrip()
+
+    # Fast path for plain ASCII strings, anything else is handled below
+    match = _MGRS_PATTERN.match(mgrs)
+    if match is not None:
+        zone = int(match.group(1)) if match.group(1) else 0
+        letters = [ord(c) - 65 for c in match.group(2).upper()]
+        digits = match.group(3)
+        precision = len(digits) // 2
+        if precision > 0:
+            return zone, letters, float(digits[:precision]), float(digits[precision:]), precision
+        return zone, letters, 0, 0, precision
+
     # Number of zone digits
     count = sum(1 for c in itertools.takewhile(str.isdigit, mgrs))
     if count <= 2:
         if count > 0:
-            zone = int(mgrs[:2])
+            zone = int(mgrs[:count])
             if zone < 1 or zone > 60:
                 raise MgrsException('An MGRS string error: string too long, too short, or badly formed')
         else:
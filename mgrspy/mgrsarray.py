@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    mgrsarray.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numbers
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+from mgrspy import batch
+from mgrspy import validation
+
+
+# band value marking rows which failed conversion or validation
+INVALID = 255
+
+# bit offsets of the fields in packed keys, fields are ordered from the
+# most significant: zone (6 bits), band, column, row (5 bits each),
+# precision (3 bits), easting and northing (17 bits each)
+_ZONE_SHIFT = 52
+_BAND_SHIFT = 47
+_COLUMN_SHIFT = 42
+_ROW_SHIFT = 37
+_PRECISION_SHIFT = 34
+_EASTING_SHIFT = 17
+_NORTHING_MASK = (1 << 17) - 1
+_INVALID_KEY = np.iinfo(np.int64).max
+
+# key shifts and label lengths for grouping levels
+_LEVELS = {'zone': (_ZONE_SHIFT, 2), 'gzd': (_BAND_SHIFT, 3), 'square': (_ROW_SHIFT, 5)}
+
+
+class MgrsArray(object):
+    """ Array of MGRS coordinates stored as parallel NumPy arrays of their
+    components: zone (0 for UPS), band, column and row letters (0 for 'A'),
+    easting and northing (as written in MGRS string) and precision. Slicing,
+    sorting, comparison and grouping work on components directly, strings
+    are created only by indexing with integer or by toStrings().
+
+    Rows which failed conversion are kept to preserve alignment with input,
+    they have band set to INVALID and become empty strings.
+    """
+
+    def __init__(self, zone, band, column, row, easting, northing, precision):
+        """ Creates array from component arrays of the same length
+
+        @param zone - array of UTM zones, 0 for UPS
+        @param band - array of the first MGRS letters
+        @param column - array of the second MGRS letters
+        @param row - array of the third MGRS letters
+        @param easting - array of eastings as written in MGRS strings
+        @param northing - array of northings as written in MGRS strings
+        @param precision - array of precision levels
+        """
+        self.zone = np.asarray(zone, dtype=np.uint8).ravel()
+        self.band = np.asarray(band, dtype=np.uint8).ravel()
+        self.column = np.asarray(column, dtype=np.uint8).ravel()
+        self.row = np.asarray(row, dtype=np.uint8).ravel()
+        self.easting = np.asarray(easting, dtype=np.uint32).ravel()
+        self.northing = np.asarray(northing, dtype=np.uint32).ravel()
+        self.precision = np.asarray(precision, dtype=np.uint8).ravel()
+
+        if len(set(len(c) for c in self._components())) != 1:
+            raise ValueError('Component arrays must have the same length')
+
+    @classmethod
+    def fromStrings(cls, mgrsStrings):
+        """ Parses MGRS coordinate strings, with the same semantics as
+        toWgs()
+
+        @param mgrsStrings - array-like of MGRS coordinate strings
+        @returns - tuple containing MgrsArray and array of per-row status
+        codes (STATUS_* constants from the mgrs module)
+        """
+        codes, shape = validation._codes(mgrsStrings)
+        status, zone, letters, easting, northing, precision, digits = validation._parse(codes)
+        return cls._fromComponents((zone, letters[:, 0], letters[:, 1], letters[:, 2],
+                                    easting, northing, precision), status), status
+
+    @classmethod
+    def fromBuffer(cls, buffer, separator=None):
+        """ Parses MGRS coordinate strings stored as separated records in a
+        bytes-like object without creating Python objects per record, see
+        validation.parseBuffer()
+
+        @param buffer - bytes, bytearray, memoryview, mmap or any other
+        object supporting buffer protocol
+        @param separator - single byte separating records, None means both
+        newline and NUL
+        @returns - tuple containing MgrsArray and array of per-row status
+        codes (STATUS_* constants from the mgrs module)
+        """
+        status, zone, letters, easting, northing, precision = validation.parseBuffer(buffer, separator)
+        return cls._fromComponents((zone, letters[:, 0], letters[:, 1], letters[:, 2],
+                                    easting, northing, precision), status), status
+
+    @classmethod
+    def fromWgs(cls, latitudes, longitudes, precision=5):
+        """ Converts geodetic (latitude and longitude) coordinates, with the
+        same semantics as toMgrsBatch()
+
+        @param latitudes - array-like of latitude values
+        @param longitudes - array-like of longitude values
+        @param precision - precision level of MGRS strings, single value or
+        array-like with value for each row
+        @returns - tuple containing MgrsArray and array of per-row status
+        codes (STATUS_* constants from the mgrs module)
+        """
+        latitudes, longitudes, precision = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                               np.asarray(longitudes, dtype=np.float64),
+                                                               np.asarray(precision))
+        components, status = batch._toMgrsComponents(latitudes.ravel(), longitudes.ravel(), precision.ravel())
+        return cls._fromComponents(components, status), status
+
+    @classmethod
+    def fromWgsLevels(cls, latitudes, longitudes, precisions=(1, 2, 3, 4, 5)):
+        """ Converts geodetic (latitude and longitude) coordinates to
+        several precision levels with a single reprojection, see
+        batch.toMgrsLevels()
+
+        @param latitudes - array-like of latitude values
+        @param longitudes - array-like of longitude values
+        @param precisions - sequence of precision levels
+        @returns - tuple containing list of MgrsArray instances, one for
+        each precision level, and array of per-row status codes
+        """
+        latitudes, longitudes = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                    np.asarray(longitudes, dtype=np.float64))
+        levels, status = batch._toMgrsLevels(latitudes.ravel(), longitudes.ravel(), precisions)
+        return [cls._fromComponents(components, status) for components in levels], status
+
+    @classmethod
+    def fromKeys(cls, keys):
+        """ Creates array from packed keys returned by keys()
+
+        @param keys - array of packed keys
+        @returns - MgrsArray
+        """
+        keys = np.asarray(keys, dtype=np.int64).ravel()
+        valid = keys != _INVALID_KEY
+        keys = np.where(valid, keys, 0)
+        return cls(keys >> _ZONE_SHIFT,
+                   np.where(valid, (keys >> _BAND_SHIFT) & 31, INVALID),
+                   (keys >> _COLUMN_SHIFT) & 31,
+                   (keys >> _ROW_SHIFT) & 31,
+                   (keys >> _EASTING_SHIFT) & _NORTHING_MASK,
+                   keys & _NORTHING_MASK,
+                   (keys >> _PRECISION_SHIFT) & 7)
+
+    @classmethod
+    def concatenate(cls, arrays):
+        """ Joins several arrays into one
+
+        @param arrays - sequence of MgrsArray instances
+        @returns - MgrsArray
+        """
+        return cls(*[np.concatenate(c) for c in zip(*[a._components() for a in arrays])])
+
+    @classmethod
+    def _fromComponents(cls, components, status):
+        """ Creates array from MGRS components, marking failed rows invalid
+
+        @param components - tuple containing arrays of zones, letters,
+        easting, northing and precision
+        @param status - array of status codes
+        @returns - MgrsArray
+        """
+        ok = status.ravel() == mgrs.STATUS_OK
+        zone, band, column, row, easting, northing, precision = [np.where(ok, c, 0) for c in components]
+        return cls(zone, np.where(ok, band, INVALID), column, row, easting, northing, precision)
+
+    def __len__(self):
+        return len(self.zone)
+
+    def __getitem__(self, key):
+        if isinstance(key, numbers.Integral):
+            if not -len(self) <= key < len(self):
+                raise IndexError('MgrsArray index out of range')
+            return str(self[[key]].toStrings()[0])
+
+        return MgrsArray(*[c[key] for c in self._components()])
+
+    def __iter__(self):
+        for s in self.toStrings():
+            yield str(s)
+
+    def __eq__(self, other):
+        if not isinstance(other, MgrsArray):
+            other = MgrsArray.fromStrings(other)[0]
+
+        result = np.ones(np.broadcast(self.zone, other.zone).shape, dtype=bool)
+        for a, b in zip(self._components(), other._components()):
+            result &= a == b
+        return result
+
+    def __ne__(self, other):
+        return ~(self == other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        strings = [str(s) for s in self[:6].toStrings()]
+        if len(self) > 6:
+            strings[-1] = '...'
+        return 'MgrsArray({})'.format(strings)
+
+    @property
+    def valid(self):
+        """ Returns boolean array, False marks rows which failed conversion
+        """
+        return self.band != INVALID
+
+    @property
+    def nbytes(self):
+        """ Returns number of bytes used by component arrays
+        """
+        return sum(c.nbytes for c in self._components())
+
+    def keys(self):
+        """ Packs components of each row into a single integer. Keys of
+        valid rows are ordered by zone, band, column, row, precision, easting
+        and northing, invalid rows get the largest key.
+
+        @returns - array of int64 keys
+        """
+        keys = (self.zone.astype(np.int64) << _ZONE_SHIFT |
+                self.band.astype(np.int64) << _BAND_SHIFT |
+                self.column.astype(np.int64) << _COLUMN_SHIFT |
+                self.row.astype(np.int64) << _ROW_SHIFT |
+                self.precision.astype(np.int64) << _PRECISION_SHIFT |
+                self.easting.astype(np.int64) << _EASTING_SHIFT |
+                self.northing.astype(np.int64))
+        return np.where(self.valid, keys, _INVALID_KEY)
+
+    def argsort(self):
+        """ Returns indices which sort array by keys()
+
+        @returns - array of indices
+        """
+        return np.argsort(self.keys(), kind='stable')
+
+    def sort(self):
+        """ Returns sorted copy of the array, see keys() for the ordering
+
+        @returns - MgrsArray
+        """
+        return self[self.argsort()]
+
+    def unique(self):
+        """ Returns sorted unique values of the array
+
+        @returns - MgrsArray
+        """
+        return MgrsArray.fromKeys(np.unique(self.keys()))
+
+    def groups(self, level='square'):
+        """ Groups valid rows by zone, grid zone designator or 100 km square
+
+        @param level - either 'zone', 'gzd' or 'square'
+        @returns - dictionary mapping MGRS string prefix (e.g. '18', '18S' or
+        '18SUJ') to array of row indices, in the original order
+        """
+        if level not in _LEVELS:
+            raise ValueError('Unknown grouping level: {}'.format(level))
+
+        shift, length = _LEVELS[level]
+        rows = np.flatnonzero(self.valid)
+        keys = self.keys()[rows] >> shift
+        order = np.argsort(keys, kind='stable')
+        rows = rows[order]
+        unique, starts = np.unique(keys[order], return_index=True)
+
+        labels = [s[:length] for s in self[rows[starts]]]
+        return dict(zip(labels, np.split(rows, starts[1:])))
+
+    def cellSize(self):
+        """ Returns size of the cells in meters
+
+        @returns - array of cell sizes
+        """
+        return 10.0 ** (mgrs.MAX_PRECISION - self.precision.astype(np.int64))
+
+    def gridCoordinates(self, centre=False):
+        """ Returns UTM or UPS coordinates of the cells. Unlike toWgs(),
+        eastings and northings are scaled to meters using precision.
+
+        @param centre - if True coordinates of the cell centres are returned,
+        otherwise of the south-west cell corners
+        @returns - tuple containing boolean array (True for northern
+        hemisphere), arrays of eastings and northings (NaN for invalid rows)
+        """
+        valid = self.valid
+        size = self.cellSize()
+        letters = np.column_stack((np.where(valid, self.band, 0), self.column, self.row)).astype(np.int64)
+        north, easting, northing = grid._mgrsToGrid(self.zone.astype(np.int64), letters,
+                                                    self.easting * size, self.northing * size)
+        if centre:
+            easting += size / 2
+            northing += size / 2
+
+        return north, np.where(valid, easting, np.nan), np.where(valid, northing, np.nan)
+
+    def centres(self):
+        """ Calculates geodetic coordinates of the cell centres without GDAL
+        coordinate transformations
+
+        @returns - tuple containing arrays of latitudes and longitudes (NaN
+        for invalid rows)
+        """
+        north, easting, northing = self.gridCoordinates(True)
+        return grid._gridToWgs(self.zone.astype(np.int64), north, easting, northing)
+
+    def toStrings(self):
+        """ Creates MGRS coordinate strings
+
+        @returns - array of MGRS coordinate strings (empty for invalid rows)
+        """
+        status = np.where(self.valid, mgrs.STATUS_OK, mgrs.STATUS_MALFORMED)
+        components = self._components()
+        band = np.where(self.valid, self.band, 0)
+        return grid._format(components[:1] + (band,) + components[2:], status)
+
+    def _components(self):
+        return self.zone, self.band, self.column, self.row, self.easting, self.northing, self.precision
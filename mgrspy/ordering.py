@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    ordering.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+
+from mgrspy.mgrsarray import MgrsArray
+
+
+# number of bits per axis, 31 bits give about 2 cm resolution at the equator
+ORDER = 31
+
+# key of the invalid rows, they are sorted last
+INVALID_KEY = np.iinfo(np.uint64).max
+
+
+def hilbertKeys(values, order=ORDER):
+    """ Calculates Hilbert curve keys of the MGRS cells. Keys are computed
+    from the cell centres in geographic coordinates, so neighbouring cells
+    get close keys also across zone and 100 km square boundaries.
+
+    @param values - MgrsArray or array-like of MGRS coordinate strings
+    @param order - number of bits per axis (1 to 31)
+    @returns - array of uint64 keys
+    """
+    x, y, valid = _cellIndices(values, order)
+    return np.where(valid, _hilbert(x, y, order), INVALID_KEY)
+
+
+def mortonKeys(values, order=ORDER):
+    """ Calculates Morton (Z-order) curve keys of the MGRS cells, see
+    hilbertKeys() for details
+
+    @param values - MgrsArray or array-like of MGRS coordinate strings
+    @param order - number of bits per axis (1 to 31)
+    @returns - array of uint64 keys
+    """
+    x, y, valid = _cellIndices(values, order)
+    return np.where(valid, _spread(x) | (_spread(y) << np.uint64(1)), INVALID_KEY)
+
+
+def sortByCurve(values, curve='hilbert', order=ORDER):
+    """ Sorts MGRS cells along the space-filling curve. Invalid values are
+    moved to the end.
+
+    @param values - MgrsArray or array-like of MGRS coordinate strings
+    @param curve - either 'hilbert' or 'morton'
+    @param order - number of bits per axis (1 to 31)
+    @returns - tuple containing sorted values (of the same type as input)
+    and array of indices which sort the input
+    """
+    if curve == 'hilbert':
+        keys = hilbertKeys(values, order)
+    elif curve == 'morton':
+        keys = mortonKeys(values, order)
+    else:
+        raise ValueError('Unknown curve: {}'.format(curve))
+
+    indices = np.argsort(keys, kind='stable')
+    if isinstance(values, MgrsArray):
+        return values[indices], indices
+
+    return np.asarray(values)[indices], indices
+
+
+def _cellIndices(values, order):
+    """ Quantizes geographic coordinates of the cell centres
+
+    @param values - MgrsArray or array-like of MGRS coordinate strings
+    @param order - number of bits per axis
+    @returns - tuple containing uint64 arrays of column and row indices and
+    boolean array, False marks invalid values
+    """
+    if not 1 <= order <= 31:
+        raise ValueError('Order must be between 1 and 31')
+
+    if not isinstance(values, MgrsArray):
+        values = MgrsArray.fromStrings(values)[0]
+
+    latitudes, longitudes = values.centres()
+    valid = values.valid
+    side = 2 ** order
+    x = np.clip((np.where(valid, longitudes, 0.0) + 180.0) / 360.0 * side, 0, side - 1)
+    y = np.clip((np.where(valid, latitudes, 0.0) + 90.0) / 180.0 * side, 0, side - 1)
+    return x.astype(np.uint64), y.astype(np.uint64), valid
+
+
+def _hilbert(x, y, order):
+    """ Vectorized conversion of the cell indices to the distance along
+    the Hilbert curve
+
+    @param x - uint64 array of column indices
+    @param y - uint64 array of row indices
+    @param order - number of bits per axis
+    @returns - array of uint64 keys
+    """
+    x = x.copy()
+    y = y.copy()
+    last = np.uint64(2 ** order - 1)
+    keys = np.zeros(x.shape, dtype=np.uint64)
+    for bit in range(order - 1, -1, -1):
+        s = np.uint64(1 << bit)
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        keys += np.uint64(1 << (2 * bit)) * ((3 * rx.astype(np.uint64)) ^ ry.astype(np.uint64))
+
+        # rotate quadrant
+        flip = ~ry & rx
+        x = np.where(flip, last - x, x)
+        y = np.where(flip, last - y, y)
+        swap = ~ry
+        x, y = np.where(swap, y, x), np.where(swap, x, y)
+
+    return keys
+
+
+def _spread(values):
+    """ Inserts zero bit after each of the lower 32 bits
+
+    @param values - uint64 array
+    @returns - uint64 array
+    """
+    values = values & np.uint64(0x00000000FFFFFFFF)
+    for shift, mask in [(16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF), (4, 0x0F0F0F0F0F0F0F0F),
+                        (2, 0x3333333333333333), (1, 0x5555555555555555)]:
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+
+    return values
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    parallel.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import threading
+import multiprocessing
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from mgrspy import batch
+from mgrspy import validation
+
+
+MGRS_DTYPE = 'S%d' % validation.MAX_LENGTH
+
+# alignment in bytes of arrays placed in the shared memory block
+_ALIGNMENT = 64
+
+# shared memory block attached by the worker process, kept between tasks
+_attached = None
+
+
+class BatchPool(object):
+    """ Pool of worker processes converting coordinates in place. Input and
+    output arrays are placed in a shared memory block and each worker
+    converts its own slices, so no coordinates or strings are pickled. The
+    block is kept for the pool lifetime and only grows when a larger batch
+    arrives. Every worker keeps its own cache of coordinate transformations
+    and its attachment of the block for the pool lifetime.
+    """
+
+    def __init__(self, processes=None, slicesPerProcess=4, context=None):
+        """ Creates pool of worker processes
+
+        @param processes - number of worker processes, defaults to the
+        number of CPUs
+        @param slicesPerProcess - number of slices each batch is split into
+        per worker process, higher values balance load better
+        @param context - multiprocessing start method name or None to use
+        platform default
+        """
+        self.processes = processes or multiprocessing.cpu_count()
+        self.slicesPerProcess = slicesPerProcess
+        # workers must share resource tracker with this process, otherwise
+        # they would try to clean up shared memory blocks on exit
+        resource_tracker.ensure_running()
+        self._pool = multiprocessing.get_context(context).Pool(self.processes)
+        self._block = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def close(self):
+        """ Stops worker processes and waits for them to exit
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._release()
+
+    def terminate(self):
+        """ Stops worker processes immediately
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        self._release()
+
+    def toMgrs(self, latitudes, longitudes, precision=5):
+        """ Converts arrays of geodetic (latitude and longitude) coordinates
+        to MGRS coordinate strings, see toMgrsBatch() for details.
+
+        @param latitudes - array-like of latitude values
+        @param longitudes - array-like of longitude values
+        @param precision - precision level of MGRS strings, single value or
+        array-like broadcastable to coordinates
+        @returns - tuple containing array of MGRS coordinate strings (as
+        bytes) and array of per-row status codes
+        """
+        if np.ndim(precision) == 0:
+            latitudes, longitudes = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                        np.asarray(longitudes, dtype=np.float64))
+            extra, args = [], (precision,)
+        else:
+            latitudes, longitudes, precision = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                                   np.asarray(longitudes, dtype=np.float64),
+                                                                   np.asarray(precision))
+            # per-row precision is sliced like the coordinates
+            extra, args = [precision.ravel()], ()
+
+        shape = latitudes.shape
+        arrays = [latitudes.ravel(), longitudes.ravel(),
+                  np.empty(latitudes.size, dtype=MGRS_DTYPE), np.empty(latitudes.size, dtype=np.uint8)] + extra
+        self._run(_toMgrsSlice, arrays, *args)
+        return arrays[2].reshape(shape), arrays[3].reshape(shape)
+
+    def toWgs(self, mgrsStrings):
+        """ Converts array of MGRS coordinate strings to geodetic (latitude
+        and longitude) coordinates, see toWgsBatch() for details.
+
+        @param mgrsStrings - array-like of MGRS coordinate strings
+        @returns - tuple containing arrays of latitude values, longitude
+        values and per-row status codes
+        """
+        codes, shape = validation._codes(mgrsStrings)
+        # non-ASCII characters are invalid anyway
+        codes = np.where(codes > 127, ord('?'), codes).astype(np.uint8)
+        if codes.shape[1] == 0:
+            codes = np.zeros((codes.shape[0], 1), dtype=np.uint8)
+        values = np.ascontiguousarray(codes).view('S%d' % codes.shape[1]).ravel()
+
+        count = values.size
+        arrays = [values, np.empty(count), np.empty(count), np.empty(count, dtype=np.uint8)]
+        self._run(_toWgsSlice, arrays)
+        return arrays[1].reshape(shape), arrays[2].reshape(shape), arrays[3].reshape(shape)
+
+    def _run(self, func, arrays, *args):
+        """ Copies arrays to the shared memory block, converts them in slices
+        with worker processes and copies results back
+
+        @param func - worker function
+        @param arrays - list of input and output arrays
+        @param args - additional arguments passed to the worker function
+        """
+        with self._lock:
+            if self._pool is None:
+                raise ValueError('Pool is closed')
+
+            count = len(arrays[0])
+            if count == 0:
+                return
+
+            layout = []
+            size = 0
+            for array in arrays:
+                layout.append((size, array.dtype.str))
+                size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+            block = self._workspace(size)
+
+            for array, (offset, dtype) in zip(arrays, layout):
+                np.ndarray(array.shape, array.dtype, buffer=block.buf, offset=offset)[:] = array
+
+            bounds = np.linspace(0, count, min(count, self.processes * self.slicesPerProcess) + 1).astype(int)
+            tasks = [(block.name, layout, count, start, stop) + args
+                     for start, stop in zip(bounds[:-1], bounds[1:])]
+            self._pool.map(func, tasks, chunksize=1)
+
+            for array, (offset, dtype) in zip(arrays, layout):
+                array[:] = np.ndarray(array.shape, array.dtype, buffer=block.buf, offset=offset)
+
+    def _workspace(self, size):
+        """ Returns shared memory block of at least given size, replacing
+        the current block if it is too small
+
+        @param size - required size in bytes
+        @returns - SharedMemory instance
+        """
+        if self._block is None or self._block.size < size:
+            previous = self._block.size if self._block is not None else 0
+            self._release()
+            self._block = shared_memory.SharedMemory(create=True, size=max(size, 2 * previous, _ALIGNMENT))
+        return self._block
+
+    def _release(self):
+        """ Closes and removes the shared memory block
+        """
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+
+def _attach(name):
+    """ Attaches shared memory block created by the parent process. Workers
+    share resource tracker with the parent process, so block is unlinked
+    only once, by the parent.
+
+    @param name - shared memory block name
+    @returns - SharedMemory instance
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _convertSlice(task, func):
+    """ Attaches shared memory block and passes slices of the arrays to the
+    conversion function. The block stays attached until the parent process
+    replaces it with a larger one.
+
+    @param task - tuple containing block name, array layout (offset and
+    dtype of each array), array length, slice start and stop and additional
+    arguments
+    @param func - function accepting list of array slices and additional
+    arguments
+    """
+    global _attached
+    name, layout, count, start, stop = task[:5]
+    if _attached is None or _attached.name != name:
+        if _attached is not None:
+            _attached.close()
+            _attached = None
+        _attached = _attach(name)
+
+    arrays = [np.ndarray((count,), dtype, buffer=_attached.buf, offset=offset)[start:stop]
+              for offset, dtype in layout]
+    try:
+        func(arrays, *task[5:])
+    finally:
+        # views must be released before the block can be closed
+        arrays = None
+
+
+def _toMgrsSlice(task):
+    """ Worker function converting slice of coordinates to MGRS
+
+    @param task - task tuple, see _convertSlice()
+    """
+    def convert(arrays, *args):
+        latitudes, longitudes, result, status, precision = list(arrays) + list(args)
+        converted, status[:] = batch.toMgrsBatch(latitudes, longitudes, precision)
+        result[:] = converted.astype(MGRS_DTYPE)
+
+    _convertSlice(task, convert)
+
+
+def _toWgsSlice(task):
+    """ Worker function converting slice of MGRS strings to WGS84
+
+    @param task - task tuple, see _convertSlice()
+    """
+    def convert(arrays):
+        values, latitudes, longitudes, status = arrays
+        latitudes[:], longitudes[:], status[:] = batch.toWgsBatch(values)
+
+    _convertSlice(task, convert)
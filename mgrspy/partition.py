@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    partition.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import os
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import zones
+from mgrspy import validation
+
+
+# records of the spill files: original row number and coordinates
+POINT_DTYPE = np.dtype([('row', '<u8'), ('latitude', '<f8'), ('longitude', '<f8')])
+
+# records of the converted partitions
+MGRS_DTYPE = np.dtype([('row', '<u8'), ('mgrs', 'S%d' % validation.MAX_LENGTH), ('status', 'u1')])
+
+# partition of the rows outside of valid latitude or longitude range
+INVALID_PARTITION = 'invalid'
+
+# default limit of the rows buffered in memory for all partitions together
+BUFFER_SIZE = 1 << 20
+
+SPILL_SUFFIX = '.points'
+MGRS_SUFFIX = '.mgrs'
+
+
+class GzdPartitioner(object):
+    """ Splits stream of geodetic coordinates into per grid zone designator
+    spill files, so each partition can be converted by a worker using a
+    single projection. Rows are buffered in memory and the largest
+    partitions are flushed whenever the buffer limit is reached.
+    """
+
+    def __init__(self, directory, bufferSize=BUFFER_SIZE):
+        """ Creates partitioner
+
+        @param directory - directory for the spill files, created if it does
+        not exist
+        @param bufferSize - maximum number of rows buffered in memory
+        """
+        if bufferSize < 1:
+            raise ValueError('Buffer size must be positive')
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self.directory = directory
+        self.bufferSize = bufferSize
+        self.count = 0
+        self._sizes = {}
+        self._buffers = {}
+        self._bufferSizes = {}
+        self._buffered = 0
+        self._written = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def add(self, latitudes, longitudes):
+        """ Adds chunk of coordinates, rows are numbered in the order they
+        were added
+
+        @param latitudes - array-like of latitude values
+        @param longitudes - array-like of longitude values
+        """
+        latitudes, longitudes = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                    np.asarray(longitudes, dtype=np.float64))
+        latitudes = latitudes.ravel()
+        longitudes = longitudes.ravel()
+
+        zone, band, north, epsg = zones.classifyZones(latitudes, longitudes)
+        keys = np.where(band != zones.INVALID, zone * 26 + band, -1)
+        order = np.argsort(keys, kind='stable')
+        unique, starts = np.unique(keys[order], return_index=True)
+
+        records = np.empty(len(latitudes), dtype=POINT_DTYPE)
+        records['row'] = self.count + order
+        records['latitude'] = latitudes[order]
+        records['longitude'] = longitudes[order]
+        self.count += len(latitudes)
+
+        for key, chunk in zip(unique, np.split(records, starts[1:])):
+            name = INVALID_PARTITION if key < 0 else zones._gzdLabel(*divmod(int(key), 26))
+            self._buffers.setdefault(name, []).append(chunk)
+            self._sizes[name] = self._sizes.get(name, 0) + len(chunk)
+            self._bufferSizes[name] = self._bufferSizes.get(name, 0) + len(chunk)
+            self._buffered += len(chunk)
+
+        while self._buffered > self.bufferSize:
+            self._flush(max(self._bufferSizes, key=self._bufferSizes.get))
+
+    def close(self):
+        """ Writes all buffered rows to the spill files
+        """
+        for name in list(self._buffers):
+            self._flush(name)
+
+    def sizes(self):
+        """ Returns number of rows in each partition
+
+        @returns - dictionary mapping grid zone designator (or
+        INVALID_PARTITION) to the number of rows
+        """
+        return dict(self._sizes)
+
+    def partitions(self):
+        """ Returns spill files of the partitions, call close() first to
+        write buffered rows
+
+        @returns - dictionary mapping grid zone designator (or
+        INVALID_PARTITION) to the spill file path
+        """
+        return dict((name, self._path(name)) for name in self._sizes)
+
+    def _path(self, name):
+        return os.path.join(self.directory, name + SPILL_SUFFIX)
+
+    def _flush(self, name):
+        """ Appends buffered rows of the partition to its spill file,
+        existing files are overwritten on the first flush
+
+        @param name - partition name
+        """
+        chunks = self._buffers.pop(name, [])
+        self._buffered -= self._bufferSizes.pop(name, 0)
+        with open(self._path(name), 'ab' if name in self._written else 'wb') as f:
+            self._written.add(name)
+            for chunk in chunks:
+                chunk.tofile(f)
+
+
+def partitionPoints(chunks, directory, bufferSize=BUFFER_SIZE):
+    """ Splits stream of geodetic coordinates into per grid zone designator
+    spill files, see GzdPartitioner
+
+    @param chunks - iterable of (latitudes, longitudes) array pairs
+    @param directory - directory for the spill files
+    @param bufferSize - maximum number of rows buffered in memory
+    @returns - tuple containing dictionary mapping grid zone designator to
+    the spill file path and dictionary mapping grid zone designator to the
+    number of rows
+    """
+    with GzdPartitioner(directory, bufferSize) as partitioner:
+        for latitudes, longitudes in chunks:
+            partitioner.add(latitudes, longitudes)
+
+    return partitioner.partitions(), partitioner.sizes()
+
+
+def readPartition(path):
+    """ Memory maps spill file or converted partition
+
+    @param path - file path
+    @returns - structured array with POINT_DTYPE or MGRS_DTYPE records
+    """
+    dtype = MGRS_DTYPE if path.endswith(MGRS_SUFFIX) else POINT_DTYPE
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def convertPartition(path, precision=5, output=None, chunkSize=BUFFER_SIZE):
+    """ Converts spill file to MGRS, this is what each worker does with its
+    partition
+
+    @param path - spill file path
+    @param precision - precision level of MGRS strings
+    @param output - path of the converted partition, defaults to the spill
+    file path with MGRS_SUFFIX
+    @param chunkSize - number of rows converted at once
+    @returns - path of the converted partition
+    """
+    if output is None:
+        output = os.path.splitext(path)[0] + MGRS_SUFFIX
+
+    points = readPartition(path)
+    with open(output, 'wb') as f:
+        for start in range(0, len(points), chunkSize):
+            chunk = points[start:start + chunkSize]
+            records = np.empty(len(chunk), dtype=MGRS_DTYPE)
+            records['row'] = chunk['row']
+            strings, records['status'] = batch.toMgrsBatch(chunk['latitude'], chunk['longitude'], precision)
+            records['mgrs'] = np.char.encode(strings, 'ascii')
+            records.tofile(f)
+
+    return output
+
+
+def mergePartitions(paths, count, output=None):
+    """ Merges converted partitions back into the original row order
+
+    @param paths - iterable of converted partition paths
+    @param count - total number of rows
+    @param output - optional path of the merged file, when given result is
+    memory mapped file and not kept in memory
+    @returns - tuple containing array of MGRS coordinate strings (as bytes)
+    and array of per-row status codes, rows missing from partitions get
+    empty string and STATUS_MALFORMED
+    """
+    dtype = np.dtype([('mgrs', MGRS_DTYPE['mgrs']), ('status', 'u1')])
+    if output is None:
+        result = np.zeros(count, dtype=dtype)
+    else:
+        result = np.memmap(output, dtype=dtype, mode='w+', shape=(max(count, 1),))[:count]
+    result['status'] = mgrs.STATUS_MALFORMED
+
+    for path in paths:
+        records = readPartition(path)
+        rows = records['row']
+        if len(rows) and rows.max() >= count:
+            raise ValueError('Partition {} contains row outside of the {} rows'.format(path, count))
+        result['mgrs'][rows] = records['mgrs']
+        result['status'][rows] = records['status']
+
+    if output is not None:
+        result.flush()
+
+    return result['mgrs'], result['status']
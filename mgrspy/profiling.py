@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    profiling.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import threading
+import timeit
+
+from mgrspy import mgrs
+
+
+# conversion stages which are timed, mapped to the names of the
+# mgrs module functions implementing them
+STAGES = {'transformation': '_transformation',
+          'transformPoint': '_transformPoint',
+          'breakMgrsString': '_breakMgrsString',
+          'mgrsString': '_mgrsString'
+         }
+
+_lock = threading.Lock()
+_originals = {}
+_stages = {}
+_systems = {}
+_zones = {}
+
+
+def enable():
+    """ Enables collection of the conversion statistics. Instrumented
+    versions of the hot-path functions replace the original ones in the
+    mgrs module, so there is no overhead at all while profiling is disabled.
+    """
+    with _lock:
+        if _originals:
+            return
+
+        for stage, name in STAGES.items():
+            _originals[name] = getattr(mgrs, name)
+            setattr(mgrs, name, _timed(stage, _originals[name]))
+
+        for name in ['_utmToMgrs', '_mgrsToUtm', '_upsToMgrs', '_mgrsToUps']:
+            _originals[name] = getattr(mgrs, name)
+
+        mgrs._utmToMgrs = _counted(_originals['_utmToMgrs'], 'UTM', lambda args, result: args[0])
+        mgrs._mgrsToUtm = _counted(_originals['_mgrsToUtm'], 'UTM', lambda args, result: result[0])
+        mgrs._upsToMgrs = _counted(_originals['_upsToMgrs'], 'UPS', None)
+        mgrs._mgrsToUps = _counted(_originals['_mgrsToUps'], 'UPS', None)
+
+
+def disable():
+    """ Disables collection of the conversion statistics and restores
+    original functions. Already collected values are kept until reset()
+    is called.
+    """
+    with _lock:
+        for name, func in _originals.items():
+            setattr(mgrs, name, func)
+        _originals.clear()
+
+
+def isEnabled():
+    """ Checks whether collection of the conversion statistics is enabled
+
+    @returns - True if profiling is enabled, False otherwise
+    """
+    return bool(_originals)
+
+
+def snapshot():
+    """ Returns copy of the collected statistics suitable for exporting
+    to the metrics systems.
+
+    @returns - dictionary with "stages" (per-stage number of calls and
+    cumulative time in seconds), "systems" (number of UTM and UPS
+    conversions) and "zones" (number of conversions per UTM zone) keys
+    """
+    with _lock:
+        return {'stages': {k: dict(v) for k, v in _stages.items()},
+                'systems': dict(_systems),
+                'zones': dict(_zones)
+               }
+
+
+def reset():
+    """ Clears all collected statistics
+    """
+    with _lock:
+        _stages.clear()
+        _systems.clear()
+        _zones.clear()
+
+
+def _timed(stage, func):
+    """ Wraps function to record number of calls and cumulative time
+    spent in it under given stage name
+
+    @param stage - stage name
+    @param func - function to wrap
+    @returns - wrapped function
+    """
+    timer = timeit.default_timer
+
+    def wrapper(*args):
+        start = timer()
+        try:
+            return func(*args)
+        finally:
+            elapsed = timer() - start
+            with _lock:
+                stats = _stages.setdefault(stage, {'calls': 0, 'seconds': 0.0})
+                stats['calls'] += 1
+                stats['seconds'] += elapsed
+
+    return wrapper
+
+
+def _counted(func, system, zoneGetter):
+    """ Wraps grid conversion function to count conversions per
+    coordinate system and UTM zone
+
+    @param func - function to wrap
+    @param system - coordinate system name, either 'UTM' or 'UPS'
+    @param zoneGetter - callable returning UTM zone from function arguments
+    and result or None if zones should not be counted
+    @returns - wrapped function
+    """
+    def wrapper(*args):
+        result = func(*args)
+        with _lock:
+            _systems[system] = _systems.get(system, 0) + 1
+            if zoneGetter is not None:
+                zone = zoneGetter(args, result)
+                _zones[zone] = _zones.get(zone, 0) + 1
+        return result
+
+    return wrapper
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    proximity.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+from mgrspy import batch
+from mgrspy.mgrsarray import MgrsArray
+
+
+# pseudo zone numbers of the UPS systems
+_UPS_NORTH = 61
+_UPS_SOUTH = 62
+
+# lower bound of the meridian arc length of one degree of latitude and
+# allowance for the grid scale factor
+_METERS_PER_DEGREE = 110574.0
+_MARGIN = 1.01
+
+
+def distance(mgrs1, mgrs2):
+    """ Calculates grid distance in meters between points referenced by
+    MGRS strings (south-west corners of the cells). When both points are
+    in the same UTM zone or UPS area distance is calculated directly from
+    grid coordinates, otherwise the second point is reprojected to the
+    grid of the first one. Accepts single values or arrays.
+
+    @param mgrs1 - MGRS coordinate string, array of strings, MgrsArray or
+    array of packed keys
+    @param mgrs2 - MGRS coordinate string, array of strings, MgrsArray or
+    array of packed keys
+    @returns - distance or array of distances
+    """
+    scalar = np.ndim(mgrs1) == 0 and np.ndim(mgrs2) == 0
+    first = _mgrsArray(mgrs1)
+    second = _mgrsArray(mgrs2)
+    if not (first.valid.all() and second.valid.all()):
+        raise mgrs.MgrsException('An MGRS string error: string too long, too short, or badly formed')
+
+    count = np.broadcast(first.zone, second.zone).shape[0]
+    first = first[np.arange(count) % len(first)]
+    second = second[np.arange(count) % len(second)]
+
+    system, easting, northing = _gridCoordinates(first)
+    otherSystem, otherEasting, otherNorthing = _gridCoordinates(second)
+
+    rows = np.flatnonzero(system != otherSystem)
+    otherEasting[rows], otherNorthing[rows] = _reproject(second[rows], system[rows])
+
+    result = np.hypot(otherEasting - easting, otherNorthing - northing)
+    return float(result[0]) if scalar else result
+
+
+def withinRadius(reference, values, radius):
+    """ Finds points referenced by MGRS strings (south-west corners of the
+    cells) which are not farther than radius from the reference point, see
+    distance() for details. Points from other zones are reprojected only
+    if their latitude is close enough to the reference point.
+
+    @param reference - MGRS coordinate string of the reference point
+    @param values - array of MGRS coordinate strings, MgrsArray or array
+    of packed keys
+    @param radius - search radius in meters
+    @returns - boolean array, invalid values are never within radius
+    """
+    origin = _mgrsArray([reference] if isinstance(reference, str) else reference)
+    if len(origin) != 1 or not origin.valid[0]:
+        raise mgrs.MgrsException('An MGRS string error: string too long, too short, or badly formed')
+
+    array = _mgrsArray(values)
+    system, easting, northing = _gridCoordinates(origin)
+    otherSystem, otherEasting, otherNorthing = _gridCoordinates(array)
+
+    result = np.zeros(len(array), dtype=bool)
+    same = otherSystem == system[0]
+    result[same] = np.hypot(otherEasting[same] - easting[0], otherNorthing[same] - northing[0]) <= radius
+
+    # skip points which are too far in latitude before reprojecting
+    rows = np.flatnonzero(~same & array.valid)
+    latitude = _latitudes(origin)[0]
+    rows = rows[np.abs(_latitudes(array[rows]) - latitude) <= _MARGIN * radius / _METERS_PER_DEGREE]
+
+    x, y = _reproject(array[rows], np.full(len(rows), system[0]))
+    result[rows] = np.hypot(x - easting[0], y - northing[0]) <= radius
+    return result
+
+
+def _mgrsArray(values):
+    """ Converts supported inputs to MgrsArray
+
+    @param values - MGRS coordinate string, array of strings, MgrsArray or
+    array of packed keys
+    @returns - MgrsArray
+    """
+    if isinstance(values, MgrsArray):
+        return values
+
+    values = np.atleast_1d(np.asarray(values))
+    if values.dtype.kind in 'iu':
+        return MgrsArray.fromKeys(values)
+
+    return MgrsArray.fromStrings(values.ravel())[0]
+
+
+def _gridCoordinates(array):
+    """ Returns grid coordinates of the cell corners, northings of the
+    southern hemisphere UTM zones are shifted so they continue northern
+    hemisphere values
+
+    @param array - MgrsArray
+    @returns - tuple containing arrays of zones (pseudo zones for UPS),
+    eastings and northings
+    """
+    north, easting, northing = array.gridCoordinates()
+    zone = array.zone.astype(np.int64)
+    utm = zone > 0
+    northing = np.where(utm & ~north, northing - grid._FALSE_NORTHING, northing)
+    return np.where(utm, zone, np.where(north, _UPS_NORTH, _UPS_SOUTH)), easting, northing
+
+
+def _latitudes(array):
+    """ Returns latitudes of the cell corners
+
+    @param array - MgrsArray
+    @returns - array of latitudes
+    """
+    north, easting, northing = array.gridCoordinates()
+    return grid._gridToWgs(array.zone.astype(np.int64), north, easting, northing)[0]
+
+
+def _reproject(array, systems):
+    """ Reprojects cell corners to the grid of the given zones
+
+    @param array - MgrsArray
+    @param systems - array of zones (pseudo zones for UPS), see
+    _gridCoordinates()
+    @returns - tuple containing arrays of eastings and northings
+    """
+    north, easting, northing = array.gridCoordinates()
+    latitudes, longitudes = grid._gridToWgs(array.zone.astype(np.int64), north, easting, northing)
+
+    x = np.empty(len(array))
+    y = np.empty(len(array))
+    for system in np.unique(systems):
+        idx = np.flatnonzero(systems == system)
+        if system == _UPS_NORTH:
+            epsg = 32661
+        elif system == _UPS_SOUTH:
+            epsg = 32761
+        else:
+            epsg = 32600 + int(system)
+        x[idx], y[idx] = batch._transform(4326, epsg, longitudes[idx], latitudes[idx])
+
+    return x, y
@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    service.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import json
+import time
+import queue
+import socket
+import argparse
+import threading
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import profiling
+
+
+# endpoints counted separately in metrics, requests to other paths are
+# counted together
+_ROUTES = frozenset(['/mgrs', '/wgs', '/mgrs/batch', '/wgs/batch', '/metrics'])
+
+
+class MgrsService(object):
+    """ Embeddable HTTP conversion service.
+
+    Endpoints (all requests and responses are JSON):
+      POST /mgrs        {"latitude": 42.0, "longitude": -93.0, "precision": 5}
+      POST /mgrs/batch  {"latitudes": [...], "longitudes": [...], "precision": 5}
+      POST /wgs         {"mgrs": "15TVG0000049776"}
+      POST /wgs/batch   {"mgrs": [...]}
+      GET  /metrics
+
+    Single point requests from all connections are coalesced into batch
+    conversions. Batch requests are converted by a fixed number of worker
+    threads, requests exceeding the pending limit are rejected with 503.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8080, workers=4, maxPending=64,
+                 coalesceWindow=0.002, maxCoalesced=4096, maxBodySize=64 * 1024 * 1024):
+        """ Creates service bound to the given address. Use port 0 to pick
+        any free port.
+
+        @param host - host name or address to listen on
+        @param port - port to listen on
+        @param workers - number of threads converting batch requests
+        @param maxPending - maximum number of requests being converted or
+        waiting for conversion
+        @param coalesceWindow - time in seconds to wait for more single point
+        requests before converting them
+        @param maxCoalesced - maximum number of single point requests
+        converted together
+        @param maxBodySize - maximum request body size in bytes
+        """
+        self.coalesceWindow = coalesceWindow
+        self.maxCoalesced = maxCoalesced
+        self.maxBodySize = maxBodySize
+
+        self._executor = futures.ThreadPoolExecutor(max_workers=workers)
+        self._pending = threading.BoundedSemaphore(maxPending)
+        self._queue = queue.Queue()
+        self._metricsLock = threading.Lock()
+        self._metrics = {'requests': {}, 'rows': 0, 'failedRows': 0, 'rejected': 0,
+                         'coalescedBatches': 0, 'coalescedRows': 0}
+
+        self._server = ThreadingHTTPServer((host, port), _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.service = self
+        self._threads = []
+
+    @property
+    def address(self):
+        """ Returns address the service is listening on
+
+        @returns - tuple containing host and port
+        """
+        return self._server.server_address[:2]
+
+    def start(self):
+        """ Starts serving requests in background threads
+        """
+        for target in [self._server.serve_forever, self._coalesce]:
+            thread = threading.Thread(target=target)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def serveForever(self):
+        """ Serves requests in the calling thread until stop() is called
+        """
+        thread = threading.Thread(target=self._coalesce)
+        thread.daemon = True
+        thread.start()
+        self._threads.append(thread)
+        self._server.serve_forever()
+
+    def stop(self):
+        """ Stops serving requests and releases resources
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        self._queue.put(None)
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._threads = []
+        self._executor.shutdown()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.stop()
+
+    def metrics(self):
+        """ Returns service metrics
+
+        @returns - dictionary with request counters per endpoint, number of
+        converted and failed rows, rejected requests, coalescing statistics
+        and profiling snapshot
+        """
+        with self._metricsLock:
+            result = dict(self._metrics)
+            result['requests'] = dict(self._metrics['requests'])
+
+        result['profiling'] = profiling.snapshot()
+        return result
+
+    def convert(self, path, data):
+        """ Performs conversion for the given endpoint
+
+        @param path - endpoint path
+        @param data - decoded JSON request
+        @returns - tuple containing HTTP status and JSON-serializable response
+        """
+        if not self._pending.acquire(False):
+            self._count(rejected=1)
+            return 503, {'error': 'Too many pending requests'}
+
+        try:
+            if path == '/mgrs':
+                future = self._submit('mgrs', (_number(data['latitude']), _number(data['longitude']),
+                                               _number(data.get('precision', 5))))
+                result, status = future.result()
+                return self._single(status, {'mgrs': result})
+            elif path == '/wgs':
+                if not isinstance(data['mgrs'], str):
+                    raise TypeError('MGRS coordinate must be a string')
+                latitude, longitude, status = self._submit('wgs', data['mgrs']).result()
+                return self._single(status, {'latitude': latitude, 'longitude': longitude})
+            elif path == '/mgrs/batch':
+                result, status = self._executor.submit(batch.toMgrsBatch, data['latitudes'], data['longitudes'],
+                                                       data.get('precision', 5)).result()
+                self._count(rows=len(status), failedRows=int(np.count_nonzero(status)))
+                return 200, {'mgrs': result.tolist(), 'status': status.tolist()}
+            elif path == '/wgs/batch':
+                latitudes, longitudes, status = self._executor.submit(batch.toWgsBatch, data['mgrs']).result()
+                self._count(rows=len(status), failedRows=int(np.count_nonzero(status)))
+                return 200, {'latitudes': _nullable(latitudes), 'longitudes': _nullable(longitudes),
+                             'status': status.tolist()}
+            else:
+                return 404, {'error': 'Unknown endpoint'}
+        finally:
+            self._pending.release()
+
+    def _single(self, status, response):
+        """ Builds response for the single point conversion
+
+        @param status - conversion status code
+        @param response - response dictionary for successful conversion
+        @returns - tuple containing HTTP status and response
+        """
+        self._count(rows=1, failedRows=int(status != mgrs.STATUS_OK))
+        if status != mgrs.STATUS_OK:
+            return 422, {'status': status, 'error': mgrs.STATUS_MESSAGES[status]}
+
+        response['status'] = status
+        return 200, response
+
+    def _submit(self, kind, args):
+        """ Queues single point conversion for coalescing
+
+        @param kind - either 'mgrs' or 'wgs'
+        @param args - conversion arguments
+        @returns - future with the conversion result
+        """
+        future = futures.Future()
+        self._queue.put((kind, args, future))
+        return future
+
+    def _coalesce(self):
+        """ Collects queued single point conversions and converts them
+        together, until None is received from the queue
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            # window starts with the first request, later requests do not
+            # extend it
+            items = [item]
+            deadline = time.monotonic() + self.coalesceWindow
+            try:
+                while len(items) < self.maxCoalesced:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    if item is None:
+                        self._queue.put(None)
+                        break
+                    items.append(item)
+            except queue.Empty:
+                pass
+
+            self._count(coalescedBatches=1, coalescedRows=len(items))
+            for kind in ['mgrs', 'wgs']:
+                selected = [i for i in items if i[0] == kind]
+                if selected:
+                    self._convertCoalesced(kind, selected)
+
+    def _convertCoalesced(self, kind, items):
+        """ Converts coalesced single point requests and resolves their
+        futures. If the batch conversion fails, items are converted one by
+        one, so a single bad request fails only its own future.
+
+        @param kind - either 'mgrs' or 'wgs'
+        @param items - list of queued (kind, args, future) tuples
+        """
+        try:
+            results = self._convertItems(kind, items)
+        except Exception:
+            for item in items:
+                try:
+                    item[2].set_result(self._convertItems(kind, [item])[0])
+                except Exception as e:
+                    item[2].set_exception(e)
+            return
+
+        for item, result in zip(items, results):
+            item[2].set_result(result)
+
+    def _convertItems(self, kind, items):
+        """ Converts single point requests with one batch call
+
+        @param kind - either 'mgrs' or 'wgs'
+        @param items - list of queued (kind, args, future) tuples
+        @returns - list of results, (MGRS string, status) or (latitude,
+        longitude, status) tuples
+        """
+        if kind == 'mgrs':
+            latitudes, longitudes, precision = zip(*[i[1] for i in items])
+            result, status = batch.toMgrsBatch(latitudes, longitudes, precision)
+            return [(str(result[i]), int(status[i])) for i in range(len(items))]
+
+        latitudes, longitudes, status = batch.toWgsBatch([i[1] for i in items])
+        return [(float(latitudes[i]), float(longitudes[i]), int(status[i])) for i in range(len(items))]
+
+    def _count(self, **values):
+        """ Increments service metrics
+
+        @param values - metric names and increments
+        """
+        with self._metricsLock:
+            for name, value in values.items():
+                self._metrics[name] += value
+
+    def _countRequest(self, path):
+        """ Increments request counter for the endpoint, unknown paths are
+        counted as 'other', so clients can not grow metrics without limit
+
+        @param path - endpoint path
+        """
+        key = path if path in _ROUTES else 'other'
+        with self._metricsLock:
+            requests = self._metrics['requests']
+            requests[key] = requests.get(key, 0) + 1
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """ HTTP/1.1 request handler with keep-alive connections
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        # headers and body are written separately, do not let Nagle's
+        # algorithm delay responses on keep-alive connections
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        service = self.server.service
+        service._countRequest(self.path)
+        if self.path == '/metrics':
+            self._respond(200, service.metrics())
+        else:
+            self._respond(404, {'error': 'Unknown endpoint'})
+
+    def do_POST(self):
+        service = self.server.service
+        service._countRequest(self.path)
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._respond(400, {'error': 'Invalid Content-Length'})
+            return
+        if length > service.maxBodySize:
+            self.close_connection = True
+            self._respond(413, {'error': 'Request body too large'})
+            return
+
+        try:
+            data = json.loads(self.rfile.read(length).decode('utf-8'))
+            code, response = service.convert(self.path, data)
+        except (ValueError, KeyError, TypeError) as e:
+            code, response = 400, {'error': 'Invalid request: {}'.format(e)}
+
+        self._respond(code, response)
+
+    def _respond(self, code, response):
+        body = json.dumps(response).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _number(value):
+    """ Converts JSON value to float, rejecting values which are not
+    numbers
+
+    @param value - decoded JSON value
+    @returns - float value
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError('Expected a number, got {!r}'.format(value))
+    return float(value)
+
+
+def _nullable(values):
+    """ Converts array of floats to list with NaN replaced by None, as
+    NaN is not valid JSON
+
+    @param values - NumPy array
+    @returns - list of floats and None values
+    """
+    return [None if v != v else v for v in values.tolist()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='MGRS conversion HTTP service')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--max-pending', type=int, default=64)
+    parser.add_argument('--profile', action='store_true', help='collect conversion statistics')
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        profiling.enable()
+
+    service = MgrsService(args.host, args.port, args.workers, args.max_pending)
+    try:
+        service.serveForever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
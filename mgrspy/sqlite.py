@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    sqlite.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import json
+import math
+import functools
+
+from mgrspy import mgrs
+
+
+# number of memoized inputs per function and connection
+CACHE_SIZE = 65536
+
+
+class MgrsFunctions(object):
+    """ MGRS conversions registered as SQLite functions on a single
+    connection. Each instance keeps its own coordinate transformations and
+    memoizes repeated inputs, so queries touching the same coordinates or
+    strings many times convert them only once. Invalid input gives NULL
+    instead of raising an error.
+    """
+
+    def __init__(self, cacheSize=CACHE_SIZE):
+        """ Creates functions with their own caches
+
+        @param cacheSize - number of memoized inputs per function
+        """
+        self._transformations = {}
+        self.fromLatLon = functools.lru_cache(maxsize=cacheSize)(self._fromLatLon)
+        self.toWgs = functools.lru_cache(maxsize=cacheSize)(self._toWgs)
+        self.parent = functools.lru_cache(maxsize=cacheSize)(self._parent)
+        self.valid = functools.lru_cache(maxsize=cacheSize)(self._valid)
+
+    def register(self, connection):
+        """ Registers functions on the connection:
+
+        mgrs_from_latlon(latitude, longitude[, precision]) - MGRS string
+        mgrs_to_lat(mgrs), mgrs_to_lon(mgrs) - latitude and longitude
+        mgrs_parent(mgrs, precision) - MGRS string of the coarser cell
+        mgrs_valid(mgrs) - 1 if string is valid, 0 otherwise
+        mgrs_cell_counts(latitude, longitude, precision) - aggregate
+        returning JSON object mapping MGRS strings to the number of rows
+
+        @param connection - sqlite3.Connection instance
+        """
+        connection.create_function('mgrs_from_latlon', 2, self.fromLatLon, deterministic=True)
+        connection.create_function('mgrs_from_latlon', 3, self.fromLatLon, deterministic=True)
+        connection.create_function('mgrs_to_lat', 1, self.toLatitude, deterministic=True)
+        connection.create_function('mgrs_to_lon', 1, self.toLongitude, deterministic=True)
+        connection.create_function('mgrs_parent', 2, self.parent, deterministic=True)
+        connection.create_function('mgrs_valid', 1, self.valid, deterministic=True)
+
+        functions = self
+
+        class CellCounts(object):
+            def __init__(self):
+                self.counts = {}
+
+            def step(self, latitude, longitude, precision):
+                cell = functions.fromLatLon(latitude, longitude, precision)
+                if cell is not None:
+                    self.counts[cell] = self.counts.get(cell, 0) + 1
+
+            def finalize(self):
+                return json.dumps(self.counts, sort_keys=True)
+
+        connection.create_aggregate('mgrs_cell_counts', 3, CellCounts)
+
+    def toLatitude(self, value):
+        """ Returns latitude of the MGRS string, None if string is invalid
+        """
+        result = self.toWgs(value)
+        return None if result is None else result[0]
+
+    def toLongitude(self, value):
+        """ Returns longitude of the MGRS string, None if string is invalid
+        """
+        result = self.toWgs(value)
+        return None if result is None else result[1]
+
+    def cacheInfo(self):
+        """ Returns statistics of the memoized inputs
+
+        @returns - dictionary mapping function name to the
+        functools.lru_cache statistics
+        """
+        return {'fromLatLon': self.fromLatLon.cache_info(), 'toWgs': self.toWgs.cache_info(),
+                'parent': self.parent.cache_info(), 'valid': self.valid.cache_info()}
+
+    def _transformation(self, srcEpsg, dstEpsg):
+        """ Returns coordinate transformation cached by this instance
+        """
+        ct = self._transformations.get((srcEpsg, dstEpsg))
+        if ct is None:
+            ct = self._transformations[(srcEpsg, dstEpsg)] = mgrs._transformation(srcEpsg, dstEpsg)
+        return ct
+
+    def _fromLatLon(self, latitude, longitude, precision=mgrs.MAX_PRECISION):
+        """ Same as toMgrs(), but returns None for invalid input
+        """
+        if not (_isNumber(latitude) and _isNumber(longitude) and _isNumber(precision)):
+            return None
+
+        if not (math.fabs(latitude) <= 90 and -180 <= longitude <= 360 and
+                0 <= precision <= mgrs.MAX_PRECISION and precision == int(precision)):
+            return None
+
+        hemisphere, zone, epsg = mgrs._zoneForWgs(latitude, longitude)
+        x, y, z = mgrs._transformPoint(self._transformation(4326, epsg), longitude, latitude)
+        if not (math.isfinite(x) and math.isfinite(y)):
+            return None
+
+        try:
+            if (latitude < -80) or (latitude > 84):
+                return mgrs._upsToMgrs(hemisphere, x, y, int(precision))
+            return mgrs._utmToMgrs(zone, hemisphere, latitude, longitude, x, y, int(precision))
+        except (mgrs.MgrsException, ValueError, IndexError):
+            return None
+
+    def _toWgs(self, value):
+        """ Same as toWgs(), but returns None for invalid input
+        """
+        grid = _grid(value)
+        if grid is None:
+            return None
+
+        zone, hemisphere, easting, northing = grid
+        epsg = (32600 if hemisphere == 'N' else 32700) + (zone or 61)
+        longitude, latitude, z = mgrs._transformPoint(self._transformation(epsg, 4326), easting, northing)
+        if not (math.isfinite(latitude) and math.isfinite(longitude)):
+            return None
+        return latitude, longitude
+
+    def _parent(self, value, precision):
+        """ Truncates valid MGRS string to the lower precision
+
+        @returns - MGRS string of the cell containing given one, None if
+        string is invalid or precision is higher than precision of the string
+        """
+        if _grid(value) is None or not _isNumber(precision) or precision != int(precision):
+            return None
+
+        zone, letters, easting, northing, current = mgrs._breakMgrsString(value)
+        precision = int(precision)
+        if not 0 <= precision <= current:
+            return None
+
+        digits = value.strip()[-2 * current:] if current else ''
+        prefix = ('{:02d}'.format(zone) if zone else '  ') + ''.join(mgrs.LETTERS[l] for l in letters)
+        return prefix + digits[:precision] + digits[current:current + precision]
+
+    def _valid(self, value):
+        """ Returns 1 if MGRS string is valid, 0 otherwise
+        """
+        return 0 if _grid(value) is None else 1
+
+
+def registerFunctions(connection, cacheSize=CACHE_SIZE):
+    """ Registers MGRS functions on the SQLite connection, see
+    MgrsFunctions.register() for the list of functions
+
+    @param connection - sqlite3.Connection instance
+    @param cacheSize - number of memoized inputs per function
+    @returns - MgrsFunctions instance owning caches of the connection
+    """
+    functions = MgrsFunctions(cacheSize)
+    functions.register(connection)
+    return functions
+
+
+def _isNumber(value):
+    """ Checks whether SQLite value is a number
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _grid(value):
+    """ Checks MGRS string with the same rules as toWgs()
+
+    @param value - MGRS coordinate string
+    @returns - tuple containing UTM zone (0 for UPS), hemisphere, easting
+    and northing or None if string is invalid
+    """
+    if not isinstance(value, str):
+        return None
+
+    try:
+        if value.lstrip()[:1].isdigit():
+            return mgrs._mgrsToUtm(value)
+        return mgrs._mgrsToUps(value)
+    except (mgrs.MgrsException, ValueError):
+        return None
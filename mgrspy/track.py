@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    track.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import math
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+from mgrspy import batch
+
+
+# part of the cell extent excluded from each side of the inner box, covers
+# curvature of the grid lines in geographic coordinates
+BOX_MARGIN = 0.05
+
+# inner box is not used for cells larger than this size in meters
+MAX_BOX_CELL_SIZE = 10000
+
+
+class TrackEncoder(object):
+    """ Converts positions of a single track to MGRS and reports only
+    transitions between cells. Encoder keeps zone transformation and inner
+    box (in geographic coordinates) of the current cell, so positions inside
+    the box are not reprojected at all.
+    """
+
+    __slots__ = ('precision', 'mgrs', 'timestamp', '_epsg', '_transformation', '_box')
+
+    def __init__(self, precision=5):
+        """ Creates encoder
+
+        @param precision - precision level of MGRS strings
+        """
+        if (precision < 0) or (precision > mgrs.MAX_PRECISION) or precision != int(precision):
+            raise mgrs.MgrsException('The precision must be between 0 and 5 inclusive.')
+
+        self.precision = int(precision)
+        self.mgrs = None
+        self.timestamp = None
+        self._epsg = None
+        self._transformation = None
+        self._box = None
+
+    def update(self, latitude, longitude, timestamp=None):
+        """ Processes next position of the track
+
+        @param latitude - latitude value
+        @param longitude - longitude value
+        @param timestamp - timestamp of the position, any value
+        @returns - tuple containing MGRS coordinate string of the entered
+        cell and timestamp if position is in the different cell than the
+        previous one, otherwise None
+        """
+        box = self._box
+        if box is not None and box[0] <= latitude <= box[1] and box[2] <= longitude <= box[3]:
+            return None
+
+        if not math.fabs(latitude) <= 90:
+            raise mgrs.MgrsException('Latitude outside of valid range (-90 to 90 degrees).')
+
+        if not -180 <= longitude <= 360:
+            raise mgrs.MgrsException('Longitude outside of valid range (-180 to 360 degrees).')
+
+        epsg = mgrs._epsgForWgs(latitude, longitude)[2]
+        if epsg != self._epsg:
+            self._epsg = epsg
+            self._transformation = mgrs._cachedTransformation(4326, epsg)
+
+        x, y = mgrs._transformPoint(self._transformation, longitude, latitude)[:2]
+        zone, hemisphere = batch._zoneForEpsg(epsg)
+        if zone == 0:
+            cell = mgrs._upsToMgrs(hemisphere, x, y, self.precision)
+        else:
+            cell = mgrs._utmToMgrs(zone, hemisphere, latitude, longitude, x, y, self.precision)
+
+        if cell == self.mgrs:
+            return None
+
+        self._box = _innerBox(zone, hemisphere, x, y, self.precision, cell, epsg) if zone != 0 else None
+        self.mgrs = cell
+        self.timestamp = timestamp
+        return cell, timestamp
+
+    def reset(self):
+        """ Forgets current cell, next position is always reported as
+        transition
+        """
+        self.mgrs = None
+        self.timestamp = None
+        self._box = None
+
+
+def encodeTracks(positions, precision=5):
+    """ Converts positions of many tracks to MGRS, reporting only
+    transitions between cells. Each track gets its own TrackEncoder.
+
+    @param positions - iterable of (track id, timestamp, latitude,
+    longitude) tuples
+    @param precision - precision level of MGRS strings
+    @returns - iterator over (track id, MGRS coordinate string, timestamp)
+    tuples, one for each entered cell
+    """
+    encoders = {}
+    for trackId, timestamp, latitude, longitude in positions:
+        encoder = encoders.get(trackId)
+        if encoder is None:
+            encoder = encoders[trackId] = TrackEncoder(precision)
+
+        transition = encoder.update(latitude, longitude, timestamp)
+        if transition is not None:
+            yield trackId, transition[0], transition[1]
+
+
+def _innerBox(zone, hemisphere, easting, northing, precision, cell, epsg):
+    """ Calculates latitude and longitude box lying inside the UTM cell, the
+    current zone and latitude band
+
+    @param zone - UTM zone number
+    @param hemisphere - hemisphere either 'N' or 'S'
+    @param easting - easting of the position inside the cell
+    @param northing - northing of the position inside the cell
+    @param precision - precision level of MGRS string
+    @param cell - MGRS coordinate string of the cell
+    @param epsg - EPSG code of the zone
+    @returns - tuple containing minimum and maximum latitude, minimum and
+    maximum longitude or None if box can not be used
+    """
+    size = 10.0 ** (mgrs.MAX_PRECISION - precision)
+    if size > MAX_BOX_CELL_SIZE:
+        return None
+
+    # corners and edge midpoints, first index is easting, second northing
+    offsets = np.array([0.0, 0.5, 1.0]) * size
+    eastings = math.floor((easting + 1e-8) / size) * size + offsets
+    northings = math.floor((northing + 1e-8) / size) * size + offsets
+    latitudes, longitudes = grid._utmToWgs(zone, hemisphere == 'N', np.repeat(eastings, 3), np.tile(northings, 3))
+    latitudes = latitudes.reshape(3, 3)
+    longitudes = longitudes.reshape(3, 3)
+
+    south, north = latitudes[:, 0].max(), latitudes[:, 2].min()
+    west, east = longitudes[0].max(), longitudes[2].min()
+    marginLatitude = (north - south) * BOX_MARGIN
+    marginLongitude = (east - west) * BOX_MARGIN
+    box = (float(south + marginLatitude), float(north - marginLatitude),
+           float(west + marginLongitude), float(east - marginLongitude))
+    if box[0] >= box[1] or box[2] >= box[3]:
+        return None
+
+    # box must not cross zone or latitude band boundaries
+    for latitude in box[:2]:
+        for longitude in box[2:]:
+            if mgrs._epsgForWgs(latitude, longitude)[2] != epsg:
+                return None
+
+    if (grid._latitudeLetter(np.array(box[:2])) != mgrs.ALPHABET[cell[2]]).any():
+        return None
+
+    return box
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    traversal.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+from mgrspy import zones
+
+
+# maximum length of the straight piece in degrees, path between vertices is
+# linear in geographic coordinates and it is approximated by straight lines
+# in grid coordinates of this length
+MAX_STEP = 0.01
+
+# longitudes and latitudes where UTM zone, latitude band or UPS area can
+# change, all zone boundaries (including the 32V and 31X-37X special cases)
+# are multiples of 3 degrees
+_ZONE_STEP = 3.0
+_BAND_BOUNDARIES = np.append(np.arange(-80.0, 73.0, 8.0), 84.0)
+
+# shortest part of the segment or piece which is handled separately
+_TOLERANCE = 1e-9
+
+
+def traverseLine(latitudes, longitudes, precision=5):
+    """ Enumerates MGRS cells crossed by a polyline, including cells lying
+    between its vertices. Path between two vertices is linear in geographic
+    coordinates and always takes the shorter way around the antimeridian.
+
+    @param latitudes - array-like of vertex latitudes
+    @param longitudes - array-like of vertex longitudes
+    @param precision - precision level of MGRS strings
+    @returns - tuple containing array of MGRS coordinate strings in order
+    of traversal, arrays of entry and exit fractions. Fraction is a vertex
+    index with a fractional part, e.g. 2.25 is a quarter of the way from
+    the third to the fourth vertex.
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64).ravel()
+    longitudes = np.asarray(longitudes, dtype=np.float64).ravel()
+    if len(latitudes) != len(longitudes):
+        raise ValueError('Latitude and longitude arrays must have the same length')
+
+    cells, entries, exits, track = _traverse(latitudes, longitudes, np.array([len(latitudes)]), precision)
+    return cells, entries, exits
+
+
+def traverseTracks(tracks, precision=5):
+    """ Enumerates MGRS cells crossed by many polylines at once, see
+    traverseLine() for details
+
+    @param tracks - iterable of (track id, latitudes, longitudes) tuples
+    @param precision - precision level of MGRS strings
+    @returns - list of (track id, MGRS coordinate strings, entry fractions,
+    exit fractions) tuples in order of the input tracks
+    """
+    ids = []
+    latitudes = []
+    longitudes = []
+    for trackId, lat, lon in tracks:
+        lat = np.asarray(lat, dtype=np.float64).ravel()
+        lon = np.asarray(lon, dtype=np.float64).ravel()
+        if len(lat) != len(lon):
+            raise ValueError('Latitude and longitude arrays must have the same length')
+        ids.append(trackId)
+        latitudes.append(lat)
+        longitudes.append(lon)
+
+    if not ids:
+        return []
+
+    counts = np.array([len(lat) for lat in latitudes])
+    cells, entries, exits, track = _traverse(np.concatenate(latitudes), np.concatenate(longitudes), counts, precision)
+    bounds = np.searchsorted(track, np.arange(len(ids) + 1))
+    return [(trackId, cells[bounds[i]:bounds[i + 1]], entries[bounds[i]:bounds[i + 1]], exits[bounds[i]:bounds[i + 1]])
+            for i, trackId in enumerate(ids)]
+
+
+def _traverse(latitudes, longitudes, counts, precision):
+    """ Enumerates MGRS cells crossed by concatenated polylines
+
+    @param latitudes - array of vertex latitudes
+    @param longitudes - array of vertex longitudes
+    @param counts - array of vertex counts of the polylines
+    @param precision - precision level of MGRS strings
+    @returns - tuple containing arrays of MGRS coordinate strings, entry
+    and exit fractions and polyline indices
+    """
+    if (precision < 0) or (precision > mgrs.MAX_PRECISION) or precision != int(precision):
+        raise mgrs.MgrsException('The precision must be between 0 and 5 inclusive.')
+
+    if not (np.abs(latitudes) <= 90).all():
+        raise mgrs.MgrsException('Latitude outside of valid range (-90 to 90 degrees).')
+
+    if not ((longitudes >= -180) & (longitudes <= 360)).all():
+        raise mgrs.MgrsException('Longitude outside of valid range (-180 to 360 degrees).')
+
+    # single vertex makes a segment of zero length
+    segmentCounts = np.where(counts > 0, np.maximum(counts - 1, 1), 0)
+    track, index = _expand(segmentCounts)
+    firsts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    start = firsts[track] + index
+    end = np.minimum(start + 1, firsts[track] + counts[track] - 1)
+
+    lat0 = latitudes[start]
+    lon0 = longitudes[start]
+    dlat = latitudes[end] - lat0
+    dlon = (longitudes[end] - lon0 + 180.0) % 360.0 - 180.0
+
+    segment, t0, t1 = _pieces(lat0, lon0, dlat, dlon)
+    # start, middle and end points of the pieces
+    parameters = np.column_stack((t0, (t0 + t1) / 2, t1))
+    latitudes = lat0[segment, None] + parameters * dlat[segment, None]
+    longitudes = lon0[segment, None] + parameters * dlon[segment, None]
+    longitudes = (longitudes + 180.0) % 360.0 - 180.0
+
+    # each piece lies in a single zone and latitude band
+    zone, band, north, epsg = zones.classifyZones(latitudes[:, 1], longitudes[:, 1])
+    x0, y0 = grid._wgsToGrid(zone, north, latitudes[:, 0], longitudes[:, 0])
+    x1, y1 = grid._wgsToGrid(zone, north, latitudes[:, 2], longitudes[:, 2])
+
+    size = 10.0 ** (mgrs.MAX_PRECISION - int(precision))
+    piece, a, b = _walk(x0, y0, x1, y1, size)
+    t = (a + b) / 2
+    easting = (np.floor((x0[piece] + t * (x1[piece] - x0[piece])) / size) + 0.5) * size
+    northing = (np.floor((y0[piece] + t * (y1[piece] - y0[piece])) / size) + 0.5) * size
+    cells = _cells(zone[piece], north[piece], latitudes[piece, 1], easting, northing, precision)
+
+    # fractions are clamped to the last vertex for single vertex polylines
+    segment = segment[piece]
+    track = track[segment]
+    start = t0[piece]
+    end = t1[piece]
+    last = np.maximum(counts[track] - 1, 0)
+    entries = np.minimum(index[segment] + start * (1 - a) + end * a, last)
+    exits = np.minimum(index[segment] + start * (1 - b) + end * b, last)
+
+    # merge runs of the same cell
+    starts = np.flatnonzero(np.concatenate(([True], (cells[1:] != cells[:-1]) | (track[1:] != track[:-1]))))
+    ends = np.append(starts[1:], len(cells)) - 1
+    return cells[starts], entries[starts], exits[ends], track[starts]
+
+
+def _pieces(lat0, lon0, dlat, dlon):
+    """ Splits segments at zone and latitude band boundaries and into
+    pieces not longer than MAX_STEP
+
+    @param lat0 - array of segment start latitudes
+    @param lon0 - array of segment start longitudes
+    @param dlat - array of latitude differences
+    @param dlon - array of longitude differences
+    @returns - tuple containing arrays of segment indices, start and end
+    parameters of the pieces
+    """
+    lon1 = lon0 + dlon
+    lat1 = lat0 + dlat
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # zone boundaries
+        first = np.floor(np.minimum(lon0, lon1) / _ZONE_STEP) + 1
+        count = np.maximum(np.ceil(np.maximum(lon0, lon1) / _ZONE_STEP) - first, 0).astype(np.int64)
+        zoneSegment, k = _expand(count)
+        zoneT = ((first[zoneSegment] + k) * _ZONE_STEP - lon0[zoneSegment]) / dlon[zoneSegment]
+
+        # latitude band boundaries
+        first = np.searchsorted(_BAND_BOUNDARIES, np.minimum(lat0, lat1), 'right')
+        count = np.maximum(np.searchsorted(_BAND_BOUNDARIES, np.maximum(lat0, lat1), 'left') - first, 0)
+        bandSegment, k = _expand(count)
+        bandT = (_BAND_BOUNDARIES[first[bandSegment] + k] - lat0[bandSegment]) / dlat[bandSegment]
+
+        # uniform subdivision
+        steps = np.maximum(np.ceil(np.maximum(np.abs(dlat), np.abs(dlon)) / MAX_STEP), 1).astype(np.int64)
+        stepSegment, k = _expand(steps + 1)
+        stepT = k / steps[stepSegment]
+
+    return _intervals(np.concatenate((stepSegment, zoneSegment, bandSegment)), np.concatenate((stepT, zoneT, bandT)))
+
+
+def _walk(x0, y0, x1, y1, size):
+    """ Finds intervals of the straight pieces lying in single grid cells
+
+    @param x0 - array of piece start eastings
+    @param y0 - array of piece start northings
+    @param x1 - array of piece end eastings
+    @param y1 - array of piece end northings
+    @param size - size of the cells in meters
+    @returns - tuple containing arrays of piece indices, start and end
+    parameters of the intervals
+    """
+    pieces = []
+    values = []
+    for start, end in ((x0, x1), (y0, y1)):
+        first = np.floor(start / size)
+        last = np.floor(end / size)
+        step = np.where(last >= first, 1.0, -1.0)
+        piece, k = _expand(np.abs(last - first).astype(np.int64))
+        boundary = (first[piece] + np.where(step[piece] > 0, k + 1, -k)) * size
+        pieces.append(piece)
+        values.append((boundary - start[piece]) / (end[piece] - start[piece]))
+
+    count = len(x0)
+    return _intervals(np.concatenate([np.arange(count), np.arange(count)] + pieces),
+                      np.concatenate([np.zeros(count), np.ones(count)] + values))
+
+
+def _intervals(index, t):
+    """ Sorts split parameters and creates intervals between them.
+    Intervals of (almost) zero length touch cell corners only or come from
+    rounding errors at zone and band boundaries, they are joined to the
+    previous interval.
+
+    @param index - array of split owner indices, each owner must have
+    splits at 0 and 1
+    @param t - array of split parameters
+    @returns - tuple containing arrays of owner indices, start and end
+    parameters of the intervals
+    """
+    order = np.lexsort((t, index))
+    index = index[order]
+    t = t[order]
+
+    intervals = np.flatnonzero((index[1:] == index[:-1]) & (t[1:] - t[:-1] > _TOLERANCE))
+    index = index[intervals]
+    end = t[intervals + 1]
+    first = np.concatenate(([True], index[1:] != index[:-1]))
+    last = np.append(first[1:], True)
+    start = np.where(first, 0.0, np.roll(end, 1))
+    return index, start, np.where(last, 1.0, end)
+
+
+def _cells(zone, north, latitude, easting, northing, precision):
+    """ Creates MGRS strings of the cells
+
+    @param zone - array of UTM zones, 0 for UPS
+    @param north - boolean array, True for northern hemisphere
+    @param latitude - array of latitudes inside the cells
+    @param easting - array of eastings of the cell centres
+    @param northing - array of northings of the cell centres
+    @param precision - precision level of MGRS strings
+    @returns - array of MGRS coordinate strings
+    """
+    precision = np.full(len(zone), precision)
+    status = np.zeros(len(zone), dtype=np.uint8)
+    components = [np.zeros(len(zone), dtype=np.int64) for i in range(7)]
+    for ups, convert in ((False, grid._utmToComponents), (True, grid._upsToComponents)):
+        rows = np.flatnonzero((zone == 0) == ups)
+        if ups:
+            values, status[rows] = convert(north[rows], easting[rows], northing[rows], precision[rows])
+        else:
+            values, status[rows] = convert(zone[rows], north[rows], latitude[rows], easting[rows],
+                                           northing[rows], precision[rows])
+        for c, v in zip(components, values):
+            c[rows] = v
+
+    grid._check(status)
+    return grid._format(components, status)
+
+
+def _expand(counts):
+    """ Enumerates ranges of the given lengths
+
+    @param counts - array of range lengths
+    @returns - tuple containing arrays of range indices and positions
+    inside the ranges
+    """
+    index = np.repeat(np.arange(len(counts)), counts)
+    starts = np.cumsum(counts) - counts
+    return index, np.arange(len(index)) - starts[index]
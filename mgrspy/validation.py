@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    validation.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+
+from mgrspy import mgrs
+
+
+# Zone (2 digits), 3 letters, easting and northing (5 digits each)
+MAX_LENGTH = 15
+
+_ZERO = ord('0')
+_UPPER_A = ord('A')
+_LOWER_A = ord('a')
+_SPACE = ord(' ')
+_NEWLINE = ord('\n')
+
+# number of records parsed at once by parseBuffer()
+CHUNK_SIZE = 1 << 14
+
+# 2nd letter low and high values indexed by (set number - 1) % 3,
+# see _gridValues()
+_UTM_LTR2_LOW = np.array([mgrs.ALPHABET['A'], mgrs.ALPHABET['J'], mgrs.ALPHABET['S']])
+_UTM_LTR2_HIGH = np.array([mgrs.ALPHABET['H'], mgrs.ALPHABET['R'], mgrs.ALPHABET['Z']])
+
+# UPS_CONSTANTS indexed by the first letter, -1 marks non-polar letters
+_UPS_INDEX = np.full(26, -1)
+_UPS_INDEX[[mgrs.ALPHABET['A'], mgrs.ALPHABET['B'], mgrs.ALPHABET['Y'], mgrs.ALPHABET['Z']]] = [0, 1, 2, 3]
+_UPS_CONSTANTS = np.array([mgrs.UPS_CONSTANTS[i] for i in range(4)])
+_UPS_INVALID = np.zeros(26, dtype=bool)
+_UPS_INVALID[[mgrs.ALPHABET[c] for c in 'DEMNVW']] = True
+
+
+def validateMgrs(mgrsStrings):
+    """ Checks array of MGRS coordinate strings using the same rules as
+    toWgs(), but without any coordinate transformations.
+
+    @param mgrsStrings - array-like of MGRS coordinate strings
+    @returns - array of per-row status codes (STATUS_* constants from the
+    mgrs module)
+    """
+    codes, shape = _codes(mgrsStrings)
+    return _parse(codes)[0].reshape(shape)
+
+
+def canonicalizeMgrs(mgrsStrings):
+    """ Checks array of MGRS coordinate strings and converts valid ones to
+    the canonical form produced by toMgrs(): upper-case letters, zero padded
+    two-digit zone or two leading spaces for UPS and no other whitespace.
+
+    @param mgrsStrings - array-like of MGRS coordinate strings
+    @returns - tuple containing array of canonical MGRS strings (empty for
+    invalid rows) and array of per-row status codes
+    """
+    codes, shape = _codes(mgrsStrings)
+    status, zone, letters, easting, northing, precision, digits = _parse(codes)
+
+    out = np.zeros((len(status), MAX_LENGTH), dtype=np.uint32)
+    out[:, 0] = np.where(zone > 0, zone // 10 + _ZERO, _SPACE)
+    out[:, 1] = np.where(zone > 0, zone % 10 + _ZERO, _SPACE)
+    out[:, 2:5] = letters + _UPPER_A
+    out[:, 5:] = digits
+    out[status != mgrs.STATUS_OK] = 0
+
+    result = np.ascontiguousarray(out).view('U%d' % MAX_LENGTH).ravel()
+    return result.reshape(shape), status.reshape(shape)
+
+
+def parseBuffer(buffer, separator=None, chunkSize=CHUNK_SIZE):
+    """ Parses MGRS coordinate strings stored as separated records in a
+    bytes-like object, with the same rules as toWgs(). Records are decoded
+    directly from the buffer into numeric arrays, no Python objects are
+    created per record. Leading and trailing whitespace of the records is
+    ignored, so CRLF line endings are supported.
+
+    @param buffer - bytes, bytearray, memoryview, mmap or any other object
+    supporting buffer protocol
+    @param separator - single byte separating records, None means both
+    newline and NUL. Separator at the end of the buffer does not start a
+    new record.
+    @param chunkSize - number of records parsed at once, limits memory used
+    for intermediate arrays
+    @returns - tuple containing arrays of status codes, UTM zones (0 for
+    UPS), letters (one row per record), easting and northing (as written in
+    the record), and precision, see _parse()
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if separator is None:
+        ends = np.flatnonzero((data == _NEWLINE) | (data == 0))
+    elif isinstance(separator, (bytes, bytearray)) and len(separator) == 1:
+        ends = np.flatnonzero(data == separator[0])
+    else:
+        raise ValueError('Separator must be a single byte or None')
+
+    if len(data) > 0 and (len(ends) == 0 or ends[-1] != len(data) - 1):
+        ends = np.append(ends, len(data))
+    starts = np.concatenate(([0], ends + 1))[:len(ends)].astype(np.int64)
+
+    # first and last non-blank character of each record, sentinels on both
+    # sides make lookups of empty records safe
+    blank = (data == 0) | (data == _SPACE) | ((data >= 9) & (data <= 13))
+    characters = np.concatenate(([-1], np.flatnonzero(~blank), [len(data)]))
+    first = characters[np.searchsorted(characters, starts)]
+    last = characters[np.searchsorted(characters, ends) - 1]
+    empty = first >= ends
+
+    count = len(starts)
+    status = np.zeros(count, dtype=np.uint8)
+    zone = np.zeros(count, dtype=np.int64)
+    letters = np.zeros((count, 3), dtype=np.int64)
+    easting = np.zeros(count)
+    northing = np.zeros(count)
+    precision = np.zeros(count, dtype=np.int64)
+
+    # only the first MAX_LENGTH characters are parsed, records longer than
+    # the longest valid string are malformed whatever follows
+    columns = np.arange(MAX_LENGTH)
+    tooLong = ~empty & (last - first + 1 > MAX_LENGTH)
+    for start in range(0, count, chunkSize):
+        stop = min(start + chunkSize, count)
+        idx = first[start:stop, None] + columns
+        inside = (idx <= last[start:stop, None]) & ~empty[start:stop, None]
+        codes = np.where(inside, data[np.minimum(idx, len(data) - 1)], 0)
+        parsed = _parse(codes.astype(np.uint32))
+        status[start:stop], zone[start:stop], letters[start:stop] = parsed[:3]
+        easting[start:stop], northing[start:stop], precision[start:stop] = parsed[3:6]
+        status[start:stop][tooLong[start:stop]] = mgrs.STATUS_MALFORMED
+
+    return status, zone, letters, easting, northing, precision
+
+
+def _codes(mgrsStrings):
+    """ Converts array of strings to the matrix of character codes, one row
+    per string. Values which are not strings become empty rows.
+
+    @param mgrsStrings - array-like of MGRS coordinate strings
+    @returns - tuple containing character codes matrix and original shape
+    """
+    values = np.asarray(mgrsStrings)
+    if values.dtype.kind == 'O':
+        values = np.array([v if isinstance(v, str) else '' for v in values.ravel()]).reshape(values.shape)
+
+    shape = values.shape
+    if values.dtype.kind == 'S':
+        width = values.dtype.itemsize
+        codes = np.ascontiguousarray(values).view(np.uint8).reshape(-1, width).astype(np.uint32)
+    elif values.dtype.kind == 'U':
+        width = values.dtype.itemsize // 4
+        codes = np.ascontiguousarray(values).view(np.uint32).reshape(-1, width)
+    else:
+        codes = np.zeros((values.size, 0), dtype=np.uint32)
+
+    return codes, shape
+
+
+def _parse(codes):
+    """ Breaks down MGRS coordinate strings given as a matrix of character
+    codes (zero-padded rows) into their component parts and checks them
+    with the rules of _breakMgrsString(), _mgrsToUtm() and _mgrsToUps().
+
+    @param codes - matrix of character codes, one row per string
+    @returns - tuple containing arrays of status codes, UTM zones (0 for
+    UPS), letters (one row per string), easting and northing (as written in
+    the string, like _breakMgrsString() does), precision and a matrix of
+    easting and northing digit character codes
+    """
+    count = codes.shape[0]
+    # leave room for the longest valid string plus one extra character
+    width = max(codes.shape[1], MAX_LENGTH + 1)
+    codes = np.pad(codes, ((0, 0), (0, width - codes.shape[1])))
+    columns = np.arange(width)
+    rows = np.arange(count)[:, None]
+
+    # skip leading and trailing whitespace
+    blank = (codes == 0) | (codes == _SPACE) | ((codes >= 9) & (codes <= 13))
+    start = np.where(blank.all(axis=1), width, np.argmax(~blank, axis=1))
+    length = width - np.argmax(~blank[:, ::-1], axis=1) - start
+    length[start == width] = 0
+    shifted = start[:, None] + columns
+    codes = np.where((columns < length[:, None]) & (shifted < width),
+                     codes[rows, np.minimum(shifted, width - 1)], 0)
+
+    isDigit = (codes >= _ZERO) & (codes <= _ZERO + 9)
+    upper = np.where((codes >= _LOWER_A) & (codes < _LOWER_A + 26), codes - 32, codes)
+    isLetter = (upper >= _UPPER_A) & (upper < _UPPER_A + 26)
+
+    status = np.zeros(count, dtype=np.uint8)
+
+    def fail(condition, code):
+        status[(status == mgrs.STATUS_OK) & condition] = code
+
+    # zone
+    zoneDigits = np.where(isDigit[:, 0], np.where(isDigit[:, 1], np.where(isDigit[:, 2], 3, 2), 1), 0)
+    fail(zoneDigits > 2, mgrs.STATUS_MALFORMED)
+    first = codes[:, 0].astype(np.int64) - _ZERO
+    second = codes[:, 1].astype(np.int64) - _ZERO
+    zone = np.where(zoneDigits == 1, first, np.where(zoneDigits == 2, first * 10 + second, 0))
+    fail((zoneDigits > 0) & ((zone < 1) | (zone > 60)), mgrs.STATUS_INVALID_ZONE_BAND)
+    zoneDigits = np.minimum(zoneDigits, 2)
+
+    # letters
+    idx = zoneDigits[:, None] + np.arange(3)
+    fail(~np.take_along_axis(isLetter, idx, axis=1).all(axis=1), mgrs.STATUS_MALFORMED)
+    letters = np.take_along_axis(upper, idx, axis=1).astype(np.int64) - _UPPER_A
+    letters = np.where(np.take_along_axis(isLetter, idx, axis=1), letters, 0)
+
+    # easting and northing
+    first = zoneDigits + 3
+    numDigits = np.maximum(length - first, 0)
+    region = (columns >= first[:, None]) & (columns < length[:, None])
+    fail((region & ~isDigit).any(axis=1) | (numDigits % 2 == 1) | (numDigits > 2 * mgrs.MAX_PRECISION),
+         mgrs.STATUS_MALFORMED)
+    numDigits = np.where(status == mgrs.STATUS_OK, numDigits, 0)
+    precision = numDigits // 2
+
+    idx = np.minimum(first[:, None] + np.arange(2 * mgrs.MAX_PRECISION), width - 1)
+    digits = np.where(np.arange(2 * mgrs.MAX_PRECISION) < numDigits[:, None],
+                      np.take_along_axis(codes, idx, axis=1), 0)
+    values = np.where(digits > 0, digits.astype(np.int64) - _ZERO, 0)
+    easting = np.zeros(count)
+    northing = np.zeros(count)
+    for k in range(mgrs.MAX_PRECISION):
+        used = k < precision
+        easting = np.where(used, easting * 10 + values[:, k], easting)
+        northing = np.where(used, northing * 10 + values[rows[:, 0], np.minimum(precision + k, 2 * mgrs.MAX_PRECISION - 1)], northing)
+
+    # letters validity
+    fail(((letters == mgrs.ALPHABET['I']) | (letters == mgrs.ALPHABET['O'])).any(axis=1), mgrs.STATUS_INVALID_LETTER)
+
+    utm = zone > 0
+    band, column, row = letters[:, 0], letters[:, 1], letters[:, 2]
+    fail(utm & ((band < mgrs.ALPHABET['C']) | (band > mgrs.ALPHABET['X'])), mgrs.STATUS_INVALID_ZONE_BAND)
+    fail(utm & (band == mgrs.ALPHABET['X']) & np.isin(zone, [32, 34, 36]), mgrs.STATUS_INVALID_ZONE_BAND)
+    setIdx = (np.where(zone % 6 == 0, 6, zone % 6) - 1) % 3
+    fail(utm & ((column < _UTM_LTR2_LOW[setIdx]) | (column > _UTM_LTR2_HIGH[setIdx]) | (row > mgrs.ALPHABET['V'])),
+         mgrs.STATUS_INVALID_LETTER)
+
+    upsIdx = _UPS_INDEX[band]
+    fail(~utm & (upsIdx < 0), mgrs.STATUS_INVALID_ZONE_BAND)
+    constants = _UPS_CONSTANTS[np.maximum(upsIdx, 0)]
+    fail(~utm & ((column < constants[:, 1]) | (column > constants[:, 2]) | _UPS_INVALID[column] |
+                 (row > constants[:, 3])), mgrs.STATUS_INVALID_LETTER)
+
+    return status, zone, letters, easting, northing, precision, digits
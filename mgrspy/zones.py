@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    zones.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+
+
+A = mgrs.ALPHABET
+
+# band value of the rows outside of valid latitude or longitude range
+INVALID = -1
+
+# grouping levels supported by zoneHistogram()
+_LEVELS = ('epsg', 'zone', 'gzd')
+
+# Svalbard zones, (western longitude, eastern longitude, zone)
+_X_ZONES = ((0.0, 9.0, 31), (9.0, 21.0, 33), (21.0, 33.0, 35), (33.0, 42.0, 37))
+
+
+def classifyZones(latitudes, longitudes):
+    """ Vectorized version of _epsgForWgs(), classifies geodetic coordinates
+    into UTM zones (including the 32V and 31X-37X special cases) or UPS
+    areas using a few array operations
+
+    @param latitudes - array-like of latitude values
+    @param longitudes - array-like of longitude values
+    @returns - tuple containing arrays of zones (0 for UPS), first MGRS
+    letters (latitude band or UPS letter, 0 for 'A'), booleans (True for
+    northern hemisphere) and EPSG codes. Rows outside of valid latitude or
+    longitude range get INVALID letter and EPSG code 0.
+    """
+    latitudes, longitudes = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64),
+                                                np.asarray(longitudes, dtype=np.float64))
+
+    with np.errstate(invalid='ignore'):
+        valid = (np.abs(latitudes) <= 90) & (longitudes >= -180) & (longitudes <= 360)
+        north = latitudes >= 0
+        ups = (latitudes <= -80) | (latitudes >= 84)
+
+        lon = np.where(valid, longitudes, 0.0)
+        zone = np.where(lon < 180, np.trunc(31 + lon / 6.0), np.trunc(lon / 6.0 - 29)).astype(np.int64)
+        zone[zone > 60] = 1
+
+        zone[(latitudes >= 56) & (latitudes < 64) & (lon >= 3) & (lon < 12)] = 32
+        svalbard = (latitudes >= 72) & (latitudes < 84)
+        for west, east, z in _X_ZONES:
+            zone[svalbard & (lon >= west) & (lon < east)] = z
+
+        # UPS letter depends on the side of the 0/180 meridians, points at
+        # the poles have easting of the false origin
+        east = (np.sin(np.radians(lon)) >= 0) | (np.abs(latitudes) == 90)
+        upsLetter = np.where(north, np.where(east, A['Z'], A['Y']), np.where(east, A['B'], A['A']))
+
+        band = np.where(ups, upsLetter, grid._latitudeLetter(latitudes))
+        zone = np.where(ups, 0, zone)
+
+    epsg = np.where(north, 32600, 32700) + np.where(ups, 61, zone)
+    return (np.where(valid, zone, 0), np.where(valid, band, INVALID), north & valid,
+            np.where(valid, epsg, 0))
+
+
+def zoneHistogram(latitudes, longitudes, level='epsg'):
+    """ Counts geodetic coordinates per UTM zone or UPS area, e.g. for
+    planning shards and sizing per-zone batches before conversion. Rows
+    outside of valid range are not counted.
+
+    @param latitudes - array-like of latitude values
+    @param longitudes - array-like of longitude values
+    @param level - either 'epsg' (counts per EPSG code), 'zone' (per zone
+    number, 0 for UPS, both hemispheres together) or 'gzd' (per grid zone
+    designator such as '18S', UPS areas are labelled with their letter)
+    @returns - dictionary mapping EPSG code, zone or grid zone designator
+    to the number of rows
+    """
+    if level not in _LEVELS:
+        raise ValueError('Unknown histogram level: {}'.format(level))
+
+    zone, band, north, epsg = classifyZones(latitudes, longitudes)
+    valid = band != INVALID
+    if level == 'epsg':
+        counts = np.bincount(epsg[valid] - 32600)
+        return dict((32600 + int(i), int(counts[i])) for i in np.flatnonzero(counts))
+
+    if level == 'zone':
+        counts = np.bincount(zone[valid])
+        return dict((int(i), int(counts[i])) for i in np.flatnonzero(counts))
+
+    counts = np.bincount(zone[valid] * 26 + band[valid])
+    return dict((_gzdLabel(*divmod(int(i), 26)), int(counts[i])) for i in np.flatnonzero(counts))
+
+
+def _gzdLabel(zone, band):
+    """ Formats grid zone designator
+
+    @param zone - UTM zone, 0 for UPS
+    @param band - first MGRS letter, 0 for 'A'
+    @returns - grid zone designator such as '18S', UPS areas are labelled
+    with their letter only
+    """
+    letter = chr(ord('A') + band)
+    return '{:02d}{}'.format(zone, letter) if zone > 0 else letter
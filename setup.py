@@ -11,6 +11,9 @@ setup(
     name='mgrspy',
     version='0.2.2',
     install_requires=['GDAL>=1.10.0', 'future'],
+    extras_require={'numpy': ['numpy'],
+                    'arrow': ['numpy', 'pyarrow'],
+                    'pandas': ['numpy', 'pandas']},
     author='Alexander Bruy',
     author_email='abruy@boundlessgeo.com',
     description='Convert WGS84 coordinates to MGRS and back',
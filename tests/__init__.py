@@ -26,13 +26,57 @@ __revision__ = '$Format:%H$'
 
 import unittest
 
-from tests.mrgstest import MgrsTest
+from tests.mgrstest import MgrsTest
 from tests.utilstest import UtilsTest
+from tests.profilingtest import ProfilingTest
+from tests.batchtest import BatchTest
+from tests.validationtest import ValidationTest
+from tests.arrowtest import ArrowTest
+from tests.geojsontest import GeoJsonTest
+from tests.paralleltest import ParallelTest
+from tests.servicetest import ServiceTest
+from tests.gridtest import GridTest
+from tests.mgrsarraytest import MgrsArrayTest
+from tests.orderingtest import OrderingTest
+from tests.proximitytest import ProximityTest
+from tests.tracktest import TrackTest
+from tests.gridlinestest import GridLinesTest
+from tests.zonestest import ZonesTest
+from tests.partitiontest import PartitionTest
+from tests.sqlitetest import SqliteTest
+from tests.dataframetest import DataFrameTest
+from tests.extracttest import ExtractTest
+from tests.traversaltest import TraversalTest
+from tests.geofencetest import GeofenceTest
+from tests.diskcachetest import DiskCacheTest
+from tests.archivetest import ArchiveTest
 
 
 def suite():
     suite = unittest.TestSuite()
     suite.addTests(unittest.makeSuite(UtilsTest, 'test'))
     suite.addTests(unittest.makeSuite(MgrsTest, 'test'))
+    suite.addTests(unittest.makeSuite(ProfilingTest, 'test'))
+    suite.addTests(unittest.makeSuite(BatchTest, 'test'))
+    suite.addTests(unittest.makeSuite(ValidationTest, 'test'))
+    suite.addTests(unittest.makeSuite(ArrowTest, 'test'))
+    suite.addTests(unittest.makeSuite(GeoJsonTest, 'test'))
+    suite.addTests(unittest.makeSuite(ParallelTest, 'test'))
+    suite.addTests(unittest.makeSuite(ServiceTest, 'test'))
+    suite.addTests(unittest.makeSuite(GridTest, 'test'))
+    suite.addTests(unittest.makeSuite(MgrsArrayTest, 'test'))
+    suite.addTests(unittest.makeSuite(OrderingTest, 'test'))
+    suite.addTests(unittest.makeSuite(ProximityTest, 'test'))
+    suite.addTests(unittest.makeSuite(TrackTest, 'test'))
+    suite.addTests(unittest.makeSuite(GridLinesTest, 'test'))
+    suite.addTests(unittest.makeSuite(ZonesTest, 'test'))
+    suite.addTests(unittest.makeSuite(PartitionTest, 'test'))
+    suite.addTests(unittest.makeSuite(SqliteTest, 'test'))
+    suite.addTests(unittest.makeSuite(DataFrameTest, 'test'))
+    suite.addTests(unittest.makeSuite(ExtractTest, 'test'))
+    suite.addTests(unittest.makeSuite(TraversalTest, 'test'))
+    suite.addTests(unittest.makeSuite(GeofenceTest, 'test'))
+    suite.addTests(unittest.makeSuite(DiskCacheTest, 'test'))
+    suite.addTests(unittest.makeSuite(ArchiveTest, 'test'))
 
     return suite
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    archivetest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import archive
+from mgrspy.mgrsarray import MgrsArray
+
+
+class ArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cells.mgrsarc')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _strings(self, count=1000):
+        rng = np.random.RandomState(5)
+        latitudes = np.append(rng.uniform(38.5, 39.5, count), rng.uniform(-90, 90, count // 4))
+        longitudes = np.append(rng.uniform(-77.5, -76.5, count), rng.uniform(-180, 180, count // 4))
+        precisions = rng.randint(0, 6, len(latitudes))
+        return np.array([mgrs.toMgrs(lat, lon, int(p)) for lat, lon, p in zip(latitudes, longitudes, precisions)])
+
+    def testRoundTrip(self):
+        strings = self._strings()
+        ids = np.arange(len(strings)) * 3
+        with archive.ArchiveWriter(self.path) as writer:
+            writer.write(strings[:500], ids[:500])
+            writer.write(MgrsArray.fromStrings(strings[500:])[0], ids[500:])
+            self.assertEqual(writer.count, len(strings))
+
+        with archive.ArchiveReader(self.path) as reader:
+            self.assertEqual(len(reader), len(strings))
+            cells, result = reader.read()
+            self.assertEqual(list(cells.toStrings()), list(strings[result // 3]))
+            self.assertEqual(sorted(result), list(ids))
+
+            labels = set(s[:5].strip() for s in strings)
+            self.assertEqual(reader.squares(), sorted(labels))
+
+    def testPrefix(self):
+        strings = self._strings()
+        archive.writeArchive(self.path, strings, chunkSize=700)
+        with archive.ArchiveReader(self.path) as reader:
+            for prefix in ['18', '18S', '18SUJ', 'Y', ' b', '99']:
+                cells, ids = reader.read(prefix)
+                self.assertIsNone(ids)
+                expected = sorted(s for s in strings if s.strip().startswith(prefix.strip().upper()))
+                self.assertEqual(sorted(cells.toStrings()), expected)
+
+            for label, cells, ids in reader.iterBlocks('18SUJ'):
+                self.assertEqual(label, '18SUJ')
+                self.assertTrue(all(s.startswith('18SUJ') for s in cells))
+
+    def testEmpty(self):
+        self.assertEqual(archive.writeArchive(self.path, []), 0)
+        with archive.ArchiveReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+            cells, ids = reader.read()
+            self.assertEqual(len(cells), 0)
+            self.assertIsNone(ids)
+            self.assertEqual(len(reader.blocks('18')), 0)
+            self.assertEqual(list(reader.iterBlocks()), [])
+            self.assertEqual(reader.squares(), [])
+
+    def testCompact(self):
+        rng = np.random.RandomState(5)
+        strings = batch.toMgrsBatch(rng.uniform(38.5, 39.5, 20000), rng.uniform(-77.5, -76.5, 20000))[0]
+        archive.writeArchive(self.path, strings)
+        self.assertLess(os.path.getsize(self.path), sum(len(s) + 1 for s in strings) / 2)
+
+    def testErrors(self):
+        with archive.ArchiveWriter(self.path) as writer:
+            self.assertRaises(mgrs.MgrsException, writer.write, ['18SUJ23', '18SIJ'])
+            writer.write(['18SUJ23'], [1])
+            self.assertRaises(ValueError, writer.write, ['18SUJ24'])
+            self.assertRaises(ValueError, writer.write, ['18SUJ24'], [1, 2])
+
+        with archive.ArchiveReader(self.path) as reader:
+            self.assertEqual(list(reader.read()[0]), ['18SUJ23'])
+        with open(self.path, 'rb') as f:
+            data = f.read()
+
+        with open(self.path, 'wb') as f:
+            f.write(b'18SUJ23\n')
+        self.assertRaises(mgrs.MgrsException, archive.ArchiveReader, self.path)
+
+        # corrupted trailer
+        tail = len(archive.MAGIC) + archive._TRAILER.size
+        for trailer in [b'\xff' * archive._TRAILER.size, archive._TRAILER.pack(len(archive.MAGIC), 1000)]:
+            with open(self.path, 'wb') as f:
+                f.write(data[:-tail] + trailer + archive.MAGIC)
+            self.assertRaises(mgrs.MgrsException, archive.ArchiveReader, self.path)
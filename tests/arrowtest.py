@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    arrowtest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import math
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from mgrspy import arrow
+except ImportError:
+    pa = None
+
+from mgrspy import mgrs
+from mgrspy import validation
+
+
+@unittest.skipIf(pa is None, 'pyarrow is not available')
+class ArrowTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tempDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def testToMgrsArrow(self):
+        latitudes = pa.chunked_array([[42.0, 95.0], [86.598, None]])
+        longitudes = pa.array([-93.0, 0.0, -156.507, 0.0])
+
+        result, status = arrow.toMgrsArrow(latitudes, longitudes)
+        self.assertEqual(result.type, pa.string())
+        self.assertEqual(result.to_pylist(), ['15TVG0000049776', None, '  YYL4939146492', None])
+        self.assertEqual(status.to_pylist(), [mgrs.STATUS_OK, mgrs.STATUS_LATITUDE_RANGE,
+                                              mgrs.STATUS_OK, mgrs.STATUS_LATITUDE_RANGE])
+
+        result, status = arrow.toMgrsArrow(latitudes, longitudes, 3, binary=True)
+        self.assertEqual(result.type, pa.binary(15))
+        self.assertEqual(result[0].as_py().rstrip(b'\x00'), b'15TVG000497')
+        self.assertFalse(result[1].is_valid)
+
+    def testToWgsArrow(self):
+        for values in [pa.array(['15TVG0000049776', None, '15TIG']),
+                       pa.array(['15TVG0000049776', None, '15TIG'], type=pa.large_string()),
+                       pa.array([b'15TVG0000049776', None, b'15TIG\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'],
+                                type=pa.binary(15))]:
+            latitudes, longitudes, status = arrow.toWgsArrow(values)
+            lat, lon = mgrs.toWgs('15TVG0000049776')
+            self.assertAlmostEqual(latitudes[0].as_py(), lat)
+            self.assertAlmostEqual(longitudes[0].as_py(), lon)
+            self.assertTrue(math.isnan(latitudes[1].as_py()))
+            self.assertEqual(status.to_pylist(), [mgrs.STATUS_OK, mgrs.STATUS_MALFORMED,
+                                                  mgrs.STATUS_INVALID_LETTER])
+
+    def testOversizedValue(self):
+        values = ['15TVG0000049776'] * 20000 + ['15TVG0000049776' + 'x' * 100000, '  15TVG0000049776  ',
+                                                '  15TVG0000049776 1']
+        latitudes, longitudes, status = arrow.toWgsArrow(pa.array(values)[1:])
+        self.assertEqual(status.to_pylist()[-3:], [mgrs.STATUS_MALFORMED, mgrs.STATUS_OK, mgrs.STATUS_MALFORMED])
+        self.assertTrue(math.isnan(latitudes[-3].as_py()))
+        self.assertAlmostEqual(latitudes[-2].as_py(), mgrs.toWgs('15TVG0000049776')[0])
+        self.assertEqual(arrow._bytes(pa.array(values))[0].dtype.itemsize, validation.MAX_LENGTH + 1)
+
+    def testParquetRoundTrip(self):
+        source = os.path.join(self.tempDir, 'source.parquet')
+        converted = os.path.join(self.tempDir, 'converted.parquet')
+        restored = os.path.join(self.tempDir, 'restored.parquet')
+
+        table = pa.table({'latitude': [42.0, 38.9072, 39.9526] * 10,
+                          'longitude': [-93.0, -77.0369, -75.1652] * 10})
+        pq.write_table(table, source, row_group_size=7)
+
+        self.assertEqual(arrow.parquetToMgrs(source, converted, statusColumn='status'), 30)
+        self.assertEqual(pq.ParquetFile(converted).num_row_groups, 5)
+        result = pq.read_table(converted)
+        self.assertEqual(result.column('mgrs').to_pylist()[:3],
+                         ['15TVG0000049776', '18SUJ2338308450', '18SVK8588822509'])
+        self.assertEqual(set(result.column('status').to_pylist()), {mgrs.STATUS_OK})
+
+        self.assertEqual(arrow.parquetToWgs(converted, restored, latitudeColumn='lat', longitudeColumn='lon'), 30)
+        result = pq.read_table(restored)
+        self.assertAlmostEqual(result.column('lat')[1].as_py(), 38.90719314018781)
+        self.assertAlmostEqual(result.column('lon')[1].as_py(), -77.03690158268294)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    batchtest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import math
+import unittest
+
+from mgrspy import mgrs
+from mgrspy import batch
+
+
+class BatchTest(unittest.TestCase):
+
+    def testToMgrsBatch(self):
+        result, status = batch.toMgrsBatch([42.0, 38.9072, 86.598, -88.52, 95.0, 42.0, 42.0],
+                                           [-93.0, -77.0369, -156.507, -66.49, 0.0, 400.0, -93.0],
+                                           [5, 5, 5, 5, 5, 5, 6])
+        self.assertEqual(list(result), ['15TVG0000049776', '18SUJ2338308450', '  YYL4939146492',
+                                        '  AYN4931665550', '', '', ''])
+        self.assertEqual(list(status), [mgrs.STATUS_OK, mgrs.STATUS_OK, mgrs.STATUS_OK, mgrs.STATUS_OK,
+                                        mgrs.STATUS_LATITUDE_RANGE, mgrs.STATUS_LONGITUDE_RANGE,
+                                        mgrs.STATUS_PRECISION])
+
+        result, status = batch.toMgrsBatch([42.0, float('nan')], [-93.0, -93.0], 3)
+        self.assertEqual(list(result), ['15TVG000497', ''])
+        self.assertEqual(list(status), [mgrs.STATUS_OK, mgrs.STATUS_LATITUDE_RANGE])
+
+    def testToMgrsLevels(self):
+        latitudes = [42.0, 38.9072, 86.598, -88.52, 95.0]
+        longitudes = [-93.0, -77.0369, -156.507, -66.49, 0.0]
+        result, status = batch.toMgrsLevels(latitudes, longitudes, (0, 2, 5))
+        self.assertEqual(result.shape, (5, 3))
+        for i, precision in enumerate((0, 2, 5)):
+            expected, expectedStatus = batch.toMgrsBatch(latitudes, longitudes, precision)
+            self.assertEqual(list(result[:, i]), list(expected))
+            self.assertEqual(list(status), list(expectedStatus))
+
+        result, status = batch.toMgrsLevels(42.0, -93.0, [1, 3])
+        self.assertEqual(list(result), ['15TVG04', '15TVG000497'])
+        with self.assertRaises(mgrs.MgrsException):
+            batch.toMgrsLevels(latitudes, longitudes, (2.5,))
+
+    def testToWgsBatch(self):
+        strings = ['15TVG0000049776', '  YYL4939146492', '15TVG000497', 'BAN0000000000']
+        latitudes, longitudes, status = batch.toWgsBatch(strings)
+        self.assertEqual(list(status), [mgrs.STATUS_OK] * 4)
+        for i, s in enumerate(strings):
+            lat, lon = mgrs.toWgs(s)
+            self.assertAlmostEqual(latitudes[i], lat)
+            self.assertAlmostEqual(longitudes[i], lon)
+
+    def testToWgsBatchErrors(self):
+        latitudes, longitudes, status = batch.toWgsBatch(['181SUJ2338308450', '18SUJ2338308', None,
+                                                          '18SIJ2338308450', '18SUZ', 'YDA',
+                                                          '61SUJ', '32XMA', '  CYN', '18AUJ'])
+        self.assertEqual(list(status), [mgrs.STATUS_MALFORMED, mgrs.STATUS_MALFORMED, mgrs.STATUS_MALFORMED,
+                                        mgrs.STATUS_INVALID_LETTER, mgrs.STATUS_INVALID_LETTER,
+                                        mgrs.STATUS_INVALID_LETTER, mgrs.STATUS_INVALID_ZONE_BAND,
+                                        mgrs.STATUS_INVALID_ZONE_BAND, mgrs.STATUS_INVALID_ZONE_BAND,
+                                        mgrs.STATUS_INVALID_ZONE_BAND])
+        self.assertTrue(all(math.isnan(v) for v in latitudes))
+        self.assertTrue(all(math.isnan(v) for v in longitudes))
+
+    def testInvalidStringsRaise(self):
+        for s in ['32XMA', '  CYN', 'YDA']:
+            with self.assertRaises(mgrs.MgrsException):
+                mgrs.toWgs(s)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    dataframetest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import math
+import unittest
+
+import numpy as np
+
+try:
+    import pandas as pd
+    from mgrspy import dataframe
+except ImportError:
+    pd = None
+
+from mgrspy import mgrs
+
+
+@unittest.skipIf(pd is None, 'pandas is not available')
+class DataFrameTest(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = pd.DataFrame({'lat': [42.0, 38.9, 38.9001, 86.598, 91.0, np.nan],
+                                   'lon': [-93.0, -77.1, -77.1001, -156.507, 0.0, 1.0]},
+                                  index=list('abcdef'))
+
+    def testFromLatLon(self):
+        result = self.frame.iloc[:4].mgrs.fromLatLon('lat', 'lon', precision=2)
+        self.assertTrue(isinstance(result.dtype, pd.CategoricalDtype))
+        self.assertEqual(list(result.index), list('abcd'))
+        self.assertEqual(list(result), [mgrs.toMgrs(lat, lon, 2) for lat, lon in self.frame.iloc[:4].values])
+        self.assertEqual(len(result.cat.categories), 3)
+
+        result = self.frame.iloc[:4].mgrs.fromLatLon('lat', 'lon', categorical=False)
+        self.assertEqual(result.dtype, 'string')
+        self.assertEqual(result.iloc[0], '15TVG0000049776')
+
+    def testFromLatLonErrors(self):
+        with self.assertRaisesRegex(mgrs.MgrsException, 'Latitude outside'):
+            self.frame.mgrs.fromLatLon('lat', 'lon')
+
+        result = self.frame.mgrs.fromLatLon('lat', 'lon', errors='coerce')
+        self.assertEqual(list(result.isna()), [False] * 4 + [True] * 2)
+        result = self.frame.mgrs.fromLatLon('lat', 'lon', errors='coerce', categorical=False)
+        self.assertEqual(list(result.isna()), [False] * 4 + [True] * 2)
+
+        with self.assertRaises(ValueError):
+            self.frame.mgrs.fromLatLon('lat', 'lon', errors='ignore')
+
+    def testToLatLon(self):
+        strings = ['15TVG0000049776', '18SUJ2338308450', '  YYL4939146492', '18SUJ2338308450']
+        for series in [pd.Series(strings), pd.Series(strings, dtype='category'), pd.Series(strings, dtype='string')]:
+            result = series.mgrs.toLatLon()
+            self.assertEqual(list(result.columns), ['latitude', 'longitude'])
+            for i, s in enumerate(strings):
+                latitude, longitude = mgrs.toWgs(s)
+                self.assertAlmostEqual(result['latitude'].iloc[i], latitude)
+                self.assertAlmostEqual(result['longitude'].iloc[i], longitude)
+
+        frame = pd.DataFrame({'mgrs': strings})
+        self.assertEqual(frame.mgrs.toLatLon().shape, (4, 2))
+
+    def testToLatLonErrors(self):
+        series = pd.Series(['15TVG0000049776', None, '18SIJ'], dtype='category')
+        with self.assertRaises(mgrs.MgrsException):
+            series.mgrs.toLatLon()
+
+        result = series.mgrs.toLatLon(errors='coerce')
+        self.assertFalse(math.isnan(result['latitude'].iloc[0]))
+        self.assertTrue(result['latitude'].iloc[1:].isna().all())
+        self.assertEqual(list(series.mgrs.status()), [mgrs.STATUS_OK, mgrs.STATUS_MALFORMED,
+                                                       mgrs.STATUS_INVALID_LETTER])
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    diskcachetest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import diskcache
+
+
+class DiskCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cache.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _points(self):
+        rng = np.random.RandomState(7)
+        latitudes = np.append(rng.uniform(-90, 90, 501), [95.0, np.nan, -0.0])
+        longitudes = np.append(rng.uniform(-180, 360, 501), [0.0, 0.0, 190.0])
+        return latitudes, longitudes
+
+    def testToMgrs(self):
+        latitudes, longitudes = self._points()
+        expected, expectedStatus = batch.toMgrsBatch(latitudes, longitudes, 3)
+        with diskcache.ConversionCache(self.path) as cache:
+            for i in range(2):
+                result, status = cache.toMgrs(latitudes, longitudes, 3)
+                self.assertEqual(list(result), list(expected))
+                self.assertEqual(list(status), list(expectedStatus))
+            self.assertEqual(cache.misses, 502)
+            self.assertEqual(cache.hits, 502)
+
+        with diskcache.ConversionCache(self.path) as cache:
+            result, status = cache.toMgrs(latitudes.reshape(3, -1), longitudes.reshape(3, -1), 3)
+            self.assertEqual(result.shape, (3, 168))
+            self.assertEqual(list(result.ravel()), list(expected))
+            self.assertEqual(cache.hits, 502)
+            self.assertEqual(cache.misses, 0)
+
+            result, status = cache.toMgrs(42.0, -93.0 + 360.0)
+            self.assertEqual(str(result), mgrs.toMgrs(42.0, -93.0))
+
+    def testToWgs(self):
+        values = ['15TVG0000049776', '15tvg0000049776', '  YYL4939146492', '18SIJ2338308450', '18SUJ23']
+        expected = batch.toWgsBatch(values)
+        with diskcache.ConversionCache(self.path) as cache:
+            for i in range(2):
+                latitudes, longitudes, status = cache.toWgs(values)
+                np.testing.assert_array_equal(latitudes, expected[0])
+                np.testing.assert_array_equal(longitudes, expected[1])
+                self.assertEqual(list(status), list(expected[2]))
+            self.assertEqual(len(cache), 3)
+            self.assertEqual(cache.hits, 4)
+
+    def testFingerprint(self):
+        with diskcache.ConversionCache(self.path) as cache:
+            cache.toWgs(['15TVG0000049776'])
+            self.assertEqual(len(cache), 1)
+
+        connection = sqlite3.connect(self.path)
+        with connection:
+            connection.execute("UPDATE meta SET value = 'other' WHERE key = 'fingerprint'")
+        connection.close()
+
+        with diskcache.ConversionCache(self.path) as cache:
+            self.assertEqual(len(cache), 0)
+            cache.toWgs(['15TVG0000049776'])
+            self.assertEqual(cache.misses, 1)
+
+    def testEviction(self):
+        with diskcache.ConversionCache(self.path, maxEntries=10) as cache:
+            cache.toMgrs(np.arange(8.0), np.zeros(8))
+            cache.toMgrs(np.arange(8.0), np.zeros(8))
+            cache.toMgrs(np.arange(10.0, 14.0), np.zeros(4))
+            self.assertEqual(len(cache), 10)
+
+            # least recently used entries were removed
+            cache.toMgrs(np.arange(2.0, 8.0), np.zeros(6))
+            self.assertEqual(cache.misses, 12)
+
+        self.assertRaises(ValueError, diskcache.ConversionCache, self.path, 0)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    extracttest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import io
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import extract
+
+
+TEXT = ('Report: unit at 33UXP0500444996, moved to 33U XP 05004 44996 then 33UXP 0500 12 men. '
+        'Pole   YYL4939146492 ok; ZAP BAN 18SUJ; 18SIJ1234; abc18SUJ12; 18suj1234; 5QKB42.')
+
+
+class ExtractTest(unittest.TestCase):
+
+    def testExtract(self):
+        starts, ends, strings = extract.extractMgrs(TEXT)
+        self.assertEqual(list(strings), ['33UXP0500444996', '33UXP0500444996', '33UXP0500', '  YYL4939146492',
+                                         '18SUJ', '05QKB42'])
+        self.assertEqual([TEXT[s:e] for s, e in zip(starts, ends)],
+                         ['33UXP0500444996', '33U XP 05004 44996', '33UXP 0500', 'YYL4939146492', '18SUJ',
+                          '5QKB42'])
+
+        starts, ends, strings = extract.extractMgrs(TEXT, normalize=False)
+        self.assertEqual(strings[1], '33U XP 05004 44996')
+
+    def testBytes(self):
+        expected = extract.extractMgrs(TEXT)
+        for buffer in [TEXT.encode('ascii'), bytearray(TEXT.encode('ascii')), memoryview(TEXT.encode('ascii'))]:
+            result = extract.extractMgrs(buffer)
+            for a, b in zip(result, expected):
+                self.assertEqual(list(a), list(b))
+
+        self.assertEqual(list(extract.extractMgrs(TEXT.encode('ascii'), False)[2]),
+                         list(extract.extractMgrs(TEXT, False)[2]))
+
+    def testNoReferences(self):
+        for text in ['', 'INFO DEBUG ABC 1234 ZAP', b'plain text']:
+            starts, ends, strings = extract.extractMgrs(text)
+            self.assertEqual(len(starts), 0)
+            self.assertEqual(len(strings), 0)
+
+    def testStream(self):
+        data = TEXT.encode('ascii') * 5
+        expected = extract.extractMgrs(data)
+        for chunkSize in [1, 7, 40, 1000]:
+            chunks = list(extract.iterMgrs(io.BytesIO(data), chunkSize=chunkSize))
+            self.assertEqual(np.concatenate([c[0] for c in chunks]).tolist(), expected[0].tolist())
+            self.assertEqual(np.concatenate([c[1] for c in chunks]).tolist(), expected[1].tolist())
+            self.assertEqual(np.concatenate([c[2] for c in chunks]).tolist(), expected[2].tolist())
+
+    def testExtractWgs(self):
+        starts, ends, strings, latitudes, longitudes = extract.extractWgs(TEXT)
+        self.assertEqual(len(latitudes), 6)
+        for s, latitude, longitude in zip(strings, latitudes, longitudes):
+            expected = mgrs.toWgs(s)
+            self.assertAlmostEqual(latitude, expected[0])
+            self.assertAlmostEqual(longitude, expected[1])
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    geofencetest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import geofence
+from mgrspy.mgrsarray import MgrsArray
+
+
+class GeofenceTest(unittest.TestCase):
+
+    CELLS = ['18SUJ', '18SUJ23', '18SUJ2306', '33UXP0444', '34HBH', 'ZAH', 'BAN05', '60CWT', '32VKM']
+
+    def _points(self, count=100):
+        rng = np.random.RandomState(0)
+        cells = MgrsArray.fromStrings(self.CELLS)[0]
+        centreLatitudes, centreLongitudes = cells.centres()
+        spreads = np.minimum(2 * cells.cellSize() / 111000.0, 0.5)
+        latitudes = np.concatenate([la + rng.uniform(-s, s, count)
+                                    for la, s in zip(centreLatitudes, spreads)])
+        longitudes = np.concatenate([lo + rng.uniform(-2 * s, 2 * s, count)
+                                     for lo, s in zip(centreLongitudes, spreads)])
+        return np.clip(latitudes, -90, 90), (longitudes + 180) % 360 - 180
+
+    def testCellIndices(self):
+        fence = geofence.Geofence(self.CELLS)
+        self.assertEqual(len(fence), len(self.CELLS))
+        precisions = [(len(c) - (2 if c[0].isdigit() else 0) - 3) // 2 for c in self.CELLS]
+
+        latitudes, longitudes = self._points()
+        indices = fence.cellIndices(latitudes, longitudes)
+        for latitude, longitude, index in zip(latitudes, longitudes, indices):
+            expected = geofence.NO_MATCH
+            for i in np.argsort(precisions, kind='stable'):
+                if mgrs.toMgrs(latitude, longitude, precisions[i]).strip() == self.CELLS[i]:
+                    expected = i
+            self.assertEqual(index, expected)
+
+        # every cell is hit at least once
+        self.assertEqual(set(indices[indices >= 0]), set(range(len(self.CELLS))))
+
+    def testContains(self):
+        fence = geofence.Geofence(np.array(['18SUJ2306']))
+        latitude, longitude = mgrs.toWgs('18SUJ2300006000')
+        mask = fence.contains([[latitude + 0.001, latitude - 0.001], [latitude + 0.001, 95.0]],
+                              [[longitude + 0.001, longitude + 0.001], [longitude - 0.001, 0.0]])
+        self.assertEqual(mask.tolist(), [[True, False], [False, False]])
+
+    def testInvalid(self):
+        self.assertRaises(mgrs.MgrsException, geofence.Geofence, ['18SUJ', 'not a cell'])
+        fence = geofence.Geofence(['18SUJ'])
+        self.assertEqual(fence.cellIndices([np.nan, 100.0], [0.0, 0.0]).tolist(), [geofence.NO_MATCH] * 2)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    geojsontest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import io
+import json
+import unittest
+
+from mgrspy import mgrs
+from mgrspy import geojson
+
+
+def _feature(lon, lat, **properties):
+    return {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+            'properties': properties}
+
+
+class GeoJsonTest(unittest.TestCase):
+
+    def testAnnotateFeatures(self):
+        features = [_feature(-93.0, 42.0), _feature(-77.0369, 38.9072, name='dc'), _feature(0.0, 95.0),
+                    {'type': 'Feature', 'geometry': None, 'properties': None}]
+        result = list(geojson.annotateFeatures(features, precision=3, batchSize=2, statusProperty='status'))
+        self.assertEqual([f['properties']['mgrs'] for f in result], ['15TVG000497', '18SUJ233084', None, None])
+        self.assertEqual([f['properties']['status'] for f in result],
+                         [mgrs.STATUS_OK, mgrs.STATUS_OK, mgrs.STATUS_LATITUDE_RANGE, mgrs.STATUS_LATITUDE_RANGE])
+        self.assertEqual(result[1]['properties']['name'], 'dc')
+
+    def testLocateFeatures(self):
+        features = [{'type': 'Feature', 'geometry': None, 'properties': {'ref': '18SUJ2338308450'}},
+                    {'type': 'Feature', 'geometry': None, 'properties': {'ref': '18SIJ'}}]
+        result = list(geojson.locateFeatures(features, mgrsProperty='ref'))
+        lon, lat = result[0]['geometry']['coordinates']
+        self.assertAlmostEqual(lat, 38.90719314018781)
+        self.assertAlmostEqual(lon, -77.03690158268294)
+        self.assertIsNone(result[1]['geometry'])
+
+    def testNdjsonStream(self):
+        source = io.StringIO('\n'.join(json.dumps(f) for f in [_feature(-93.0, 42.0), _feature(-75.1652, 39.9526)]))
+        destination = io.StringIO()
+        self.assertEqual(geojson.annotateStream(source, destination), 2)
+
+        lines = destination.getvalue().splitlines()
+        self.assertEqual([json.loads(l)['properties']['mgrs'] for l in lines],
+                         ['15TVG0000049776', '18SVK8588822509'])
+
+    def testTextSequenceStream(self):
+        source = io.StringIO(''.join(geojson.RS + json.dumps(f, indent=2) + '\n'
+                                     for f in [_feature(-93.0, 42.0), _feature(-75.1652, 39.9526)]))
+        destination = io.StringIO()
+        self.assertEqual(geojson.annotateStream(source, destination, textSequence=True), 2)
+
+        features = list(geojson.readFeatures(io.StringIO(destination.getvalue())))
+        self.assertEqual([f['properties']['mgrs'] for f in features], ['15TVG0000049776', '18SVK8588822509'])
+        self.assertTrue(destination.getvalue().startswith(geojson.RS))
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    gridlinestest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+import collections
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+from mgrspy import gridlines
+
+
+class GridLinesTest(unittest.TestCase):
+
+    def testLines(self):
+        lines = gridlines.gridLines(38.5, -78, 39.5, -76.5, 1)
+        kinds = collections.Counter(kind for kind, label, coordinates in lines)
+        self.assertEqual(set(kinds), set(['gzd', 'square', 'line']))
+        self.assertGreater(kinds['line'], kinds['square'])
+
+        for kind, label, coordinates in lines:
+            self.assertEqual(coordinates.shape[1], 2)
+            self.assertTrue((coordinates[:, 0] >= -78 - 1e-9).all())
+            self.assertTrue((coordinates[:, 0] <= -76.5 + 1e-9).all())
+            self.assertTrue((coordinates[:, 1] >= 38.5 - 1e-9).all())
+            self.assertTrue((coordinates[:, 1] <= 39.5 + 1e-9).all())
+
+        # 10 km lines lie on the grid in UTM space
+        for kind, label, coordinates in lines:
+            if kind == 'line':
+                easting, northing = grid._wgsToUtm(18, True, coordinates[1:-1, 1], coordinates[1:-1, 0])
+                offset = np.minimum(np.abs(easting / 10000 - np.round(easting / 10000)),
+                                    np.abs(northing / 10000 - np.round(northing / 10000)))
+                self.assertTrue((offset * 10000 < 0.01).all())
+
+        self.assertEqual(len(gridlines.gridLines(38.5, -78, 39.5, -76.5, 0)),
+                         kinds['gzd'] + kinds['square'])
+
+    def testTileInsideSquare(self):
+        # the tile lies inside 18SUJ, no line has vertices inside it, clipped
+        # ends are interpolated between vertices
+        lines = gridlines.gridLines(38.9, -77.05, 38.95, -77.0, 2)
+        kinds = collections.Counter(kind for kind, label, coordinates in lines)
+        self.assertEqual(set(kinds), set(['line']))
+        self.assertGreaterEqual(kinds['line'], 8)
+
+        for kind, label, coordinates in lines:
+            self.assertTrue((coordinates[:, 0] >= -77.05 - 1e-9).all())
+            self.assertTrue((coordinates[:, 0] <= -77.0 + 1e-9).all())
+            self.assertTrue((coordinates[:, 1] >= 38.9 - 1e-9).all())
+            self.assertTrue((coordinates[:, 1] <= 38.95 + 1e-9).all())
+
+            easting, northing = grid._wgsToUtm(18, True, coordinates[:, 1], coordinates[:, 0])
+            offset = np.minimum(np.abs(easting / 1000 - np.round(easting / 1000)),
+                                np.abs(northing / 1000 - np.round(northing / 1000)))
+            self.assertTrue((offset * 1000 < 1).all())
+
+        labels = gridlines.gridLabels(38.9, -77.05, 38.95, -77.0, 2)
+        self.assertEqual(len([l for l in labels if l[0] == 'line']), kinds['line'])
+
+    def testCache(self):
+        gridlines._squareLines.cache_clear()
+        gridlines.gridLines(38.9, -77.05, 38.95, -77.0, 2)
+        misses = gridlines._squareLines.cache_info().misses
+        # panning inside the same square reuses its lines
+        lines = gridlines.gridLines(38.91, -77.04, 38.96, -76.99, 2)
+        self.assertEqual(gridlines._squareLines.cache_info().misses, misses)
+
+        # cached lines can not be modified through results
+        lines = gridlines.gridLines(38.5, -78, 39.5, -76.5, 1)
+        expected = [coordinates.copy() for kind, label, coordinates in lines]
+        for kind, label, coordinates in lines:
+            if coordinates.flags.writeable:
+                coordinates[:] = 0.0
+        for e, (kind, label, coordinates) in zip(expected, gridlines.gridLines(38.5, -78, 39.5, -76.5, 1)):
+            np.testing.assert_array_equal(coordinates, e)
+
+    def testSquareLabels(self):
+        labels = gridlines.gridLabels(38, -79, 40, -75)
+        squares = [l for l in labels if l[0] == 'square']
+        self.assertGreater(len(squares), 10)
+        for kind, label, longitude, latitude in squares:
+            self.assertEqual(label, mgrs.toMgrs(latitude, longitude, 0))
+
+    def testSpecialZones(self):
+        labels = gridlines.gridLabels(60, 0, 64, 13)
+        gzds = dict((label, longitude) for kind, label, longitude, latitude in labels if kind == 'gzd')
+        self.assertEqual(sorted(gzds), ['31V', '32V', '33V'])
+        self.assertAlmostEqual(gzds['31V'], 1.5)
+        self.assertAlmostEqual(gzds['32V'], 7.5)
+
+        labels = gridlines.gridLabels(75, 0, 83, 42)
+        gzds = sorted(label for kind, label, longitude, latitude in labels if kind == 'gzd')
+        self.assertEqual(gzds, ['31X', '33X', '35X', '37X'])
+
+    def testFeatures(self):
+        features = gridlines.gridFeatures(38.5, -78, 39.5, -76.5, 1)
+        types = set(f['geometry']['type'] for f in features)
+        self.assertEqual(types, set(['LineString', 'Point']))
+        for f in features:
+            self.assertIn(f['properties']['kind'], ('gzd', 'square', 'line'))
+
+    def testWgsToUtm(self):
+        latitudes = np.array([0.0, 38.9, -33.5, 83.0, -79.0])
+        longitudes = np.array([-75.0, -77.1, 18.4, 13.0, -170.0])
+        zones = np.array([18, 18, 34, 33, 2])
+        north = latitudes >= 0
+        easting, northing = grid._wgsToUtm(zones, north, latitudes, longitudes)
+        lat, lon = grid._utmToWgs(zones, north, easting, northing)
+        self.assertTrue(np.allclose(lat, latitudes, atol=1e-9))
+        self.assertTrue(np.allclose(lon, longitudes, atol=1e-9))
+        self.assertAlmostEqual(easting[0], 500000, 6)
+
+    def testErrors(self):
+        with self.assertRaises(mgrs.MgrsException):
+            gridlines.gridLines(38, -78, 39, -77, 5)
+        with self.assertRaises(mgrs.MgrsException):
+            gridlines.gridLines(38, -78, 95, -77)
+        with self.assertRaises(mgrs.MgrsException):
+            gridlines.gridLabels(38, -78, 39, 190)
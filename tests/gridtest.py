@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    gridtest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import grid
+
+
+class GridTest(unittest.TestCase):
+
+    def testUtmToMgrs(self):
+        self.assertEqual(grid.utmToMgrs(18, 'N', 323383.0, 4308450.0, 5, 38.9072),
+                         mgrs._utmToMgrs(18, 'N', 38.9072, -77.0369, 323383.0, 4308450.0, 5))
+        self.assertEqual(grid.utmToMgrs(18, 'N', 323383.0, 4308450.0, 3), '18SUJ233084')
+
+        result = grid.utmToMgrs([31, 18, 33], ['N', 'N', 'S'], [500000.0, 323383.0, 600000.0],
+                                [7000000.0, 4308450.0, 1.0e7], [5, 2, 1], [62.0, 38.9072, -1.0])
+        expected = [mgrs._utmToMgrs(31, 'N', 62.0, 0, 500000.0, 7000000.0, 5),
+                    mgrs._utmToMgrs(18, 'N', 38.9072, 0, 323383.0, 4308450.0, 2),
+                    mgrs._utmToMgrs(33, 'S', -1.0, 0, 600000.0, 1.0e7, 1)]
+        self.assertEqual(list(result), expected)
+
+    def testUpsToMgrs(self):
+        for hemisphere, easting, northing in [('N', 2000000.0, 2000000.0), ('N', 1900000.0, 2100000.0),
+                                              ('S', 2150000.0, 1850000.0)]:
+            self.assertEqual(grid.upsToMgrs(hemisphere, easting, northing, 4),
+                             mgrs._upsToMgrs(hemisphere, easting, northing, 4))
+
+    def testMgrsToUtm(self):
+        self.assertEqual(grid.mgrsToUtm('18SUJ2338308450'), mgrs._mgrsToUtm('18SUJ2338308450'))
+        zone, hemisphere, easting, northing = grid.mgrsToUtm(['15TVG0000049776', '33MUN1000'])
+        for i, s in enumerate(['15TVG0000049776', '33MUN1000']):
+            self.assertEqual((zone[i], hemisphere[i], easting[i], northing[i]), mgrs._mgrsToUtm(s))
+
+    def testMgrsToUps(self):
+        self.assertEqual(grid.mgrsToUps('  YYL4939146492'), mgrs._mgrsToUps('YYL4939146492')[1:])
+        self.assertEqual(grid.mgrsToUps('BAN0000000000'), mgrs._mgrsToUps('BAN0000000000')[1:])
+
+    def testUtmToWgs(self):
+        for lat, lon in [(42.0, -93.0), (38.9072, -77.0369), (-33.9, 18.4), (83.0, 5.0)]:
+            hemisphere, zone, epsg = mgrs._epsgForWgs(lat, lon)
+            ct = mgrs._transformation(4326, epsg)
+            easting, northing = mgrs._transformPoint(ct, lon, lat)[:2]
+            latitude, longitude = grid.utmToWgs(zone, hemisphere, easting, northing)
+            self.assertAlmostEqual(latitude, lat, 7)
+            self.assertAlmostEqual(longitude, lon, 7)
+
+    def testUpsToWgs(self):
+        for lat, lon in [(86.598, -156.507), (-88.52, -66.49), (84.5, 10.0)]:
+            hemisphere, zone, epsg = mgrs._epsgForWgs(lat, lon)
+            ct = mgrs._transformation(4326, epsg)
+            easting, northing = mgrs._transformPoint(ct, lon, lat)[:2]
+            latitude, longitude = grid.upsToWgs(hemisphere, easting, northing)
+            self.assertAlmostEqual(latitude, lat, 7)
+            self.assertAlmostEqual(longitude, lon, 7)
+
+    def testRoundTrip(self):
+        strings = grid.utmToMgrs(np.arange(1, 61), 'N', 450000.0, 5000000.0)
+        zone, hemisphere, easting, northing = grid.mgrsToUtm(strings)
+        self.assertEqual(list(zone), list(range(1, 61)))
+        self.assertTrue((easting == 450000.0).all())
+        self.assertTrue((northing == 5000000.0).all())
+
+    def testErrors(self):
+        with self.assertRaises(mgrs.MgrsException):
+            grid.utmToMgrs(18, 'N', 50000.0, 4308450.0)
+        with self.assertRaises(mgrs.MgrsException):
+            grid.utmToMgrs(61, 'N', 500000.0, 4308450.0)
+        with self.assertRaises(mgrs.MgrsException):
+            grid.utmToMgrs(18, 'X', 500000.0, 4308450.0)
+        with self.assertRaises(mgrs.MgrsException):
+            grid.utmToMgrs(18, 'N', 500000.0, 4308450.0, 6)
+        with self.assertRaises(mgrs.MgrsException):
+            grid.upsToMgrs('N', 5000000.0, 2000000.0)
+        with self.assertRaises(mgrs.MgrsException):
+            grid.mgrsToUtm('  YYL4939146492')
+        with self.assertRaises(mgrs.MgrsException):
+            grid.mgrsToUps('18SUJ2338308450')
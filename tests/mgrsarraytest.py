@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    mgrsarraytest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy.mgrsarray import MgrsArray
+
+
+class MgrsArrayTest(unittest.TestCase):
+
+    def testFromWgs(self):
+        latitudes = [42.0, 38.9072, 86.598, 95.0, -88.52]
+        longitudes = [-93.0, -77.0369, -156.507, 0.0, -66.49]
+        array, status = MgrsArray.fromWgs(latitudes, longitudes, [5, 3, 5, 5, 1])
+        expected, expectedStatus = batch.toMgrsBatch(latitudes, longitudes, [5, 3, 5, 5, 1])
+        self.assertEqual(list(array), list(expected))
+        self.assertEqual(list(status), list(expectedStatus))
+        self.assertEqual(list(array.valid), [True, True, True, False, True])
+        self.assertEqual(array[0], '15TVG0000049776')
+        self.assertEqual(array[-1], '  AYN46')
+
+    def testFromWgsLevels(self):
+        latitudes = [42.0, 38.9072, 95.0, -88.52]
+        longitudes = [-93.0, -77.0369, 0.0, -66.49]
+        arrays, status = MgrsArray.fromWgsLevels(latitudes, longitudes, (1, 4))
+        self.assertEqual(len(arrays), 2)
+        for array, precision in zip(arrays, (1, 4)):
+            expected, expectedStatus = MgrsArray.fromWgs(latitudes, longitudes, precision)
+            self.assertEqual(list(array.keys()), list(expected.keys()))
+            self.assertEqual(list(status), list(expectedStatus))
+
+    def testFromStrings(self):
+        array, status = MgrsArray.fromStrings(['15tvg0000049776', '18SUJ233084', ' YYL4939146492', '18SIJ'])
+        self.assertEqual(list(status), [mgrs.STATUS_OK, mgrs.STATUS_OK, mgrs.STATUS_OK, mgrs.STATUS_INVALID_LETTER])
+        self.assertEqual(list(array), ['15TVG0000049776', '18SUJ233084', '  YYL4939146492', ''])
+        self.assertEqual(list(array.zone), [15, 18, 0, 0])
+        self.assertEqual(list(array.easting), [0, 233, 49391, 0])
+        self.assertEqual(list(array.northing), [49776, 84, 46492, 0])
+        self.assertEqual(list(array.precision), [5, 3, 5, 0])
+
+    def testFromBuffer(self):
+        array, status = MgrsArray.fromBuffer(b'15tvg0000049776\r\n18SUJ233084\r\n YYL4939146492\r\n18SIJ\r\n')
+        self.assertEqual(list(status), [mgrs.STATUS_OK, mgrs.STATUS_OK, mgrs.STATUS_OK, mgrs.STATUS_INVALID_LETTER])
+        self.assertEqual(list(array), ['15TVG0000049776', '18SUJ233084', '  YYL4939146492', ''])
+
+    def testSlicing(self):
+        array = MgrsArray.fromStrings(['15TVG0000049776', '18SUJ233084', '  YYL4939146492'])[0]
+        self.assertTrue(isinstance(array[1:], MgrsArray))
+        self.assertEqual(list(array[1:]), ['18SUJ233084', '  YYL4939146492'])
+        self.assertEqual(list(array[[2, 0]]), ['  YYL4939146492', '15TVG0000049776'])
+        self.assertEqual(list(array[array.zone > 0]), ['15TVG0000049776', '18SUJ233084'])
+        with self.assertRaises(IndexError):
+            array[3]
+
+    def testSortAndKeys(self):
+        strings = ['18SUJ233084', '15TVG0000049776', '  YYL4939146492', '18SUJ233083', '18SIJ', '15TVG0000049776']
+        array = MgrsArray.fromStrings(strings)[0]
+        self.assertEqual(list(array.sort()), ['  YYL4939146492', '15TVG0000049776', '15TVG0000049776',
+                                              '18SUJ233083', '18SUJ233084', ''])
+        self.assertEqual(list(array.unique()), ['  YYL4939146492', '15TVG0000049776', '18SUJ233083',
+                                                '18SUJ233084', ''])
+        self.assertTrue((MgrsArray.fromKeys(array.keys()) == array).all())
+
+    def testEquality(self):
+        array = MgrsArray.fromStrings(['15TVG0000049776', '18SUJ233084'])[0]
+        self.assertEqual(list(array == ['15TVG0000049776', '18SUJ233085']), [True, False])
+        self.assertEqual(list(array != array[::-1]), [True, True])
+
+    def testGroups(self):
+        array = MgrsArray.fromStrings(['18SUJ233084', '15TVG0000049776', '18SUJ2338', '18STJ', '18SUJ2'])[0]
+        groups = array.groups('square')
+        self.assertEqual(sorted(groups.keys()), ['15TVG', '18STJ', '18SUJ'])
+        self.assertEqual(list(groups['18SUJ']), [0, 2])
+        groups = array.groups('zone')
+        self.assertEqual(list(groups['18']), [0, 2, 3])
+        with self.assertRaises(ValueError):
+            array.groups('band')
+
+    def testCentres(self):
+        array = MgrsArray.fromStrings(['18SUJ2338308450', '18SUJ233084', '  YYL4939146492', '18SIJ'])[0]
+        north, easting, northing = array.gridCoordinates()
+        self.assertEqual(list(easting[:3]), [323383.0, 323300.0, 1849391.0])
+        self.assertEqual(list(northing[:3]), [4308450.0, 4308400.0, 2346492.0])
+        latitudes, longitudes = array.centres()
+        self.assertAlmostEqual(latitudes[0], 38.9072, 4)
+        self.assertAlmostEqual(longitudes[0], -77.0369, 4)
+        self.assertAlmostEqual(latitudes[2], 86.598, 4)
+        self.assertTrue(np.isnan(latitudes[3]))
+
+    def testMemory(self):
+        array = MgrsArray.fromWgs(np.linspace(-60, 60, 1000), np.linspace(-170, 170, 1000))[0]
+        self.assertEqual(array.nbytes, 13 * 1000)
+        self.assertEqual(len(MgrsArray.concatenate([array, array[:10]])), 1010)
@@ -105,3 +105,38 @@ class MgrsTest(unittest.TestCase):
         lat, lon = mgrs.toWgs('38SMG1233767880')
         self.assertAlmostEqual(lat, 37.65389907949628)
         self.assertAlmostEqual(lon, 44.00619523636414)
+
+
+    def testTrustedConversions(self):
+        points = [(42.0, -93.0), (38.9, -77.1), (86.598, -156.507), (-88.52, -66.49), (-90, 180),
+                  (60.0, 5.0), (75.0, 10.0), (-33.5, 18.4)]
+        for lat, lon in points:
+            for precision in range(6):
+                value = mgrs.toMgrs(lat, lon, precision)
+                self.assertEqual(mgrs.toMgrsTrusted(lat, lon, precision), value)
+                self.assertEqual(mgrs.toWgsTrusted(value), mgrs.toWgs(value))
+
+        self.assertEqual(mgrs.toWgsTrusted('  YYL4939146492'), mgrs.toWgs('YYL4939146492'))
+        self.assertEqual(mgrs.toWgsTrusted('15tvg0000049776'), mgrs.toWgs('15TVG0000049776'))
+        with self.assertRaises(mgrs.MgrsException):
+            mgrs.toWgsTrusted('18SUI2338308450')
+
+    def testToMgrsLevels(self):
+        for lat, lon in [(42.0, -93.0), (38.9, -77.1), (86.598, -156.507), (-88.52, -66.49), (60.0, 5.0)]:
+            self.assertEqual(mgrs.toMgrsLevels(lat, lon, range(6)),
+                             tuple(mgrs.toMgrs(lat, lon, precision) for precision in range(6)))
+
+        self.assertEqual(mgrs.toMgrsLevels(42.0, -93.0), ('15TVG04', '15TVG0049', '15TVG000497', '15TVG00004977',
+                                                          '15TVG0000049776'))
+        for precisions in [(1, 6), (-1,), (2.5,)]:
+            with self.assertRaises(mgrs.MgrsException):
+                mgrs.toMgrsLevels(42.0, -93.0, precisions)
+
+    def testBreakMgrsString(self):
+        self.assertEqual(mgrs._breakMgrsString('18SUJ2338308450'),
+                         (18, [18, 20, 9], 23383.0, 8450.0, 5))
+        self.assertEqual(mgrs._breakMgrsString('  5qkb'), (5, [16, 10, 1], 0, 0, 0))
+        self.assertEqual(mgrs._breakMgrsString('18SUJ23 '), (18, [18, 20, 9], 2.0, 3.0, 1))
+        for value in ['00SUJ', '61SUJ', '123SUJ', '18SUI', '18SU', '18SUJ123', '18SUJ01234567890']:
+            with self.assertRaises(mgrs.MgrsException):
+                mgrs._breakMgrsString(value)
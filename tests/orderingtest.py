@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    orderingtest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import ordering
+from mgrspy.mgrsarray import MgrsArray
+
+
+class OrderingTest(unittest.TestCase):
+
+    def testHilbertCurve(self):
+        for order in [1, 2, 4]:
+            side = 2 ** order
+            x, y = np.meshgrid(np.arange(side, dtype=np.uint64), np.arange(side, dtype=np.uint64))
+            x, y = x.ravel(), y.ravel()
+            keys = ordering._hilbert(x, y, order)
+            self.assertEqual(sorted(keys.tolist()), list(range(side * side)))
+
+            # consecutive cells along the curve are neighbours
+            idx = np.argsort(keys)
+            steps = np.abs(np.diff(x[idx].astype(int))) + np.abs(np.diff(y[idx].astype(int)))
+            self.assertTrue((steps == 1).all())
+
+    def testMortonCurve(self):
+        x = np.array([0, 1, 0, 1, 2, 0xFFFFFFFF], dtype=np.uint64)
+        y = np.array([0, 0, 1, 1, 0, 0xFFFFFFFF], dtype=np.uint64)
+        keys = ordering._spread(x) | (ordering._spread(y) << np.uint64(1))
+        self.assertEqual(keys.tolist(), [0, 1, 2, 3, 4, 2 ** 64 - 1])
+
+    def testSortByCurve(self):
+        # cells on both sides of zone boundary stay together
+        strings = ['18SUJ2338308450', '18SIJ', '17SQD9999', '  YYL4939146492', '18SUJ2338408450']
+        for curve in ['hilbert', 'morton']:
+            result, indices = ordering.sortByCurve(strings, curve)
+            self.assertEqual(result[-1], '18SIJ')
+            self.assertEqual(sorted(indices.tolist()), list(range(len(strings))))
+
+        array = MgrsArray.fromStrings(strings)[0]
+        result, indices = ordering.sortByCurve(array)
+        self.assertTrue(isinstance(result, MgrsArray))
+        self.assertEqual(list(result)[:4], [strings[i] for i in indices[:4]])
+
+        keys = ordering.hilbertKeys(strings)
+        self.assertEqual(keys[1], ordering.INVALID_KEY)
+        self.assertEqual(keys.dtype, np.uint64)
+
+        with self.assertRaises(ValueError):
+            ordering.sortByCurve(strings, 'peano')
+        with self.assertRaises(ValueError):
+            ordering.hilbertKeys(strings, 32)
+
+    def testLocality(self):
+        latitudes, longitudes = np.meshgrid(np.linspace(30, 40, 60), np.linspace(-80, -70, 60))
+        array = MgrsArray.fromWgs(latitudes.ravel(), longitudes.ravel(), 3)[0]
+        lat, lon = array.centres()
+
+        def meanStep(indices):
+            return np.hypot(np.diff(lat[indices]), np.diff(lon[indices])).mean()
+
+        self.assertLess(meanStep(ordering.sortByCurve(array)[1]), meanStep(array.argsort()))
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    paralleltest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import parallel
+
+
+class ParallelTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = parallel.BatchPool(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def testToMgrs(self):
+        latitudes = np.linspace(-89.0, 89.0, 500)
+        longitudes = np.linspace(-179.0, 179.0, 500)
+        result, status = self.pool.toMgrs(latitudes, longitudes, 4)
+        expected, expectedStatus = batch.toMgrsBatch(latitudes, longitudes, 4)
+        self.assertEqual(list(result.astype('U15')), list(expected))
+        self.assertEqual(list(status), list(expectedStatus))
+
+        result, status = self.pool.toMgrs([42.0, 95.0], [-93.0, -93.0])
+        self.assertEqual(list(result), [b'15TVG0000049776', b''])
+        self.assertEqual(list(status), [mgrs.STATUS_OK, mgrs.STATUS_LATITUDE_RANGE])
+
+    def testPrecisionArray(self):
+        latitudes = np.linspace(-79.0, 83.0, 300)
+        longitudes = np.linspace(-179.0, 179.0, 300)
+        precision = np.arange(300) % 6
+        result, status = self.pool.toMgrs(latitudes, longitudes, precision)
+        expected, expectedStatus = batch.toMgrsBatch(latitudes, longitudes, precision)
+        self.assertEqual(list(result.astype('U15')), list(expected))
+        self.assertEqual(list(status), list(expectedStatus))
+
+    def testReusedBlock(self):
+        # smaller batches reuse the block, larger ones replace it
+        for count in [100, 50, 1000, 10]:
+            latitudes = np.linspace(-79.0, 83.0, count)
+            result, status = self.pool.toMgrs(latitudes, 15.0, 2)
+            self.assertEqual(list(result.astype('U15')), list(batch.toMgrsBatch(latitudes, 15.0, 2)[0]))
+            if count == 50:
+                name = self.pool._block.name
+        self.assertNotEqual(self.pool._block.name, name)
+
+    def testToWgs(self):
+        strings = ['15TVG0000049776', '  YYL4939146492', '15TIG', None]
+        latitudes, longitudes, status = self.pool.toWgs(strings)
+        expectedLatitudes, expectedLongitudes, expectedStatus = batch.toWgsBatch(strings)
+        np.testing.assert_allclose(latitudes, expectedLatitudes)
+        np.testing.assert_allclose(longitudes, expectedLongitudes)
+        self.assertEqual(list(status), list(expectedStatus))
+
+    def testClosedPool(self):
+        pool = parallel.BatchPool(1)
+        pool.close()
+        with self.assertRaises(ValueError):
+            pool.toMgrs([42.0], [-93.0])
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    partitiontest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import batch
+from mgrspy import partition
+
+
+class PartitionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def points(self):
+        rng = np.random.RandomState(7)
+        latitudes = np.concatenate((rng.uniform(38, 40, 3000), rng.uniform(-85, 85, 1000), [91, np.nan]))
+        longitudes = np.concatenate((rng.uniform(-80, -74, 3000), rng.uniform(-180, 180, 1000), [0, 0]))
+        return latitudes, longitudes
+
+    def testPartitions(self):
+        latitudes, longitudes = self.points()
+        chunks = [(latitudes[i:i + 500], longitudes[i:i + 500]) for i in range(0, len(latitudes), 500)]
+        paths, sizes = partition.partitionPoints(chunks, self.directory, bufferSize=300)
+
+        self.assertEqual(sum(sizes.values()), len(latitudes))
+        self.assertEqual(sizes[partition.INVALID_PARTITION], 2)
+        self.assertEqual(set(paths), set(sizes))
+
+        for name, path in paths.items():
+            points = partition.readPartition(path)
+            self.assertEqual(len(points), sizes[name])
+            self.assertTrue((np.diff(points['row'].astype(np.int64)) > 0).all())
+            if name != partition.INVALID_PARTITION:
+                strings = batch.toMgrsBatch(points['latitude'], points['longitude'], 0)[0]
+                self.assertTrue(all(s.lstrip().startswith(name) for s in strings))
+
+    def testMerge(self):
+        latitudes, longitudes = self.points()
+        with partition.GzdPartitioner(self.directory, 1000) as partitioner:
+            partitioner.add(latitudes[:2000], longitudes[:2000])
+            partitioner.add(latitudes[2000:], longitudes[2000:])
+
+        converted = [partition.convertPartition(p, 3, chunkSize=100) for p in partitioner.partitions().values()]
+        strings, status = partition.mergePartitions(converted, partitioner.count,
+                                                    os.path.join(self.directory, 'merged'))
+        expected, expectedStatus = batch.toMgrsBatch(latitudes, longitudes, 3)
+        self.assertEqual([s.decode() for s in strings], expected.tolist())
+        self.assertEqual(status.tolist(), expectedStatus.tolist())
+
+        strings, status = partition.mergePartitions(converted[:1], partitioner.count)
+        missing = partitioner.count - len(partition.readPartition(converted[0]))
+        self.assertEqual((status == mgrs.STATUS_MALFORMED).sum(), missing)
+
+    def testOverwrite(self):
+        for i in range(2):
+            paths, sizes = partition.partitionPoints([([38.9], [-77.1])], self.directory)
+        self.assertEqual(len(partition.readPartition(paths['18S'])), 1)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    profilingtest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+from mgrspy import mgrs
+from mgrspy import profiling
+
+
+class ProfilingTest(unittest.TestCase):
+
+    def setUp(self):
+        profiling.reset()
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+
+    def testDisabledByDefault(self):
+        self.assertFalse(profiling.isEnabled())
+        mgrs.toMgrs(42.0, -93.0)
+        self.assertEqual(profiling.snapshot(), {'stages': {}, 'systems': {}, 'zones': {}})
+
+    def testCounters(self):
+        profiling.enable()
+        self.assertTrue(profiling.isEnabled())
+
+        mgrs.toMgrs(42.0, -93.0)
+        mgrs.toMgrs(38.9072, -77.0369)
+        mgrs.toMgrs(86.598, -156.507)
+        mgrs.toWgs('15TVG0000049776')
+
+        stats = profiling.snapshot()
+        self.assertEqual(stats['stages']['transformation']['calls'], 4)
+        self.assertEqual(stats['stages']['transformPoint']['calls'], 4)
+        self.assertEqual(stats['stages']['mgrsString']['calls'], 3)
+        self.assertEqual(stats['stages']['breakMgrsString']['calls'], 1)
+        self.assertGreaterEqual(stats['stages']['transformPoint']['seconds'], 0.0)
+        self.assertEqual(stats['systems'], {'UTM': 3, 'UPS': 1})
+        self.assertEqual(stats['zones'], {15: 2, 18: 1})
+
+    def testDisableAndReset(self):
+        profiling.enable()
+        mgrs.toMgrs(42.0, -93.0)
+        profiling.disable()
+        self.assertFalse(profiling.isEnabled())
+
+        mgrs.toMgrs(42.0, -93.0)
+        self.assertEqual(profiling.snapshot()['systems'], {'UTM': 1})
+
+        profiling.reset()
+        self.assertEqual(profiling.snapshot()['zones'], {})
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    proximitytest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import proximity
+from mgrspy.mgrsarray import MgrsArray
+
+
+class ProximityTest(unittest.TestCase):
+
+    def testSameZone(self):
+        self.assertEqual(proximity.distance('18SUJ2338308450', '18SUJ2338408450'), 1.0)
+        self.assertEqual(proximity.distance('18SUJ2338308450', '18SUJ2338308450'), 0.0)
+        self.assertEqual(proximity.distance('18SUJ2308', '18SUJ2309'), 1000.0)
+        # across equator
+        self.assertEqual(proximity.distance('33MUN1000', '33NUA1000'), 800000.0)
+        self.assertEqual(list(proximity.distance('18SUJ2338308450', ['18SUJ2338308453', '18SUJ2338708453'])),
+                         [3.0, 5.0])
+
+    def testOtherZone(self):
+        # 41.3 km geodesic distance across 31/32 zones boundary
+        self.assertAlmostEqual(proximity.distance('31UGQ0000000000', '32ULV0000000000'), 41300, -2)
+        self.assertAlmostEqual(proximity.distance('32ULV0000000000', '31UGQ0000000000'), 41300, -2)
+        with self.assertRaises(mgrs.MgrsException):
+            proximity.distance('18SUJ2338308450', '18SIJ')
+
+    def testWithinRadius(self):
+        latitudes, longitudes = np.meshgrid(np.linspace(41.5, 42.5, 30), np.linspace(3.5, 8.5, 30))
+        array = MgrsArray.fromWgs(latitudes.ravel(), longitudes.ravel())[0]
+        reference = '31TGG0000000000'
+        result = proximity.withinRadius(reference, array, 60000)
+        distances = proximity.distance(reference, array)
+        self.assertEqual(list(result), list(distances <= 60000))
+        self.assertTrue(result[array.zone == 31].any())
+        self.assertTrue(result[array.zone == 32].any())
+        self.assertFalse(result.all())
+
+        self.assertEqual(list(proximity.withinRadius(reference, array.keys(), 60000)), list(result))
+        self.assertEqual(list(proximity.withinRadius(reference, array.toStrings(), 60000)), list(result))
+        self.assertEqual(list(proximity.withinRadius(reference, ['31TGG0000100001', '31TGG', '31TIG'], 2)),
+                         [True, True, False])
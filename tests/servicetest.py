@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    servicetest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import json
+import threading
+import unittest
+from concurrent import futures
+from http.client import HTTPConnection
+
+from mgrspy import mgrs
+from mgrspy import service
+
+
+class ServiceTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = service.MgrsService(port=0, workers=2)
+        cls.service.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.stop()
+
+    def setUp(self):
+        self.connection = HTTPConnection(*self.service.address)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def request(self, method, path, data=None):
+        body = json.dumps(data) if data is not None else None
+        self.connection.request(method, path, body, {'Content-Type': 'application/json'})
+        response = self.connection.getresponse()
+        return response.status, json.loads(response.read().decode('utf-8'))
+
+    def testSingle(self):
+        code, response = self.request('POST', '/mgrs', {'latitude': 42.0, 'longitude': -93.0, 'precision': 3})
+        self.assertEqual(code, 200)
+        self.assertEqual(response['mgrs'], '15TVG000497')
+
+        # same keep-alive connection
+        code, response = self.request('POST', '/wgs', {'mgrs': '15TVG0000049776'})
+        self.assertEqual(code, 200)
+        self.assertAlmostEqual(response['latitude'], 41.99364855788585)
+        self.assertAlmostEqual(response['longitude'], -94.20734290469866)
+
+        code, response = self.request('POST', '/mgrs', {'latitude': 95.0, 'longitude': -93.0})
+        self.assertEqual(code, 422)
+        self.assertEqual(response['status'], mgrs.STATUS_LATITUDE_RANGE)
+
+        code, response = self.request('POST', '/mgrs', {'latitude': 'north'})
+        self.assertEqual(code, 400)
+
+    def testBatch(self):
+        code, response = self.request('POST', '/mgrs/batch', {'latitudes': [42.0, 95.0], 'longitudes': [-93.0, 0.0]})
+        self.assertEqual(code, 200)
+        self.assertEqual(response['mgrs'], ['15TVG0000049776', ''])
+        self.assertEqual(response['status'], [mgrs.STATUS_OK, mgrs.STATUS_LATITUDE_RANGE])
+
+        code, response = self.request('POST', '/wgs/batch', {'mgrs': ['15TVG0000049776', '15TIG']})
+        self.assertEqual(code, 200)
+        self.assertAlmostEqual(response['latitudes'][0], 41.99364855788585)
+        self.assertIsNone(response['latitudes'][1])
+        self.assertEqual(response['status'], [mgrs.STATUS_OK, mgrs.STATUS_INVALID_LETTER])
+
+    def testMetricsRoutes(self):
+        for path in ['/unknown?a=1', '/unknown?a=2', '/mgrs?x=1']:
+            code, response = self.request('POST', path, {'latitude': 42.0, 'longitude': -93.0})
+            self.assertEqual(code, 404)
+
+        code, metrics = self.request('GET', '/metrics')
+        self.assertGreaterEqual(metrics['requests']['other'], 3)
+        self.assertTrue(set(metrics['requests']) <= set(['/mgrs', '/wgs', '/mgrs/batch', '/wgs/batch', '/metrics',
+                                                         'other']))
+
+    def testContentLength(self):
+        for length, expected in [('-1', 400), ('abc', 400), (str(self.service.maxBodySize + 1), 413)]:
+            connection = HTTPConnection(*self.service.address)
+            connection.putrequest('POST', '/mgrs')
+            connection.putheader('Content-Length', length)
+            connection.endheaders()
+            response = connection.getresponse()
+            self.assertEqual(response.status, expected)
+            response.read()
+            connection.close()
+
+    def testCoalescing(self):
+        results = {}
+
+        def worker(i):
+            connection = HTTPConnection(*self.service.address)
+            connection.request('POST', '/mgrs', json.dumps({'latitude': 42.0, 'longitude': -93.0 + i * 0.001}))
+            results[i] = json.loads(connection.getresponse().read().decode('utf-8'))['mgrs']
+            connection.close()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i in range(20):
+            self.assertEqual(results[i], mgrs.toMgrs(42.0, -93.0 + i * 0.001))
+
+        code, metrics = self.request('GET', '/metrics')
+        self.assertEqual(code, 200)
+        self.assertGreaterEqual(metrics['coalescedRows'], 20)
+        self.assertGreaterEqual(metrics['requests']['/mgrs'], 20)
+
+    def testMalformedCoalesced(self):
+        requests = [('/wgs', {'mgrs': ['15TVG0000049776']}), ('/mgrs', {'latitude': [42.0], 'longitude': -93.0}),
+                    ('/wgs', {'mgrs': 12})]
+        requests += [('/wgs', {'mgrs': '15TVG0000049776'}), ('/mgrs', {'latitude': 42.0, 'longitude': -93.0})] * 8
+        results = {}
+
+        def worker(i):
+            connection = HTTPConnection(*self.service.address)
+            connection.request('POST', requests[i][0], json.dumps(requests[i][1]))
+            response = connection.getresponse()
+            results[i] = response.status, json.loads(response.read().decode('utf-8'))
+            connection.close()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(requests))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i in range(3):
+            self.assertEqual(results[i][0], 400)
+        for i in range(3, len(requests)):
+            self.assertEqual(results[i][0], 200)
+            if requests[i][0] == '/mgrs':
+                self.assertEqual(results[i][1]['mgrs'], '15TVG0000049776')
+            else:
+                self.assertAlmostEqual(results[i][1]['latitude'], 41.99364855788585)
+
+    def testConvertCoalescedPerItem(self):
+        items = [('wgs', value, futures.Future()) for value in ['15TVG0000049776', ['15TVG0000049776'], '15TIG']]
+        self.service._convertCoalesced('wgs', items)
+        self.assertEqual(items[0][2].result()[2], mgrs.STATUS_OK)
+        self.assertIsNotNone(items[1][2].exception())
+        self.assertEqual(items[2][2].result()[2], mgrs.STATUS_INVALID_LETTER)
+
+    def testUnknownEndpoint(self):
+        code, response = self.request('GET', '/unknown')
+        self.assertEqual(code, 404)
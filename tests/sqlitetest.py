@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    sqlitetest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import json
+import sqlite3
+import unittest
+
+from mgrspy import mgrs
+from mgrspy import sqlite
+
+
+class SqliteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.functions = sqlite.registerFunctions(self.connection)
+        self.connection.execute('CREATE TABLE points (latitude REAL, longitude REAL)')
+        self.points = [(42.0, -93.0), (38.9, -77.1), (38.91, -77.11), (86.598, -156.507), (91.0, 0.0), (None, 1.0)]
+        self.connection.executemany('INSERT INTO points VALUES (?, ?)', self.points)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def query(self, sql, *args):
+        return self.connection.execute(sql, args).fetchall()
+
+    def testFromLatLon(self):
+        rows = self.query('SELECT mgrs_from_latlon(latitude, longitude), mgrs_from_latlon(latitude, longitude, 2) '
+                          'FROM points')
+        for (full, coarse), (latitude, longitude) in zip(rows, self.points):
+            if latitude is None or latitude > 90:
+                self.assertEqual((full, coarse), (None, None))
+            else:
+                self.assertEqual(full, mgrs.toMgrs(latitude, longitude))
+                self.assertEqual(coarse, mgrs.toMgrs(latitude, longitude, 2))
+
+        self.assertEqual(self.query('SELECT mgrs_from_latlon(0, 0, 6), mgrs_from_latlon(0, 0, 1.5)'), [(None, None)])
+
+    def testToWgs(self):
+        latitude, longitude = mgrs.toWgs('18SUJ2338308450')
+        self.assertEqual(self.query('SELECT mgrs_to_lat(?), mgrs_to_lon(?)', '18SUJ2338308450', '18SUJ2338308450'),
+                         [(latitude, longitude)])
+        self.assertEqual(self.query('SELECT mgrs_to_lat(?), mgrs_to_lon(NULL)', '18SIJ'), [(None, None)])
+        self.assertEqual(self.functions.cacheInfo()['toWgs'].hits, 1)
+
+    def testParent(self):
+        self.assertEqual(self.query('SELECT mgrs_parent(?, 2), mgrs_parent(?, 0), mgrs_parent(?, 1)',
+                                    '18SUJ2338308450', '18suj2338308450', '  YYL4939146492'),
+                         [('18SUJ2308', '18SUJ', '  YYL44')])
+        self.assertEqual(self.query('SELECT mgrs_parent(?, 3), mgrs_parent(?, 1)', '18SUJ23', '18SIJ23'),
+                         [(None, None)])
+
+    def testValid(self):
+        self.assertEqual(self.query('SELECT mgrs_valid(?), mgrs_valid(?), mgrs_valid(?), mgrs_valid(5)',
+                                    '18SUJ2338308450', '18SIJ', 'YYL4939146492'), [(1, 0, 1, 0)])
+
+    def testCellCounts(self):
+        counts = json.loads(self.query('SELECT mgrs_cell_counts(latitude, longitude, 0) FROM points')[0][0])
+        self.assertEqual(counts, {'15TVG': 1, '18SUJ': 2, '  YYL': 1})
+
+    def testConnectionCaches(self):
+        other = sqlite3.connect(':memory:')
+        functions = sqlite.registerFunctions(other, 16)
+        other.execute('SELECT mgrs_from_latlon(42.0, -93.0)').fetchall()
+        other.execute('SELECT mgrs_from_latlon(42.0, -93.0)').fetchall()
+        self.assertEqual(functions.cacheInfo()['fromLatLon'].hits, 1)
+        self.assertEqual(self.functions.cacheInfo()['fromLatLon'].hits, 0)
+        other.close()
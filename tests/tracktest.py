@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    tracktest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import track
+from mgrspy import profiling
+
+
+class TrackTest(unittest.TestCase):
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+
+    def testTransitions(self):
+        # track crossing zone 17/18 boundary and S/T latitude bands
+        latitudes = np.linspace(39.98, 40.02, 400)
+        longitudes = np.linspace(-78.03, -77.97, 400)
+        encoder = track.TrackEncoder(3)
+        transitions = []
+        for i in range(len(latitudes)):
+            transition = encoder.update(latitudes[i], longitudes[i], i)
+            if transition is not None:
+                transitions.append(transition)
+
+            self.assertEqual(encoder.mgrs, mgrs.toMgrs(latitudes[i], longitudes[i], 3))
+
+        expected = []
+        for i in range(len(latitudes)):
+            cell = mgrs.toMgrs(latitudes[i], longitudes[i], 3)
+            if not expected or expected[-1][0] != cell:
+                expected.append((cell, i))
+
+        self.assertEqual(transitions, expected)
+        self.assertTrue(any(t[0].startswith('17S') for t in transitions))
+        self.assertTrue(any(t[0].startswith('18T') for t in transitions))
+
+    def testSkipsReprojection(self):
+        encoder = track.TrackEncoder(2)
+        profiling.enable()
+        profiling.reset()
+        self.assertEqual(encoder.update(42.005, -92.995, 0), ('15TWG0050', 0))
+        for i in range(1, 100):
+            self.assertIsNone(encoder.update(42.005 + i * 1e-6, -92.995 + i * 1e-6, i))
+
+        self.assertEqual(profiling.snapshot()['stages']['transformPoint']['calls'], 1)
+        self.assertEqual(encoder.timestamp, 0)
+
+        encoder.reset()
+        self.assertEqual(encoder.update(42.005, -92.995, 100), ('15TWG0050', 100))
+
+    def testEncodeTracks(self):
+        positions = [('a', 0, 42.005, -92.995), ('b', 0, 38.9072, -77.0369), ('a', 1, 42.005, -92.995),
+                     ('a', 2, 42.015, -92.995), ('b', 1, 38.9072, -77.0369)]
+        self.assertEqual(list(track.encodeTracks(positions, 2)),
+                         [('a', '15TWG0050', 0), ('b', '18SUJ2308', 0), ('a', '15TWG0051', 2)])
+
+    def testErrors(self):
+        with self.assertRaises(mgrs.MgrsException):
+            track.TrackEncoder(6)
+        with self.assertRaises(mgrs.MgrsException):
+            track.TrackEncoder().update(91.0, 0.0)
+        with self.assertRaises(AttributeError):
+            track.TrackEncoder().trackId = 1
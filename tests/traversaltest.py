@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    traversaltest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import traversal
+
+
+class TraversalTest(unittest.TestCase):
+
+    def _point(self, latitudes, longitudes, fraction):
+        i = min(int(fraction), len(latitudes) - 2)
+        t = fraction - i
+        dlon = (longitudes[i + 1] - longitudes[i] + 180) % 360 - 180
+        longitude = (longitudes[i] + t * dlon + 180) % 360 - 180
+        return latitudes[i] + t * (latitudes[i + 1] - latitudes[i]), longitude
+
+    def _checkLine(self, latitudes, longitudes, precision):
+        cells, entries, exits = traversal.traverseLine(latitudes, longitudes, precision)
+        self.assertEqual(entries[0], 0)
+        self.assertEqual(exits[-1], len(latitudes) - 1)
+        np.testing.assert_array_equal(entries[1:], exits[:-1])
+        self.assertTrue((cells[1:] != cells[:-1]).all())
+
+        for cell, entry, exit in zip(cells, entries, exits):
+            if exit - entry > 1e-6:
+                latitude, longitude = self._point(latitudes, longitudes, (entry + exit) / 2)
+                self.assertEqual(mgrs.toMgrs(latitude, longitude, precision), cell)
+
+        found = set(cells)
+        for fraction in np.linspace(0, len(latitudes) - 1, 500):
+            latitude, longitude = self._point(latitudes, longitudes, fraction)
+            self.assertIn(mgrs.toMgrs(latitude, longitude, precision), found)
+
+        return cells, entries, exits
+
+    def testTraverseLine(self):
+        self._checkLine([38.0, 38.3, 38.1], [-77.2, -76.7, -77.0], 2)
+        cells, entries, exits = self._checkLine([40.0, 40.0], [-78.1, -77.9], 2)
+        self.assertEqual(len(cells), 22)
+
+    def testCornerCut(self):
+        # diagonal passing just beside the corner of four cells crosses one
+        # of the side cells for a few meters only
+        latitude, longitude = mgrs.toWgs('18SUJ2300006000')
+        latitudes = [latitude - 0.002, latitude + 0.002]
+        longitudes = [longitude - 0.00245, longitude + 0.00255]
+        cells, entries, exits = self._checkLine(latitudes, longitudes, 2)
+        self.assertEqual(cells.tolist(), ['18SUJ2205', '18SUJ2305', '18SUJ2306'])
+        self.assertLess(exits[1] - entries[1], 0.05)
+
+    def testZoneAndBandCrossings(self):
+        self._checkLine([55.0, 65.0], [2.0, 13.0], 0)
+        self._checkLine([71.0, 73.0], [8.0, 9.5], 1)
+        self._checkLine([-0.01, 0.01], [2.99, 3.01], 4)
+        cells, entries, exits = self._checkLine([-79.0, -81.0, -79.5], [179.5, -179.5, -179.0], 1)
+        self.assertEqual({c[:3].strip() for c in cells}, {'60C', '01C', 'A'})
+        cells, entries, exits = self._checkLine([83.0, 86.0, 89.0], [10.0, 11.0, -170.0], 0)
+        self.assertEqual({c[:3].strip() for c in cells}, {'33X', 'Z', 'Y'})
+
+    def testSinglePoint(self):
+        cells, entries, exits = traversal.traverseLine([38.9], [-77.0], 3)
+        self.assertEqual(cells.tolist(), [mgrs.toMgrs(38.9, -77.0, 3)])
+        self.assertEqual(entries.tolist(), [0])
+        self.assertEqual(exits.tolist(), [0])
+
+        cells, entries, exits = traversal.traverseLine([38.9, 38.9, 38.9], [-77.0, -77.0, -77.0], 3)
+        self.assertEqual(len(cells), 1)
+        self.assertEqual(exits.tolist(), [2])
+
+    def testTraverseTracks(self):
+        tracks = [('a', [38.0, 38.3, 38.1], [-77.2, -76.7, -77.0]),
+                  ('b', [1.0], [2.0]),
+                  ('c', [], []),
+                  ('d', [-33.9, -34.1], [18.4, 18.6])]
+        result = traversal.traverseTracks(tracks, 3)
+        self.assertEqual([r[0] for r in result], ['a', 'b', 'c', 'd'])
+        for (trackId, latitudes, longitudes), (i, cells, entries, exits) in zip(tracks, result):
+            if not latitudes:
+                self.assertEqual(len(cells), 0)
+                continue
+            expected = traversal.traverseLine(latitudes, longitudes, 3)
+            np.testing.assert_array_equal(cells, expected[0])
+            np.testing.assert_array_equal(entries, expected[1])
+            np.testing.assert_array_equal(exits, expected[2])
+
+    def testInvalid(self):
+        self.assertRaises(mgrs.MgrsException, traversal.traverseLine, [91.0, 0.0], [0.0, 0.0])
+        self.assertRaises(mgrs.MgrsException, traversal.traverseLine, [0.0, 0.0], [0.0, 400.0])
+        self.assertRaises(mgrs.MgrsException, traversal.traverseLine, [0.0, 0.0], [0.0, 1.0], 6)
+        self.assertRaises(ValueError, traversal.traverseLine, [0.0, 0.0], [0.0])
@@ -171,3 +171,9 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(easting, 49512.0)
         self.assertEqual(northing, 49156.0)
         self.assertEqual(precision, 5)
+
+
+    def testCachedTransformation(self):
+        ct = mgrs._cachedTransformation(4326, 32615)
+        self.assertIs(mgrs._cachedTransformation(4326, 32615), ct)
+        self.assertIsNot(mgrs._cachedTransformation(32615, 4326), ct)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    validationtest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import mmap
+import tempfile
+import unittest
+
+from mgrspy import mgrs
+from mgrspy import validation
+
+
+class ValidationTest(unittest.TestCase):
+
+    def testValidStrings(self):
+        strings = ['15TVG0000049776', '15TVG000497', '15TVG', '  YYL4939146492', '    YYL4939146492',
+                   'YYL4939146492', 'BAN0000000000', '18suj2338308450', ' 18SUJ2338308450\n']
+        self.assertEqual(list(validation.validateMgrs(strings)), [mgrs.STATUS_OK] * len(strings))
+
+    def testInvalidStrings(self):
+        strings = ['181SUJ2338308450', '18SUJ2338308', '18SUJ233830845012', '18SU2338308450',
+                   '18SUJ 2338308450', '', None, '18SIJ2338308450', '18SUZ', 'YDA', 'ZAQ',
+                   '00SUJ', '61SUJ', '32XMA', '  CYN', '18AUJ']
+        self.assertEqual(list(validation.validateMgrs(strings)),
+                         [mgrs.STATUS_MALFORMED] * 7 +
+                         [mgrs.STATUS_INVALID_LETTER] * 4 +
+                         [mgrs.STATUS_INVALID_ZONE_BAND] * 5)
+
+    def testMatchesBreakMgrsString(self):
+        for s in ['18SUJ2338308450', '18SUJ233084', '18SUJ', '  YYB4951249156', 'YYB4951249156', '5qkb42']:
+            status, zone, letters, easting, northing, precision, digits = validation._parse(validation._codes([s])[0])
+            self.assertEqual(status[0], mgrs.STATUS_OK)
+            self.assertEqual((zone[0], list(letters[0]), easting[0], northing[0], precision[0]),
+                             mgrs._breakMgrsString(s))
+
+    def testCanonicalize(self):
+        result, status = validation.canonicalizeMgrs(['18suj2338308450', '5QKB42', 'YYB4951249156',
+                                                      '    yyb495491', '18SIJ'])
+        self.assertEqual(list(result), ['18SUJ2338308450', '05QKB42', '  YYB4951249156', '  YYB495491', ''])
+        self.assertEqual(list(status), [mgrs.STATUS_OK] * 4 + [mgrs.STATUS_INVALID_LETTER])
+
+    def testBytesInput(self):
+        self.assertEqual(list(validation.validateMgrs([b'18SUJ2338308450', b'18SIJ'])),
+                         [mgrs.STATUS_OK, mgrs.STATUS_INVALID_LETTER])
+
+    def testParseBuffer(self):
+        strings = ['18SUJ2338308450', '  YYL4939146492', '5qkb42\r', '', '18SIJ', '18SUJ23383084501234',
+                   '  15TVG']
+        expected = validation._parse(validation._codes(strings)[0])
+        data = '\n'.join(strings).encode('ascii') + b'\n'
+        for buffer in [data, bytearray(data), memoryview(data), data.replace(b'\n', b'\x00')]:
+            result = validation.parseBuffer(buffer)
+            self.assertEqual(len(result[0]), len(strings))
+            self.assertEqual(list(result[0]), list(expected[0]))
+            valid = result[0] == mgrs.STATUS_OK
+            for a, b in zip(result[1:], expected[1:6]):
+                self.assertEqual(a[valid].tolist(), b[valid].tolist())
+
+        status = validation.parseBuffer(b'18SUJ23;;5QKB42', b';')[0]
+        self.assertEqual(list(status), [mgrs.STATUS_OK, mgrs.STATUS_MALFORMED, mgrs.STATUS_OK])
+        self.assertEqual(len(validation.parseBuffer(b'')[0]), 0)
+        data = b'18SUJ2338308450 garbage\n18SUJ2338308450\n  YYL4939146492 1 \n'
+        for chunkSize in [1, 2, 100]:
+            status = validation.parseBuffer(data, chunkSize=chunkSize)[0]
+            self.assertEqual(list(status), [mgrs.STATUS_MALFORMED, mgrs.STATUS_OK, mgrs.STATUS_MALFORMED])
+        with self.assertRaises(ValueError):
+            validation.parseBuffer(data, '\n')
+
+    def testParseMmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b'18SUJ2338308450\n  YYL4939146492\n' * 1000)
+            f.flush()
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            status, zone, letters, easting, northing, precision = validation.parseBuffer(buffer, chunkSize=100)
+            self.assertEqual(len(status), 2000)
+            self.assertTrue((status == mgrs.STATUS_OK).all())
+            self.assertEqual(zone[:4].tolist(), [18, 0, 18, 0])
+            self.assertEqual(easting[-1], 49391)
+            del status, zone, letters, easting, northing, precision
+            buffer.close()
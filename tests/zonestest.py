@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    zonestest.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2016 Boundless, http://boundlessgeo.com
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = 'Alexander Bruy'
+__date__ = 'October 2026'
+__copyright__ = '(C) 2016 Boundless, http://boundlessgeo.com'
+
+# This will get replaced with a git SHA1 when you do a git archive
+
+__revision__ = '$Format:%H$'
+
+import unittest
+
+import numpy as np
+
+from mgrspy import mgrs
+from mgrspy import zones
+
+
+class ZonesTest(unittest.TestCase):
+
+    def testClassifyZones(self):
+        rng = np.random.RandomState(42)
+        latitudes = np.concatenate((rng.uniform(-90, 90, 2000), rng.uniform(55, 85, 2000),
+                                    np.arange(-90, 91, 4.0)))
+        longitudes = np.concatenate((rng.uniform(-180, 360, 2000), rng.uniform(-1, 45, 2000),
+                                     np.arange(-180, 181, 8.0)))
+        zone, band, north, epsg = zones.classifyZones(latitudes, longitudes)
+        for i in range(len(latitudes)):
+            hemisphere, z, e = mgrs._epsgForWgs(latitudes[i], longitudes[i])
+            self.assertEqual(epsg[i], e)
+            self.assertEqual(north[i], hemisphere == 'N')
+            self.assertEqual(zone[i], 0 if z == 61 else z)
+
+    def testSpecialZones(self):
+        zone, band, north, epsg = zones.classifyZones([60, 60, 75, 75, 75, 75], [2, 4, 8, 10, 30, 40])
+        self.assertEqual(zone.tolist(), [31, 32, 31, 33, 35, 37])
+        self.assertEqual(band.tolist(), [mgrs.ALPHABET['V']] * 2 + [mgrs.ALPHABET['X']] * 4)
+
+    def testBands(self):
+        latitudes = [38.9, -33.5, 0, -85, -85, 88, 88, 90]
+        longitudes = [-77.1, 18.4, 0, -10, 10, -10, 10, -10]
+        zone, band, north, epsg = zones.classifyZones(latitudes, longitudes)
+        self.assertEqual(''.join(chr(ord('A') + b) for b in band), 'SHNABYZZ')
+        self.assertEqual(epsg.tolist(), [32618, 32734, 32631, 32761, 32761, 32661, 32661, 32661])
+
+    def testInvalid(self):
+        zone, band, north, epsg = zones.classifyZones([91, np.nan, 0], [0, 0, 400])
+        self.assertTrue((band == zones.INVALID).all())
+        self.assertTrue((epsg == 0).all())
+
+    def testHistogram(self):
+        latitudes = [38.9, 38.5, -33.5, 88, 91]
+        longitudes = [-77.1, -76.0, 18.4, 10, 0]
+        self.assertEqual(zones.zoneHistogram(latitudes, longitudes), {32618: 2, 32734: 1, 32661: 1})
+        self.assertEqual(zones.zoneHistogram(latitudes, longitudes, 'zone'), {18: 2, 34: 1, 0: 1})
+        self.assertEqual(zones.zoneHistogram(latitudes, longitudes, 'gzd'), {'18S': 2, '34H': 1, 'Z': 1})
+        with self.assertRaises(ValueError):
+            zones.zoneHistogram(latitudes, longitudes, 'band')